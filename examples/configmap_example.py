@@ -8,8 +8,13 @@ This example demonstrates the improved architecture where:
 3. Automatic namespace detection works when running in Kubernetes
 """
 
+import sys
+
 from kstack_lib.config import ConfigMap, KStackLayer
 
+# Block-buffer stdout so the many status lines don't each cost a write() syscall
+sys.stdout.reconfigure(line_buffering=False)
+
 # Example 1: Explicit layer (use when running locally)
 print("=== Example 1: Explicit Layer ===")
 cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA)
@@ -43,12 +48,15 @@ for layer in KStackLayer:
 print("\n=== Example 4: Read ConfigMap values ===")
 cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA)
 
+# Read both ConfigMaps with a single kubectl call
+cm_map = cfg.get_values(["kstack-route", "localstack-proxy-config"])
+
 # Get active route from ConfigMap
-route_value = cfg.get_value("kstack-route", "active-route")
+route_value = cm_map["kstack-route"].get("active-route")
 print(f"Route from ConfigMap: {route_value or 'not set'}")
 
 # Get LocalStack proxy config
-localstack_instance = cfg.get_value("localstack-proxy-config", "active-instance")
+localstack_instance = cm_map["localstack-proxy-config"].get("active-instance")
 print(f"LocalStack instance: {localstack_instance}")
 
 # Example 5: Semantic layer naming
@@ -67,3 +75,4 @@ layer_from_num = KStackLayer.from_number(3)
 print(f"from_number(3): {layer_from_num.value}")
 
 print("\n✅ All examples completed!")
+sys.stdout.flush()
@@ -23,14 +23,73 @@ Usage:
 """
 
 import asyncio
+import hashlib
+import sys
+from dataclasses import dataclass
+from typing import Any
 
-import yaml
 from partsnap_rediscache import AsyncRedisCache
 from partsnap_rediscache.config import RedisConfig
 
+from kstack_lib.any._json import dumps, loads
+from kstack_lib.any._yaml import safe_load
 from kstack_lib.local.config.environment import LocalEnvironmentDetector
 
 
+@dataclass(slots=True, frozen=True)
+class RedisAccess:
+    """External (NodePort) address of a Redis instance."""
+
+    host: str = "192.168.49.2"  # Minikube IP
+    port: int = 31379
+
+    @classmethod
+    def from_env_config(cls, env_config: dict[str, Any], environment: str) -> "RedisAccess":
+        """Read external_access.redis.<environment> from an environment YAML."""
+        try:
+            entry = env_config["external_access"]["redis"][environment]
+        except (KeyError, TypeError):
+            return cls()
+        return cls(**entry)
+
+
+# Connected clients shared across calls, keyed by _client_key()
+_CLIENTS: dict[tuple[str, int, str | None, str], AsyncRedisCache] = {}
+_CLIENTS_LOCK = asyncio.Lock()
+
+
+def _client_key(config: RedisConfig) -> tuple[str, int, str | None, str]:
+    """Fingerprint a config: (host, port, username, password digest) - the password itself isn't kept."""
+    password_digest = hashlib.sha256((config.password or "").encode()).hexdigest()
+    return (config.host, config.port, config.username, password_digest)
+
+
+async def get_redis_client(config: RedisConfig) -> AsyncRedisCache:
+    """
+    Get a connected AsyncRedisCache for this config, reusing an existing one.
+
+    Repeated calls with the same host/port/credentials share one client (and its
+    connection pool) instead of opening a new connection each time; a different
+    password gets its own client rather than reusing another login's connection.
+    """
+    key = _client_key(config)
+    async with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = AsyncRedisCache(config)
+            await client.connect()
+            _CLIENTS[key] = client
+        return client
+
+
+async def close_redis_clients() -> None:
+    """Close every shared Redis client."""
+    async with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            await client.redis_client.aclose()
+        _CLIENTS.clear()
+
+
 async def main() -> None:
     """Demonstrate Redis operations using partsnap_rediscache."""
     print("=" * 80)
@@ -59,42 +118,38 @@ async def main() -> None:
     if not env_config_file.exists():
         print(f"   ⚠️  Environment config not found: {env_config_file}")
         print("   Using default configuration")
-        redis_host = "192.168.49.2"
-        redis_port = 31379
+        redis_access = RedisAccess()
     else:
         with open(env_config_file) as f:
-            env_config = yaml.safe_load(f)
+            env_config = safe_load(f)
 
-        redis_config = env_config.get("external_access", {}).get("redis", {}).get(environment, {})
-        redis_host = redis_config.get("host", "192.168.49.2")
-        redis_port = redis_config.get("port", 31379)
+        redis_access = RedisAccess.from_env_config(env_config, environment)
 
         print(f"   Loaded from: {env_config_file.name}")
 
     print("   Access method: NodePort (external)")
-    print(f"   Host: {redis_host} (Minikube IP)")
-    print(f"   Port: {redis_port} (redis-{environment}-external NodePort)")
+    print(f"   Host: {redis_access.host} (Minikube IP)")
+    print(f"   Port: {redis_access.port} (redis-{environment}-external NodePort)")
 
     # Step 3: Configure Redis connection
     print("\n🔌 Step 3: Configure Redis connection")
     config = RedisConfig(
-        host=redis_host,
-        port=redis_port,
+        host=redis_access.host,
+        port=redis_access.port,
         username="default",
         password="partsnap-dev",  # Default dev password
         expiry_days=7,  # Default expiry for cached values
     )
     print("   ✓ Redis config created")
 
-    # Step 4: Create Redis client
-    print("\n🔗 Step 4: Create Redis client")
-    redis_client = AsyncRedisCache(config)
-    print("   ✓ AsyncRedisCache client created")
-
     try:
-        # Step 5: Connect to Redis
+        # Step 4: Get (or reuse) a connected Redis client
+        print("\n🔗 Step 4: Get shared Redis client")
+        redis_client = await get_redis_client(config)
+        print("   ✓ AsyncRedisCache client ready")
+
+        # Step 5: Connection is established once and shared
         print("\n🤝 Step 5: Connect to Redis")
-        await redis_client.connect()
         print(f"   ✓ Connected to redis-{environment}")
 
         # Step 6: Test basic operations - PING
@@ -107,58 +162,59 @@ async def main() -> None:
         dbsize = await redis_client.redis_client.dbsize()
         print(f"   ✓ Database contains {dbsize} keys")
 
-        # Step 8: Set a value (using raw Redis commands)
+        # Steps 8-12 are queued on one pipeline and sent in a single round-trip
         test_key = "example:simple-key"
         test_value = "Hello from Redis!"
+
+        # Note: partsnap_rediscache uses RedisJSON module which requires redis-stack
+        # For basic Redis, we'll manually serialize to JSON
+        cache_key = "example:user:123"
+        user_data = {
+            "id": 123,
+            "name": "Test User",
+            "email": "test@example.com",
+            "preferences": {"theme": "dark", "notifications": True},
+        }
+        # Manually serialize to JSON (bytes, so redis-py skips the str encode)
+        json_data = dumps(user_data)
+
+        async with redis_client.redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(test_key, test_value)
+            pipe.get(test_key)
+            pipe.exists(test_key)
+            pipe.set(cache_key, json_data)
+            pipe.get(cache_key)
+            _, retrieved, exists, _, raw_data = await pipe.execute()
+
+        # Step 8: Set a value (using raw Redis commands)
         print("\n💾 Step 8: SET operation")
         print(f"   Key: {test_key}")
         print(f"   Value: {test_value}")
-        await redis_client.redis_client.set(test_key, test_value)
         print("   ✓ Value set successfully")
 
         # Step 9: Get a value
         print("\n📥 Step 9: GET operation")
-        retrieved = await redis_client.redis_client.get(test_key)
         print(f"   ✓ Retrieved value: {retrieved}")
 
         # Step 10: Check if key exists
         print("\n🔍 Step 10: Check key existence")
-        exists = await redis_client.key_exists(test_key)
-        print(f"   ✓ Key exists: {exists}")
+        print(f"   ✓ Key exists: {bool(exists)}")
 
         # Step 11: Store complex data as JSON string
-        # Note: partsnap_rediscache uses RedisJSON module which requires redis-stack
-        # For basic Redis, we'll manually serialize to JSON
-        import json
-
-        cache_key = "example:user:123"
-        user_data = {
-            "id": 123,
-            "name": "Test User",
-            "email": "test@example.com",
-            "preferences": {"theme": "dark", "notifications": True},
-        }
         print("\n💾 Step 11: Store complex data (JSON string)")
         print(f"   Key: {cache_key}")
         print(f"   Data: {user_data}")
-
-        # Manually serialize to JSON string
-        json_data = json.dumps(user_data)
-        await redis_client.redis_client.set(cache_key, json_data)
         print("   ✓ Data stored successfully")
 
         # Step 12: Retrieve and deserialize
         print("\n📥 Step 12: Retrieve and deserialize")
-        raw_data = await redis_client.redis_client.get(cache_key)
-        cached_data = json.loads(raw_data)
+        cached_data = loads(raw_data)
         print(f"   ✓ Retrieved data: {cached_data}")
 
-        # Step 13: Delete keys
+        # Step 13: Delete keys (one DEL for both)
         print("\n🗑️  Step 13: Cleanup")
-        await redis_client.redis_client.delete(test_key)
+        await redis_client.redis_client.delete(test_key, cache_key)
         print(f"   ✓ Deleted {test_key}")
-
-        await redis_client.redis_client.delete(cache_key)
         print(f"   ✓ Deleted {cache_key}")
 
         # Step 14: Final database size
@@ -170,6 +226,7 @@ async def main() -> None:
         print(f"\n❌ Error: {e}")
         import traceback
 
+        sys.stdout.flush()  # keep the error line ahead of the traceback on stderr
         traceback.print_exc()
         return
 
@@ -191,5 +248,26 @@ async def main() -> None:
     print("   kubectl scale statefulset redis-test -n layer-3-global-infra --replicas=1")
 
 
+async def run() -> None:
+    """Run the example and release shared Redis connections."""
+    try:
+        await main()
+    finally:
+        await close_redis_clients()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop when installed (uv add "kstack-lib[fast]"), default loop otherwise
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    # Block-buffer stdout so the many status lines don't each cost a write() syscall
+    sys.stdout.reconfigure(line_buffering=False)
+    try:
+        asyncio.run(run(), loop_factory=loop_factory)
+    finally:
+        sys.stdout.flush()
@@ -22,14 +22,15 @@ Usage:
     python examples/layer3/s3_operations.py
 """
 
-from io import BytesIO
+import asyncio
+import sys
 
 from kstack_lib.cal import CloudContainer
 from kstack_lib.config import ConfigMap, KStackLayer
 from kstack_lib.local.config.environment import LocalEnvironmentDetector
 
 
-def main() -> None:
+async def main() -> None:
     """Demonstrate S3 operations using CAL."""
     print("=" * 80)
     print("Cloud Abstraction Layer - S3 Operations Example")
@@ -64,7 +65,7 @@ def main() -> None:
     print("   Access: External via Traefik (localstack.dev.partsnap.local:31000)")
 
     try:
-        with CloudContainer(
+        async with CloudContainer(
             config=cfg, config_root=config_root, vault_root=vault_root, default_provider="localstack"
         ) as cloud:
             print("   ✓ CloudContainer created successfully")
@@ -91,20 +92,28 @@ def main() -> None:
             content = b"Hello from CAL! This is a test file."
             print(f"\n📤 Step 6: Upload object '{object_key}'")
             storage.upload_object(
-                bucket_name=bucket_name, object_key=object_key, file_obj=BytesIO(content), content_type="text/plain"
+                bucket_name=bucket_name, object_key=object_key, file_obj=content, content_type="text/plain"
             )
             print(f"   ✓ Uploaded {len(content)} bytes")
 
+            # Steps 7-9 don't depend on each other: run the (blocking) boto3 calls
+            # concurrently on worker threads sharing the provider's client pool
+            objects, downloaded, url = await asyncio.gather(
+                asyncio.to_thread(storage.list_objects, bucket_name=bucket_name),
+                asyncio.to_thread(storage.download_object, bucket_name=bucket_name, object_key=object_key),
+                asyncio.to_thread(
+                    storage.generate_presigned_url, bucket_name=bucket_name, object_key=object_key, expiration=3600
+                ),
+            )
+
             # Step 7: List objects in bucket
             print("\n📋 Step 7: List objects in bucket")
-            objects = storage.list_objects(bucket_name=bucket_name)
             print(f"   ✓ Found {len(objects)} objects:")
             for obj in objects:
                 print(f"     - {obj['Key']} ({obj.get('Size', 0)} bytes)")
 
             # Step 8: Download object
             print(f"\n📥 Step 8: Download object '{object_key}'")
-            downloaded = storage.download_object(bucket_name=bucket_name, object_key=object_key)
             if downloaded:
                 print(f"   ✓ Downloaded {len(downloaded)} bytes")
                 print(f"   Content: {downloaded.decode()}")
@@ -113,7 +122,6 @@ def main() -> None:
 
             # Step 9: Generate presigned URL
             print("\n🔗 Step 9: Generate presigned URL")
-            url = storage.generate_presigned_url(bucket_name=bucket_name, object_key=object_key, expiration=3600)
             print("   ✓ Presigned URL generated (valid for 1 hour)")
             print(f"   URL: {url[:80]}...")
 
@@ -135,6 +143,7 @@ def main() -> None:
         print(f"\n❌ Error: {e}")
         import traceback
 
+        sys.stdout.flush()  # keep the error line ahead of the traceback on stderr
         traceback.print_exc()
         return
 
@@ -144,4 +153,9 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    # Block-buffer stdout so the many status lines don't each cost a write() syscall
+    sys.stdout.reconfigure(line_buffering=False)
+    try:
+        asyncio.run(main())
+    finally:
+        sys.stdout.flush()
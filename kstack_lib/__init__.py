@@ -10,6 +10,10 @@ This library provides context-aware infrastructure components:
 Designed with a three-tier architecture (any/local/cluster) for maximum safety.
 """
 
+from typing import TYPE_CHECKING
+
+from kstack_lib.any._lazy import lazy_exports
+
 # ============================================================================
 # CORE EXPORTS (from any/)
 # ============================================================================
@@ -30,7 +34,15 @@ from kstack_lib.any.exceptions import (
 from kstack_lib.any.exceptions import (
     KStackServiceNotFoundError as ServiceNotFoundError,
 )
-from kstack_lib.any.utils import run_command
+
+if TYPE_CHECKING:
+    from kstack_lib.any.utils import run_command
+
+# Exports resolved on first access (PEP 562) so `import kstack_lib` stays cheap:
+# name -> module that defines it
+_LAZY_EXPORTS = {
+    "run_command": "kstack_lib.any.utils",
+}
 
 try:
     from kstack_lib._version import __version__
@@ -50,3 +62,6 @@ __all__ = [
     # Version
     "__version__",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -0,0 +1,61 @@
+"""
+JSON helpers (context-agnostic).
+
+Uses ``orjson`` when it is installed (``kstack-lib[fast]``) and falls back to
+the standard library ``json`` module otherwise. ``dumps`` always returns
+``bytes`` so callers can hand the result straight to Redis or a socket.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON.
+
+    Args:
+    ----
+        obj: JSON-serializable object
+
+    Returns:
+    -------
+        Encoded JSON document
+
+    Raises:
+    ------
+        TypeError: If the object is not JSON-serializable
+
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+    ----
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+    -------
+        Parsed Python object
+
+    Raises:
+    ------
+        json.JSONDecodeError: If the document is invalid (orjson's error subclasses it)
+
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
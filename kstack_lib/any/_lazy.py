@@ -0,0 +1,49 @@
+"""
+Lazy package exports (context-agnostic).
+
+Builds the PEP 562 ``__getattr__``/``__dir__`` pair the kstack_lib packages use
+so re-exported names are only imported on first access.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(module_name: str, exports: Mapping[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for lazily exported names.
+
+    Args:
+    ----
+        module_name: Name of the package doing the exporting (its ``__name__``)
+        exports: Exported name -> module that defines it
+
+    Returns:
+    -------
+        (__getattr__, __dir__) to assign at module level
+
+    Example:
+    -------
+        >>> _LAZY_EXPORTS = {"ConfigMap": "kstack_lib.config.configmap"}
+        >>> __getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
+    """
+
+    def __getattr__(name: str) -> Any:
+        """Import lazily exported names on first access."""
+        source = exports.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(source), name)
+        setattr(sys.modules[module_name], name, value)  # Cache so __getattr__ is not hit again
+        return value
+
+    def __dir__() -> list[str]:
+        """List module attributes including lazy exports."""
+        module = sys.modules[module_name]
+        return sorted(set(vars(module)) | set(getattr(module, "__all__", ())) | set(exports))
+
+    return __getattr__, __dir__
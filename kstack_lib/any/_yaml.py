@@ -0,0 +1,35 @@
+"""
+YAML parsing helper (context-agnostic).
+
+Uses the libyaml-backed ``CSafeLoader`` when PyYAML was built with it and
+falls back to the pure-Python ``SafeLoader`` otherwise.
+"""
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """
+    Parse a YAML document safely (drop-in replacement for ``yaml.safe_load``).
+
+    Args:
+    ----
+        stream: YAML text or open file
+
+    Returns:
+    -------
+        Parsed Python object
+
+    Raises:
+    ------
+        yaml.YAMLError: If the document is invalid
+
+    """
+    return yaml.load(stream, Loader=_SafeLoader)  # noqa: S506 - safe loader
@@ -5,21 +5,137 @@ Creates cloud provider sessions auto-configured from credentials.
 Works in both cluster and local contexts via DI.
 """
 
-from collections.abc import Callable
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Any
 
 from partsnap_logger.logging import psnap_get_logger
 
 from kstack_lib.any.exceptions import KStackConfigurationError
+from kstack_lib.any.utils import close_all
 
 LOGGER = psnap_get_logger("kstack_lib.any.cloud_sessions")
 
+# Default lifetime (seconds) of credentials cached by the session factory
+DEFAULT_CREDENTIALS_TTL = 300.0
+
+# Connection pool size for clients from create_client() (botocore's default is 10)
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+
+# Retry policy for clients from create_client()
+DEFAULT_RETRIES = {"max_attempts": 3, "mode": "adaptive"}
+
+# Upper bound on parallel credential fetches in create_sessions()
+MAX_CREDENTIAL_FETCH_WORKERS = 8
+
+
+def preload_boto3() -> threading.Thread:
+    """
+    Import boto3 (and botocore's Config) on a daemon thread.
+
+    Lets startup work overlap the ~25ms boto3 import so the first
+    create_session()/create_client() call doesn't pay for it. Missing
+    packages are ignored here; create_session() reports them.
+
+    Returns
+    -------
+        The started thread
+
+    """
+
+    def _import() -> None:
+        try:
+            import boto3  # noqa: F401
+            import botocore.config  # noqa: F401
+        except ImportError:
+            LOGGER.debug("boto3 not installed, skipping preload")
+
+    thread = threading.Thread(target=_import, name="kstack-preload-boto3", daemon=True)
+    thread.start()
+    return thread
+
+
+def _client_key(
+    service: str, layer: str, environment: str, client_kwargs: Mapping[str, Any]
+) -> tuple[str, str, str, frozenset[tuple[str, Any]]] | None:
+    """Build the client cache key, or None if a kwarg value is unhashable (such clients aren't cached)."""
+    try:
+        return (service, layer, environment, frozenset(client_kwargs.items()))
+    except TypeError:
+        LOGGER.debug("Not caching %s client: unhashable client kwargs %s", service, sorted(client_kwargs))
+        return None
+
+
+class AsyncClientHolder:
+    """
+    Long-lived aioboto3 client, entered once and shared.
+
+    Entering an aioboto3 client context per request tears down its aiohttp
+    connection pool each time. The holder enters the context on first use
+    and keeps the client until aclose().
+
+    Example:
+    -------
+        ```python
+        holder = factory.create_async_client("s3", "layer3", "dev")
+        s3 = await holder.client()
+        await s3.list_buckets()
+
+        # On application shutdown
+        await factory.aclose()
+        ```
+
+    """
+
+    __slots__ = ("_session", "_service", "_client_kwargs", "_context", "_client", "_lock")
+
+    def __init__(self, session: Any, service: str, **client_kwargs: Any) -> None:
+        """
+        Initialize holder (the client is created on first use).
+
+        Args:
+        ----
+            session: aioboto3.Session to create the client from
+            service: Service name (e.g., "s3", "sqs")
+            **client_kwargs: Extra arguments for session.client()
+
+        """
+        self._session = session
+        self._service = service
+        self._client_kwargs = client_kwargs
+        self._context: Any = None
+        self._client: Any = None
+        self._lock = asyncio.Lock()
+
+    async def client(self) -> Any:
+        """Get the client, entering its context on first call."""
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:
+                    context = self._session.client(self._service, **self._client_kwargs)
+                    self._client = await context.__aenter__()
+                    self._context = context
+        return self._client
+
+    async def aclose(self) -> None:
+        """Exit the client context (a later client() call opens a new one)."""
+        async with self._lock:
+            context, self._context, self._client = self._context, None, None
+        if context is not None:
+            await context.__aexit__(None, None, None)
+
 
 class Boto3SessionFactory:
     """
     Factory for creating boto3/aioboto3 sessions from credentials.
 
     Auto-configured from credentials provider (vault or K8s secrets).
+    Sessions are reused per (library, service, layer, environment) for as long
+    as the credentials they were built from stay cached.
 
     Example:
     -------
@@ -32,25 +148,151 @@ class Boto3SessionFactory:
         session = factory.create_session("s3", "layer3", "dev")
         s3_client = session.client("s3")
 
+        # Or a shared, pooled client (reused across calls)
+        s3_client = factory.create_client("s3", "layer3", "dev")
+
         # Async session
         async_session = factory.create_async_session("s3", "layer3", "dev")
         async with async_session.client("s3") as s3:
             await s3.list_buckets()
+
+        # Or a long-lived async client (close with `await factory.aclose()`)
+        s3 = await factory.create_async_client("s3", "layer3", "dev").client()
         ```
 
     """
 
-    def __init__(self, secrets_provider: Any) -> None:
+    __slots__ = (
+        "_secrets",
+        "_credentials_ttl",
+        "_credentials_cache",
+        "_credentials_lock",
+        "_sessions",
+        "_clients",
+        "_async_clients",
+        "_retired_async_clients",
+        "_max_pool_connections",
+        "_retries",
+        "_client_config",
+    )
+
+    # boto3/aioboto3 modules, imported once on first use and shared by all instances
+    _boto3: Any = None
+    _aioboto3: Any = None
+
+    def __init__(
+        self,
+        secrets_provider: Any,
+        credentials_ttl: float = DEFAULT_CREDENTIALS_TTL,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        retries: Mapping[str, Any] | None = None,
+    ) -> None:
         """
         Initialize session factory.
 
         Args:
         ----
             secrets_provider: SecretsProvider instance (injected by container)
+            credentials_ttl: Seconds fetched credentials are reused before asking
+                            the secrets provider again (0 disables caching)
+            max_pool_connections: Connection pool size of clients from create_client()
+            retries: botocore retry config for clients from create_client()
+                    (default: DEFAULT_RETRIES)
 
         """
         self._secrets = secrets_provider
-        LOGGER.debug(f"Initialized Boto3SessionFactory with {secrets_provider}")
+        self._credentials_ttl = credentials_ttl
+        self._credentials_cache: dict[tuple[str, str, str], tuple[float, Mapping[str, Any]]] = {}
+        self._credentials_lock = threading.Lock()
+        # (library, service, layer, environment) -> (credentials used, session)
+        self._sessions: dict[tuple[str, str, str, str], tuple[Mapping[str, Any], Any]] = {}
+        # (service, layer, environment, client kwargs) -> (session used, client)
+        self._clients: dict[tuple[str, str, str, frozenset[tuple[str, Any]]], tuple[Any, Any]] = {}
+        # Same key -> (session used, holder); replaced holders wait for aclose()
+        self._async_clients: dict[tuple[str, str, str, frozenset[tuple[str, Any]]], tuple[Any, AsyncClientHolder]] = {}
+        self._retired_async_clients: list[AsyncClientHolder] = []
+        self._max_pool_connections = max_pool_connections
+        self._retries = dict(retries or DEFAULT_RETRIES)
+        self._client_config: Any = None  # botocore Config, built on first create_client()
+        LOGGER.debug("Initialized Boto3SessionFactory with %r", secrets_provider)
+
+    def _get_credentials(self, service: str, layer: str, environment: str) -> Mapping[str, Any]:
+        """
+        Get credentials from the secrets provider, cached per (service, layer, environment).
+
+        Returns
+        -------
+            Read-only credentials mapping
+
+        """
+        key = (service, layer, environment)
+        with self._credentials_lock:
+            cached = self._credentials_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._credentials_ttl:
+            return cached[1]
+
+        # Vault decryption or K8s API call - the expensive part of session creation
+        creds: Mapping[str, Any] = MappingProxyType(dict(self._secrets.get_credentials(service, layer, environment)))
+        if self._credentials_ttl > 0:
+            with self._credentials_lock:
+                self._credentials_cache[key] = (time.monotonic(), creds)
+        return creds
+
+    def invalidate(self, service: str | None = None, layer: str | None = None, environment: str | None = None) -> None:
+        """
+        Drop cached credentials (and sessions built from them) so the next session re-reads them.
+
+        Args:
+        ----
+            service: Only drop entries for this service (default: any)
+            layer: Only drop entries for this layer (default: any)
+            environment: Only drop entries for this environment (default: any)
+
+        """
+        stale_clients = []
+        with self._credentials_lock:
+            for key in list(self._credentials_cache):
+                if (
+                    (service is None or key[0] == service)
+                    and (layer is None or key[1] == layer)
+                    and (environment is None or key[2] == environment)
+                ):
+                    del self._credentials_cache[key]
+            for session_key in list(self._sessions):
+                if session_key[1:] not in self._credentials_cache:
+                    del self._sessions[session_key]
+            for client_key in list(self._clients):
+                if client_key[:3] not in self._credentials_cache:
+                    stale_clients.append(self._clients.pop(client_key)[1])
+            for client_key in list(self._async_clients):
+                if client_key[:3] not in self._credentials_cache:
+                    self._retired_async_clients.append(self._async_clients.pop(client_key)[1])
+        close_all(stale_clients)
+
+    def _session_kwargs(self, creds: Mapping[str, Any], service: str, layer: str, environment: str) -> dict[str, Any]:
+        """
+        Validate credentials and build the keyword arguments for a session.
+
+        Raises
+        ------
+            KStackConfigurationError: If the AWS key pair is missing
+
+        """
+        aws_access_key_id = creds.get("aws_access_key_id")
+        aws_secret_access_key = creds.get("aws_secret_access_key")
+        if not aws_access_key_id or not aws_secret_access_key:
+            # Don't keep serving incomplete credentials once they are fixed upstream
+            self.invalidate(service, layer, environment)
+            raise KStackConfigurationError(
+                f"Missing AWS credentials for {service} in {layer}/{environment}\n"
+                f"Required: aws_access_key_id, aws_secret_access_key"
+            )
+
+        return {
+            "aws_access_key_id": aws_access_key_id,
+            "aws_secret_access_key": aws_secret_access_key,
+            "region_name": creds.get("aws_region", "us-east-1"),
+        }
 
     def _create_session_impl(
         self,
@@ -80,31 +322,31 @@ class Boto3SessionFactory:
             KStackConfigurationError: If credentials missing
 
         """
-        # Get credentials from provider (vault or K8s secrets)
-        creds = self._secrets.get_credentials(service, layer, environment)
+        # Get credentials from provider (vault or K8s secrets), cached per key
+        creds = self._get_credentials(service, layer, environment)
 
-        # Extract AWS credentials
-        aws_access_key_id = creds.get("aws_access_key_id")
-        aws_secret_access_key = creds.get("aws_secret_access_key")
-        region_name = creds.get("aws_region", "us-east-1")
-        endpoint_url = creds.get("endpoint_url")  # For LocalStack
-
-        if not aws_access_key_id or not aws_secret_access_key:
-            raise KStackConfigurationError(
-                f"Missing AWS credentials for {service} in {layer}/{environment}\n"
-                f"Required: aws_access_key_id, aws_secret_access_key"
-            )
+        # Reuse the session built from these exact (cached) credentials
+        session_key = (library_name, service, layer, environment)
+        with self._credentials_lock:
+            cached = self._sessions.get(session_key)
+        if cached is not None and cached[0] is creds:
+            return cached[1]
 
         # Create session using the provided factory
-        session = session_factory(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name,
-        )
+        session_kwargs = self._session_kwargs(creds, service, layer, environment)
+        session = session_factory(**session_kwargs)
+        if self._credentials_ttl > 0:
+            with self._credentials_lock:
+                self._sessions[session_key] = (creds, session)
 
         LOGGER.debug(
-            f"Created {library_name} session for {service} in {layer}/{environment} "
-            f"(region: {region_name}, endpoint: {endpoint_url or 'default'})"
+            "Created %s session for %s in %s/%s (region: %s, endpoint: %s)",
+            library_name,
+            service,
+            layer,
+            environment,
+            session_kwargs["region_name"],
+            creds.get("endpoint_url") or "default",
         )
 
         return session
@@ -128,13 +370,50 @@ class Boto3SessionFactory:
             KStackConfigurationError: If credentials missing or boto3 not available
 
         """
-        try:
-            import boto3
-        except ImportError as e:
-            raise KStackConfigurationError("boto3 not installed. Install with: uv add boto3") from e
+        boto3 = Boto3SessionFactory._boto3
+        if boto3 is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise KStackConfigurationError("boto3 not installed. Install with: uv add boto3") from e
+            Boto3SessionFactory._boto3 = boto3
 
         return self._create_session_impl(service, layer, environment, boto3.Session, "boto3")
 
+    def create_sessions(self, services: Iterable[str], layer: str, environment: str) -> dict[str, Any]:
+        """
+        Create boto3.Sessions for several services, fetching their credentials in parallel.
+
+        The first service's credentials are fetched on their own so provider
+        setup (e.g. vault decryption) happens once before the fan-out.
+
+        Args:
+        ----
+            services: Service names (e.g., ["s3", "sqs", "dynamodb"])
+            layer: Layer identifier (e.g., "layer3")
+            environment: Environment name (e.g., "dev", "production")
+
+        Returns:
+        -------
+            Mapping of service name to configured boto3.Session
+
+        Raises:
+        ------
+            KStackConfigurationError: If credentials missing or boto3 not available
+
+        """
+        services = list(dict.fromkeys(services))
+
+        # Prefetching only helps when fetched credentials are cached for create_session()
+        if len(services) > 1 and self._credentials_ttl > 0:
+            self._get_credentials(services[0], layer, environment)
+            rest = services[1:]
+            with ThreadPoolExecutor(max_workers=min(len(rest), MAX_CREDENTIAL_FETCH_WORKERS)) as pool:
+                # list() re-raises the first provider error
+                list(pool.map(lambda service: self._get_credentials(service, layer, environment), rest))
+
+        return {service: self.create_session(service, layer, environment) for service in services}
+
     def create_async_session(self, service: str, layer: str, environment: str) -> Any:
         """
         Create an aioboto3.Session configured from credentials.
@@ -154,13 +433,163 @@ class Boto3SessionFactory:
             KStackConfigurationError: If credentials missing or aioboto3 not available
 
         """
-        try:
-            import aioboto3
-        except ImportError as e:
-            raise KStackConfigurationError("aioboto3 not installed. Install with: uv add aioboto3") from e
+        aioboto3 = Boto3SessionFactory._aioboto3
+        if aioboto3 is None:
+            try:
+                import aioboto3
+            except ImportError as e:
+                raise KStackConfigurationError("aioboto3 not installed. Install with: uv add aioboto3") from e
+            Boto3SessionFactory._aioboto3 = aioboto3
 
         return self._create_session_impl(service, layer, environment, aioboto3.Session, "aioboto3")
 
+    def get_endpoint_url(self, service: str, layer: str, environment: str) -> str | None:
+        """
+        Get the endpoint URL from the (cached) credentials, e.g. for LocalStack.
+
+        boto3 sessions don't carry an endpoint, so callers building their own
+        clients should pass this as endpoint_url instead of re-reading secrets.
+
+        Args:
+        ----
+            service: Service name (e.g., "s3", "dynamodb")
+            layer: Layer identifier (e.g., "layer3")
+            environment: Environment name (e.g., "dev", "production")
+
+        Returns:
+        -------
+            Endpoint URL, or None to use the provider default
+
+        """
+        return self._get_credentials(service, layer, environment).get("endpoint_url")
+
+    def _get_client_config(self) -> Any:
+        """Get the shared botocore Config (pool size, retries, TCP keep-alive) for clients."""
+        if self._client_config is None:
+            from botocore.config import Config
+
+            self._client_config = Config(
+                max_pool_connections=self._max_pool_connections,
+                retries=self._retries,
+                tcp_keepalive=True,
+            )
+        return self._client_config
+
+    def create_client(self, service: str, layer: str, environment: str, **client_kwargs: Any) -> Any:
+        """
+        Get a boto3 client for the service, reusing one already created.
+
+        Clients keep their HTTP connection pool, so sharing one avoids a new
+        TCP/TLS handshake per caller. A client is rebuilt when the session it
+        came from is (i.e. after credentials expire or are invalidated).
+
+        Args:
+        ----
+            service: Service name (e.g., "s3", "dynamodb")
+            layer: Layer identifier (e.g., "layer3")
+            environment: Environment name (e.g., "dev", "production")
+            **client_kwargs: Extra arguments for session.client(). endpoint_url
+                            defaults to the one in the credentials, config to
+                            the factory's pool/retry settings.
+
+        Returns:
+        -------
+            Configured boto3 client
+
+        Raises:
+        ------
+            KStackConfigurationError: If credentials missing or boto3 not available
+
+        """
+        session = self.create_session(service, layer, environment)
+
+        key = _client_key(service, layer, environment, client_kwargs)
+        with self._credentials_lock:
+            cached = self._clients.get(key) if key is not None else None
+        if cached is not None and cached[0] is session:
+            return cached[1]
+
+        # Sessions can't carry an endpoint, so apply the LocalStack one here
+        self._apply_endpoint_url(client_kwargs, service, layer, environment)
+        if "config" not in client_kwargs:
+            client_kwargs["config"] = self._get_client_config()
+
+        client = session.client(service, **client_kwargs)
+        if key is not None and self._credentials_ttl > 0:
+            with self._credentials_lock:
+                replaced = self._clients.get(key)
+                self._clients[key] = (session, client)
+            if replaced is not None and replaced[1] is not client:
+                close_all([replaced[1]])
+        return client
+
+    def create_async_client(
+        self, service: str, layer: str, environment: str, **client_kwargs: Any
+    ) -> AsyncClientHolder:
+        """
+        Get a shared holder for a long-lived aioboto3 client.
+
+        Holders are cached like create_client() clients. One whose session was
+        rebuilt (credentials expired or invalidated) is replaced, and the old
+        one stays usable until aclose().
+
+        Args:
+        ----
+            service: Service name (e.g., "s3", "sqs")
+            layer: Layer identifier (e.g., "layer3")
+            environment: Environment name (e.g., "dev", "production")
+            **client_kwargs: Extra arguments for session.client().
+                            endpoint_url defaults to the one in the credentials.
+
+        Returns:
+        -------
+            AsyncClientHolder (await holder.client() for the client)
+
+        Raises:
+        ------
+            KStackConfigurationError: If credentials missing or aioboto3 not available
+
+        """
+        session = self.create_async_session(service, layer, environment)
+
+        key = _client_key(service, layer, environment, client_kwargs)
+        with self._credentials_lock:
+            cached = self._async_clients.get(key) if key is not None else None
+        if cached is not None and cached[0] is session:
+            return cached[1]
+
+        self._apply_endpoint_url(client_kwargs, service, layer, environment)
+        holder = AsyncClientHolder(session, service, **client_kwargs)
+        if key is not None and self._credentials_ttl > 0:
+            with self._credentials_lock:
+                if cached is not None:
+                    self._retired_async_clients.append(cached[1])
+                self._async_clients[key] = (session, holder)
+        return holder
+
+    def _apply_endpoint_url(self, client_kwargs: dict[str, Any], service: str, layer: str, environment: str) -> None:
+        """Default client_kwargs' endpoint_url to the one in the credentials."""
+        endpoint_url = self.get_endpoint_url(service, layer, environment)
+        if endpoint_url and "endpoint_url" not in client_kwargs:
+            client_kwargs["endpoint_url"] = endpoint_url
+
+    async def aclose(self) -> None:
+        """Close every async client handed out by create_async_client()."""
+        with self._credentials_lock:
+            holders = [holder for _, holder in self._async_clients.values()] + self._retired_async_clients
+            self._async_clients.clear()
+            self._retired_async_clients = []
+        await asyncio.gather(*(holder.aclose() for holder in holders))
+
+    def close(self) -> None:
+        """Close cached clients and drop all cached sessions and credentials."""
+        with self._credentials_lock:
+            clients = [client for _, client in self._clients.values()]
+            self._clients.clear()
+            self._sessions.clear()
+            self._credentials_cache.clear()
+        close_all(clients)
+
     def __repr__(self) -> str:
         """Return string representation."""
         return f"Boto3SessionFactory(secrets={self._secrets})"
@@ -2,9 +2,14 @@
 Dependency injection container for KStack.
 
 This container auto-wires adapters based on context (cluster vs local).
-Uses dependency-injector for clean DI with singletons.
+Uses dependency-injector for clean DI with singletons. Once created, a
+Singleton resolves with a C-level cache hit, and its provider.override()
+support is what tests and callers use to swap adapters.
 """
 
+import os
+from functools import lru_cache
+
 from dependency_injector import containers, providers
 
 from kstack_lib.any.context import is_in_cluster
@@ -15,12 +20,63 @@ from kstack_lib.any.protocols import (
     VaultManager,
 )
 
+# Set to "1" to import boto3 in the background when this module loads
+PRELOAD_BOTO3_ENV_VAR = "KSTACK_PRELOAD_BOTO3"
+
 
+@lru_cache(maxsize=1)
 def _context_selector() -> str:
-    """Return 'cluster' or 'local' based on context for Selector provider."""
+    """Return 'cluster' or 'local' based on context for Selector provider (cached like is_in_cluster)."""
     return "cluster" if is_in_cluster() else "local"
 
 
+# Adapter factories. Imports are deferred so the import guards of the
+# context-specific packages only fire for the context actually selected;
+# Singleton providers call each factory at most once per container.
+
+
+def _create_cluster_environment_detector() -> EnvironmentDetector:
+    """Create the in-cluster environment detector."""
+    from kstack_lib.cluster.config.environment import ClusterEnvironmentDetector
+
+    return ClusterEnvironmentDetector()
+
+
+def _create_local_environment_detector() -> EnvironmentDetector:
+    """Create the .kstack.yaml environment detector."""
+    from kstack_lib.local.config.environment import LocalEnvironmentDetector
+
+    return LocalEnvironmentDetector()
+
+
+def _create_vault_manager(env_detector: EnvironmentDetector) -> VaultManager:
+    """Create the local vault for the detected environment."""
+    from kstack_lib.local.security.vault import KStackVault
+
+    return KStackVault(environment=env_detector.get_environment())
+
+
+def _create_cluster_secrets_provider() -> SecretsProvider:
+    """Create the Kubernetes secrets provider."""
+    from kstack_lib.cluster.security.secrets import ClusterSecretsProvider
+
+    return ClusterSecretsProvider()
+
+
+def _create_local_secrets_provider(vault: VaultManager, env_detector: EnvironmentDetector) -> SecretsProvider:
+    """Create the vault-backed credentials provider."""
+    from kstack_lib.local.security.credentials import LocalCredentialsProvider
+
+    return LocalCredentialsProvider(vault=vault, environment=env_detector.get_environment())
+
+
+def _create_cloud_session_factory(secrets: SecretsProvider) -> CloudSessionFactory:
+    """Create the boto3/aioboto3 session factory."""
+    from kstack_lib.any.cloud_sessions import Boto3SessionFactory
+
+    return Boto3SessionFactory(secrets_provider=secrets)
+
+
 class KStackIoCContainer(containers.DeclarativeContainer):
     """
     Inversion of Control (IoC) container for KStack.
@@ -52,30 +108,15 @@ class KStackIoCContainer(containers.DeclarativeContainer):
     environment_detector = providers.Singleton(
         providers.Selector(
             _context_selector,
-            cluster=providers.Factory(
-                lambda: __import__(
-                    "kstack_lib.cluster.config.environment",
-                    fromlist=["ClusterEnvironmentDetector"],
-                ).ClusterEnvironmentDetector()
-            ),
-            local=providers.Factory(
-                lambda: __import__(
-                    "kstack_lib.local.config.environment",
-                    fromlist=["LocalEnvironmentDetector"],
-                ).LocalEnvironmentDetector()
-            ),
+            cluster=providers.Factory(_create_cluster_environment_detector),
+            local=providers.Factory(_create_local_environment_detector),
         )
     )
 
     # Singleton: Vault manager (LOCAL-ONLY, will error if accessed in-cluster)
     vault_manager = providers.Singleton(
-        providers.Callable(
-            lambda env_detector: __import__(
-                "kstack_lib.local.security.vault",
-                fromlist=["KStackVault"],
-            ).KStackVault(environment=env_detector.get_environment()),
-            env_detector=environment_detector,
-        )
+        _create_vault_manager,
+        env_detector=environment_detector,
     )
 
     # Singleton: Secrets provider
@@ -83,17 +124,9 @@ class KStackIoCContainer(containers.DeclarativeContainer):
     secrets_provider = providers.Singleton(
         providers.Selector(
             _context_selector,
-            cluster=providers.Factory(
-                lambda: __import__(
-                    "kstack_lib.cluster.security.secrets",
-                    fromlist=["ClusterSecretsProvider"],
-                ).ClusterSecretsProvider()
-            ),
+            cluster=providers.Factory(_create_cluster_secrets_provider),
             local=providers.Callable(
-                lambda vault, env_detector: __import__(
-                    "kstack_lib.local.security.credentials",
-                    fromlist=["LocalCredentialsProvider"],
-                ).LocalCredentialsProvider(vault=vault, environment=env_detector.get_environment()),
+                _create_local_secrets_provider,
                 vault=vault_manager,
                 env_detector=environment_detector,
             ),
@@ -103,19 +136,20 @@ class KStackIoCContainer(containers.DeclarativeContainer):
     # Singleton: Cloud session factory (boto3/aioboto3)
     # Automatically configured from secrets provider
     cloud_session_factory = providers.Singleton(
-        providers.Callable(
-            lambda secrets: __import__(
-                "kstack_lib.any.cloud_sessions",
-                fromlist=["Boto3SessionFactory"],
-            ).Boto3SessionFactory(secrets_provider=secrets),
-            secrets=secrets_provider,
-        )
+        _create_cloud_session_factory,
+        secrets=secrets_provider,
     )
 
 
 # Global singleton container instance
 container = KStackIoCContainer()
 
+# Opt-in: overlap the boto3 import with the rest of startup
+if os.environ.get(PRELOAD_BOTO3_ENV_VAR) == "1":
+    from kstack_lib.any.cloud_sessions import preload_boto3
+
+    preload_boto3()
+
 
 def get_environment_detector() -> EnvironmentDetector:
     """
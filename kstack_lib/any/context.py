@@ -5,13 +5,19 @@ Determines whether code is running inside a Kubernetes cluster or on a local mac
 This is the single source of truth for context detection used throughout kstack-lib.
 """
 
+import os
 from functools import lru_cache
-from pathlib import Path
 
 from partsnap_logger.logging import psnap_get_logger
 
 LOGGER = psnap_get_logger("kstack_lib.any.context")
 
+# Mounted into every pod by Kubernetes
+SERVICE_ACCOUNT_TOKEN = "/var/run/secrets/kubernetes.io/serviceaccount/token"
+
+# Optional override, e.g. exported by a parent process ("1" in-cluster, "0" local)
+IN_CLUSTER_ENV_VAR = "KSTACK_IN_CLUSTER"
+
 
 @lru_cache(maxsize=1)
 def is_in_cluster() -> bool:
@@ -27,7 +33,9 @@ def is_in_cluster() -> bool:
 
     Note:
     ----
-        Result is cached since context doesn't change during runtime.
+        Result is cached since context doesn't change during runtime. An
+        inherited KSTACK_IN_CLUSTER is honoured; callers that want child
+        processes to skip the check export it themselves.
 
     Example:
     -------
@@ -38,8 +46,15 @@ def is_in_cluster() -> bool:
         ...     print("Running on local machine")
 
     """
-    token_file = Path("/var/run/secrets/kubernetes.io/serviceaccount/token")
-    in_cluster = token_file.exists()
+    inherited = os.environ.get(IN_CLUSTER_ENV_VAR)
+    if inherited is not None:
+        return inherited == "1"
+
+    try:
+        os.stat(SERVICE_ACCOUNT_TOKEN)
+        in_cluster = True
+    except OSError:
+        in_cluster = False
 
     if in_cluster:
         LOGGER.debug("Detected in-cluster execution (Kubernetes)")
@@ -5,6 +5,9 @@ These protocols define the contracts that adapters must implement.
 Protocols enable dependency injection and context-specific implementations.
 
 All protocols follow PEP 544 (Structural Subtyping / Protocol).
+They are runtime_checkable for callers validating adapters with isinstance();
+kstack-lib itself relies on static typing only, so no such (per-method
+hasattr) checks run on its resolution paths.
 """
 
 from pathlib import Path
@@ -1,8 +1,23 @@
 """KStack type definitions (enums and type classes)."""
 
-from kstack_lib.any.types.environments import KStackEnvironment
-from kstack_lib.any.types.layers import KStackLayer, LayerChoice
-from kstack_lib.any.types.services import KStackLocalStackService, KStackRedisDatabase
+from typing import TYPE_CHECKING
+
+from kstack_lib.any._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kstack_lib.any.types.environments import KStackEnvironment
+    from kstack_lib.any.types.layers import KStackLayer, LayerChoice
+    from kstack_lib.any.types.services import KStackLocalStackService, KStackRedisDatabase
+
+# Types resolved on first access (PEP 562) so only the submodule in use is imported:
+# name -> module that defines it
+_LAZY_EXPORTS = {
+    "KStackLayer": "kstack_lib.any.types.layers",
+    "LayerChoice": "kstack_lib.any.types.layers",
+    "KStackEnvironment": "kstack_lib.any.types.environments",
+    "KStackRedisDatabase": "kstack_lib.any.types.services",
+    "KStackLocalStackService": "kstack_lib.any.types.services",
+}
 
 __all__ = [
     "KStackLayer",
@@ -11,3 +26,6 @@ __all__ = [
     "KStackRedisDatabase",
     "KStackLocalStackService",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -1,5 +1,6 @@
 """KStack layer type definitions."""
 
+import sys
 from enum import Enum
 
 
@@ -15,12 +16,14 @@ class KStackLayer(Enum):
     - LAYER_1_TENANT_INFRA: Per-customer infrastructure (RDS, ElastiCache, S3, SQS)
     - LAYER_2_GLOBAL_SERVICES: Shared business logic (PartFinder, cross-tenant services)
     - LAYER_3_GLOBAL_INFRA: Foundation infrastructure (Redis, LocalStack, shared resources)
+
+    Values are interned so namespace strings compare by identity first.
     """
 
-    LAYER_0_APPLICATIONS = "layer-0-applications"
-    LAYER_1_TENANT_INFRA = "layer-1-tenant-infra"
-    LAYER_2_GLOBAL_SERVICES = "layer-2-global-services"
-    LAYER_3_GLOBAL_INFRA = "layer-3-global-infra"
+    LAYER_0_APPLICATIONS = sys.intern("layer-0-applications")
+    LAYER_1_TENANT_INFRA = sys.intern("layer-1-tenant-infra")
+    LAYER_2_GLOBAL_SERVICES = sys.intern("layer-2-global-services")
+    LAYER_3_GLOBAL_INFRA = sys.intern("layer-3-global-infra")
 
     @property
     def namespace(self) -> str:
@@ -46,13 +49,7 @@ class KStackLayer(Enum):
             Display name (e.g., 'Layer 3: Global Infrastructure')
 
         """
-        display_names = {
-            KStackLayer.LAYER_0_APPLICATIONS: "Layer 0: Applications",
-            KStackLayer.LAYER_1_TENANT_INFRA: "Layer 1: Tenant Infrastructure",
-            KStackLayer.LAYER_2_GLOBAL_SERVICES: "Layer 2: Global Services",
-            KStackLayer.LAYER_3_GLOBAL_INFRA: "Layer 3: Global Infrastructure",
-        }
-        return display_names[self]
+        return _DISPLAY_NAMES[self]
 
     @property
     def number(self) -> int:
@@ -64,12 +61,7 @@ class KStackLayer(Enum):
             Layer number
 
         """
-        return {
-            KStackLayer.LAYER_0_APPLICATIONS: 0,
-            KStackLayer.LAYER_1_TENANT_INFRA: 1,
-            KStackLayer.LAYER_2_GLOBAL_SERVICES: 2,
-            KStackLayer.LAYER_3_GLOBAL_INFRA: 3,
-        }[self]
+        return _NUMBERS[self]
 
     @classmethod
     def from_namespace(cls, namespace: str) -> "KStackLayer":
@@ -95,10 +87,10 @@ class KStackLayer(Enum):
             True
 
         """
-        for layer in cls:
-            if layer.namespace == namespace:
-                return layer
-        raise ValueError(f"Unknown namespace: {namespace}")
+        try:
+            return _BY_NAMESPACE[namespace]
+        except KeyError:
+            raise ValueError(f"Unknown namespace: {namespace}") from None
 
     @classmethod
     def from_number(cls, num: int) -> "KStackLayer":
@@ -118,10 +110,10 @@ class KStackLayer(Enum):
             ValueError: If number is invalid
 
         """
-        for layer in cls:
-            if layer.number == num:
-                return layer
-        raise ValueError(f"Invalid layer number: {num}")
+        try:
+            return _BY_NUMBER[num]
+        except KeyError:
+            raise ValueError(f"Invalid layer number: {num}") from None
 
     @classmethod
     def from_string(cls, value: str) -> "KStackLayer":
@@ -158,14 +150,9 @@ class KStackLayer(Enum):
         value_lower = value.lower().strip()
 
         # Try short aliases first (layer0, layer1, layer2, layer3)
-        alias_map = {
-            "layer0": cls.LAYER_0_APPLICATIONS,
-            "layer1": cls.LAYER_1_TENANT_INFRA,
-            "layer2": cls.LAYER_2_GLOBAL_SERVICES,
-            "layer3": cls.LAYER_3_GLOBAL_INFRA,
-        }
-        if value_lower in alias_map:
-            return alias_map[value_lower]
+        layer = _BY_ALIAS.get(value_lower)
+        if layer is not None:
+            return layer
 
         # Try number (0, 1, 2, 3)
         if value_lower.isdigit():
@@ -184,6 +171,24 @@ class KStackLayer(Enum):
         )
 
 
+# Lookup tables built once at import (properties and reverse lookups are dict gets)
+_DISPLAY_NAMES: dict[KStackLayer, str] = {
+    KStackLayer.LAYER_0_APPLICATIONS: sys.intern("Layer 0: Applications"),
+    KStackLayer.LAYER_1_TENANT_INFRA: sys.intern("Layer 1: Tenant Infrastructure"),
+    KStackLayer.LAYER_2_GLOBAL_SERVICES: sys.intern("Layer 2: Global Services"),
+    KStackLayer.LAYER_3_GLOBAL_INFRA: sys.intern("Layer 3: Global Infrastructure"),
+}
+_NUMBERS: dict[KStackLayer, int] = {
+    KStackLayer.LAYER_0_APPLICATIONS: 0,
+    KStackLayer.LAYER_1_TENANT_INFRA: 1,
+    KStackLayer.LAYER_2_GLOBAL_SERVICES: 2,
+    KStackLayer.LAYER_3_GLOBAL_INFRA: 3,
+}
+_BY_NAMESPACE: dict[str, KStackLayer] = {layer.namespace: layer for layer in KStackLayer}
+_BY_NUMBER: dict[int, KStackLayer] = {number: layer for layer, number in _NUMBERS.items()}
+_BY_ALIAS: dict[str, KStackLayer] = {f"layer{number}": layer for layer, number in _NUMBERS.items()}
+
+
 class LayerChoice(str, Enum):
     """Layer selection options including 'all' for CLI commands."""
 
@@ -1,11 +1,25 @@
 """Utility functions for kstack-lib."""
 
+import logging
+import os
+import shlex
 import subprocess
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from partsnap_logger.logging import psnap_get_logger
 
 LOGGER = psnap_get_logger("kstack_lib.utils")
 
+# Results of successful run_command(..., cache=True) calls for the process lifetime
+_RESULT_CACHE: dict[tuple, subprocess.CompletedProcess] = {}
+_RESULT_CACHE_LOCK = threading.Lock()
+
+# Most threads close_all() uses to close resources in parallel
+MAX_CLOSE_WORKERS = 8
+
 
 def run_command(
     cmd: list[str],
@@ -13,6 +27,8 @@ def run_command(
     capture: bool = True,
     env: dict[str, str] | None = None,
     timeout: int | None = None,
+    cache: bool = False,
+    binary: bool = False,
 ) -> subprocess.CompletedProcess:
     """
     Run a shell command with consistent handling.
@@ -22,8 +38,13 @@ def run_command(
         cmd: Command and arguments as a list
         check: If True, raise CalledProcessError on non-zero exit
         capture: If True, capture stdout/stderr
-        env: Optional environment variables (merged with os.environ)
+        env: Optional environment variables (merged with os.environ; the
+             parent environment is inherited as-is when omitted)
         timeout: Optional timeout in seconds
+        cache: If True, reuse the result of an earlier successful run of the
+               same command (only for idempotent, read-only commands)
+        binary: If True, return stdout/stderr as bytes instead of decoded str
+                (e.g. to hand JSON output straight to a bytes parser)
 
     Returns:
     -------
@@ -53,23 +74,81 @@ def run_command(
         result = run_command(["kubectl", "get", "nonexistent"], check=False)
         if result.returncode != 0:
             print(f"Command failed: {result.stderr}")
+
+        # Read-only query repeated within one process: run it once
+        result = run_command(["kubectl", "config", "current-context"], cache=True)
         ```
 
     """
-    import os
+    if cache:
+        key = (tuple(cmd), frozenset(env.items()) if env else None, capture, binary)
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            return subprocess.CompletedProcess(list(cached.args), cached.returncode, cached.stdout, cached.stderr)
 
-    # Merge environment if provided
-    command_env = os.environ.copy()
-    if env:
-        command_env.update(env)
+    # Only build a merged environment when there is something to add;
+    # env=None lets the child inherit ours without copying it in Python
+    command_env = {**os.environ, **env} if env else None
 
-    LOGGER.debug(f"Running command: {' '.join(cmd)}")
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Running command: %s", shlex.join(cmd))
 
-    return subprocess.run(
+    result = subprocess.run(
         cmd,
         capture_output=capture,
-        text=True,
+        text=not binary,
         check=check,
         env=command_env,
         timeout=timeout,
     )
+
+    if cache and result.returncode == 0:
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[key] = subprocess.CompletedProcess(
+                list(result.args), result.returncode, result.stdout, result.stderr
+            )
+
+    return result
+
+
+def clear_command_cache() -> None:
+    """Forget all results cached by run_command(..., cache=True)."""
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE.clear()
+
+
+def close_all(resources: Iterable[Any]) -> None:
+    """
+    Close resources concurrently.
+
+    Each close() runs on its own worker (up to MAX_CLOSE_WORKERS), so slow
+    connection-pool teardowns overlap instead of adding up. A failing close()
+    is logged and doesn't stop the others. Objects without close() are skipped.
+
+    Args:
+    ----
+        resources: Objects to close (e.g. boto3 clients, cloud providers)
+
+    """
+    closers = [close for close in (getattr(resource, "close", None) for resource in resources) if close is not None]
+    if len(closers) <= 1:
+        for close in closers:
+            _close_quietly(close)
+        return
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(MAX_CLOSE_WORKERS, len(closers))) as executor:
+            list(executor.map(_close_quietly, closers))
+    except RuntimeError:
+        # No new threads during interpreter shutdown (e.g. from a finalizer)
+        for close in closers:
+            _close_quietly(close)
+
+
+def _close_quietly(close: Callable[[], Any]) -> None:
+    """Call close(), logging instead of raising on failure."""
+    try:
+        close()
+    except Exception:
+        LOGGER.warning("Error while closing %r", getattr(close, "__self__", close), exc_info=True)
@@ -35,15 +35,44 @@ Example:
 
 """
 
-from kstack_lib.cal.container import CloudContainer
-from kstack_lib.cal.factory import UnsupportedProviderError, create_cloud_provider
-from kstack_lib.cal.ioc import CALIoCContainer, create_cal_container, get_cal_container, reset_cal_container
-from kstack_lib.cal.protocols import (
-    CloudProviderProtocol,
-    ObjectStorageProtocol,
-    QueueProtocol,
-    SecretManagerProtocol,
-)
+from typing import TYPE_CHECKING
+
+from kstack_lib.any._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kstack_lib.cal.container import CloudContainer
+    from kstack_lib.cal.factory import UnsupportedProviderError, create_cloud_provider
+    from kstack_lib.cal.ioc import (
+        CALIoCContainer,
+        cal_container_scope,
+        create_cal_container,
+        get_cal_container,
+        reset_cal_container,
+    )
+    from kstack_lib.cal.protocols import (
+        CloudProviderProtocol,
+        ObjectStorageProtocol,
+        QueueProtocol,
+        SecretManagerProtocol,
+    )
+
+# Exports resolved on first access (PEP 562): importing a CAL submodule (e.g. just the
+# protocols) doesn't drag in the container, dependency-injector, config and boto3 adapters.
+# name -> module that defines it
+_LAZY_EXPORTS = {
+    "CloudProviderProtocol": "kstack_lib.cal.protocols",
+    "ObjectStorageProtocol": "kstack_lib.cal.protocols",
+    "QueueProtocol": "kstack_lib.cal.protocols",
+    "SecretManagerProtocol": "kstack_lib.cal.protocols",
+    "create_cloud_provider": "kstack_lib.cal.factory",
+    "UnsupportedProviderError": "kstack_lib.cal.factory",
+    "CloudContainer": "kstack_lib.cal.container",
+    "CALIoCContainer": "kstack_lib.cal.ioc",
+    "create_cal_container": "kstack_lib.cal.ioc",
+    "get_cal_container": "kstack_lib.cal.ioc",
+    "reset_cal_container": "kstack_lib.cal.ioc",
+    "cal_container_scope": "kstack_lib.cal.ioc",
+}
 
 __all__ = [
     "CloudProviderProtocol",
@@ -57,4 +86,8 @@ __all__ = [
     "create_cal_container",
     "get_cal_container",
     "reset_cal_container",
+    "cal_container_scope",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
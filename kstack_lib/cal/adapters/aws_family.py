@@ -11,20 +11,121 @@ All implementations use boto3/aioboto3 clients configured with appropriate endpo
 and credentials.
 """
 
+import asyncio
 import mimetypes
+import os
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import AsyncExitStack
+from functools import lru_cache
+from itertools import batched
 from pathlib import Path
-from typing import Any, BinaryIO
-
-import boto3
-from botocore.client import Config
-from botocore.exceptions import ClientError
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, BinaryIO, Final
+from urllib.parse import urlsplit
 
+from kstack_lib.any.exceptions import KStackError
+from kstack_lib.any.utils import close_all
 from kstack_lib.cal.protocols import (
     ObjectStorageProtocol,
     QueueProtocol,
     SecretManagerProtocol,
 )
-from kstack_lib.config.schemas import ProviderConfig
+from kstack_lib.config.schemas import ProviderConfig, ServiceConfig
+
+# boto3/botocore are imported on first client creation, not at module import
+if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+    from botocore.client import Config
+
+# HTTP connection pool size per boto3 client (botocore default is 10),
+# overridable with KSTACK_BOTO_POOL
+DEFAULT_MAX_POOL_CONNECTIONS = int(os.environ.get("KSTACK_BOTO_POOL", "50"))
+
+# Retry policy for all CAL clients
+DEFAULT_RETRIES = {"max_attempts": 3, "mode": "standard"}
+
+# Most entries SQS accepts in one SendMessageBatch/DeleteMessageBatch call
+SQS_MAX_BATCH_SIZE = 10
+
+# Default receive wait (the SQS maximum): an idle queue costs one request per 20s, not a busy loop
+SQS_LONG_POLL_SECONDS = 20
+
+# HTTP method -> S3 client method signed by generate_presigned_url()
+_PRESIGN_METHODS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "GET": "get_object",
+        "PUT": "put_object",
+        "DELETE": "delete_object",
+    }
+)
+
+# head_bucket error codes meaning "bucket doesn't exist" (LocalStack/MinIO vary)
+_MISSING_BUCKET_CODES = frozenset({"404", "NoSuchBucket", "NotFound"})
+
+# Chunk size for AWSObjectStorage.download_object_stream()
+DEFAULT_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _default_transfer_config() -> "TransferConfig":
+    """
+    Build DEFAULT_TRANSFER_CONFIG on first use.
+
+    Managed S3 transfers: multipart above 16 MB, parts uploaded/downloaded in
+    parallel (concurrency overridable with KSTACK_S3_CONCURRENCY).
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=16 * 1024 * 1024,
+        multipart_chunksize=16 * 1024 * 1024,
+        max_concurrency=int(os.environ.get("KSTACK_S3_CONCURRENCY", "16")),
+        use_threads=True,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve DEFAULT_TRANSFER_CONFIG lazily (PEP 562) so importing this module doesn't load boto3."""
+    if name == "DEFAULT_TRANSFER_CONFIG":
+        return _default_transfer_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _config_kwargs(s3: bool) -> dict[str, Any]:
+    """Build the botocore Config settings; S3 needs SigV4 and path-style addressing."""
+    return {
+        "signature_version": "s3v4" if s3 else None,
+        "s3": {"addressing_style": "path"} if s3 else None,
+        "max_pool_connections": DEFAULT_MAX_POOL_CONNECTIONS,
+        "retries": DEFAULT_RETRIES,
+    }
+
+
+@lru_cache(maxsize=2)
+def _botocore_config(s3: bool) -> "Config":
+    """Return the shared botocore Config for S3 or the other services (built once; clients copy it)."""
+    from botocore.client import Config
+
+    return Config(**_config_kwargs(s3), tcp_keepalive=True)
+
+
+def _client_error() -> type[Exception]:
+    """Return botocore's ClientError; only evaluated once an exception is being matched."""
+    from botocore.exceptions import ClientError
+
+    return ClientError
+
+
+def _guess_content_type(file_path: Path | str) -> str | None:
+    """Guess a file's content type from its extension(s)."""
+    return _guess_content_type_for_suffixes("".join(Path(file_path).suffixes))
+
+
+@lru_cache(maxsize=1024)
+def _guess_content_type_for_suffixes(suffixes: str) -> str | None:
+    """Guess the content type for an extension chain like ".json" or ".tar.gz" (cached)."""
+    return mimetypes.guess_type(f"file{suffixes}")[0]
 
 
 class AWSObjectStorage:
@@ -35,10 +136,13 @@ class AWSObjectStorage:
     S3-compatible storage provider.
     """
 
+    __slots__ = ("_client", "_presigned_url_domain", "_presigned_prefix", "_transfer_config")
+
     def __init__(
         self,
         client: Any,
         presigned_url_domain: str | None = None,
+        transfer_config: "TransferConfig | None" = None,
     ):
         """
         Initialize AWS object storage adapter.
@@ -48,10 +152,15 @@ class AWSObjectStorage:
             client: boto3 S3 client
             presigned_url_domain: Optional custom domain for presigned URLs
                                  (used by LocalStack and DigitalOcean Spaces)
+            transfer_config: Multipart settings for file uploads/downloads
+                            (default: DEFAULT_TRANSFER_CONFIG)
 
         """
         self._client = client
         self._presigned_url_domain = presigned_url_domain
+        # (endpoint "scheme://netloc/", custom-domain replacement), learned from the first presigned URL
+        self._presigned_prefix: tuple[str, str] | None = None
+        self._transfer_config = transfer_config or _default_transfer_config()
 
     def list_buckets(self) -> list[str]:
         """List all buckets."""
@@ -59,7 +168,15 @@ class AWSObjectStorage:
         return [bucket["Name"] for bucket in response.get("Buckets", [])]
 
     def create_bucket(self, bucket_name: str) -> None:
-        """Create a new bucket."""
+        """Create a new bucket (a no-op if it already exists)."""
+        # A HEAD is cheaper than a CreateBucket write on the common "already exists" path
+        try:
+            self._client.head_bucket(Bucket=bucket_name)
+            return
+        except _client_error() as e:
+            if e.response["Error"]["Code"] not in _MISSING_BUCKET_CODES:
+                raise
+
         try:
             # For us-east-1, don't specify LocationConstraint
             region = self._client.meta.region_name
@@ -70,7 +187,7 @@ class AWSObjectStorage:
                     Bucket=bucket_name,
                     CreateBucketConfiguration={"LocationConstraint": region},
                 )
-        except ClientError as e:
+        except _client_error() as e:
             if e.response["Error"]["Code"] != "BucketAlreadyOwnedByYou":
                 raise
 
@@ -79,19 +196,76 @@ class AWSObjectStorage:
         self._client.delete_bucket(Bucket=bucket_name)
 
     def list_objects(self, bucket_name: str, prefix: str = "") -> list[dict[str, Any]]:
-        """List objects in a bucket with optional prefix filtering."""
+        """List objects in a bucket with optional prefix filtering (all pages)."""
         try:
-            response = self._client.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-            return response.get("Contents", [])
-        except ClientError:
+            return list(self.iter_objects(bucket_name, prefix))
+        except _client_error():
             return []
 
+    def iter_objects(self, bucket_name: str, prefix: str = "") -> Iterator[dict[str, Any]]:
+        """
+        Iterate over objects in a bucket, fetching one page (up to 1000 keys) at a time.
+
+        Unlike list_objects(), memory stays constant for large buckets and
+        errors (e.g. a missing bucket) propagate as ClientError.
+
+        Args:
+        ----
+            bucket_name: Name of the bucket
+            prefix: Prefix to filter objects (e.g., "folder/subfolder/")
+
+        Yields:
+        ------
+            Object metadata dictionaries (Key, Size, LastModified, ETag)
+
+        """
+        kwargs: dict[str, Any] = {"Bucket": bucket_name, "Prefix": prefix}
+        while True:
+            response = self._client.list_objects_v2(**kwargs)
+            yield from response.get("Contents", [])
+            if not response.get("IsTruncated"):
+                return
+            kwargs["ContinuationToken"] = response["NextContinuationToken"]
+
+    def list_objects_columnar(self, bucket_name: str, prefix: str = "") -> dict[str, Any]:
+        """
+        List objects as columns instead of one dict per object.
+
+        Sizes are packed into an array('q'), so scans like sum(cols["Size"])
+        over large buckets run on contiguous ints rather than per-row dicts.
+        Errors behave like list_objects() (empty columns).
+
+        Args:
+        ----
+            bucket_name: Name of the bucket
+            prefix: Prefix to filter objects (e.g., "folder/subfolder/")
+
+        Returns:
+        -------
+            {"Key": list[str], "Size": array('q'), "LastModified": list[datetime], "ETag": list[str]},
+            all in listing order
+
+        """
+        keys: list[str] = []
+        sizes = array("q")
+        last_modified: list[Any] = []
+        etags: list[str] = []
+        try:
+            for obj in self.iter_objects(bucket_name, prefix):
+                keys.append(obj["Key"])
+                sizes.append(obj.get("Size", 0))
+                last_modified.append(obj.get("LastModified"))
+                etags.append(obj.get("ETag"))
+        except _client_error():
+            return {"Key": [], "Size": array("q"), "LastModified": [], "ETag": []}
+        return {"Key": keys, "Size": sizes, "LastModified": last_modified, "ETag": etags}
+
     def upload_object(
         self,
         bucket_name: str,
         object_key: str,
         file_path: Path | None = None,
-        file_obj: BinaryIO | None = None,
+        file_obj: BinaryIO | bytes | bytearray | memoryview | None = None,
         content_type: str | None = None,
         metadata: dict[str, str] | None = None,
     ) -> None:
@@ -103,7 +277,7 @@ class AWSObjectStorage:
 
         # Auto-detect content type if not provided
         if content_type is None and file_path is not None:
-            content_type, _ = mimetypes.guess_type(str(file_path))
+            content_type = _guess_content_type(file_path)
 
         extra_args: dict[str, Any] = {}
         if content_type:
@@ -112,9 +286,16 @@ class AWSObjectStorage:
             extra_args["Metadata"] = metadata
 
         if file_path is not None:
-            self._client.upload_file(str(file_path), bucket_name, object_key, ExtraArgs=extra_args)
+            self._client.upload_file(
+                str(file_path), bucket_name, object_key, ExtraArgs=extra_args, Config=self._transfer_config
+            )
+        elif isinstance(file_obj, (bytes, bytearray, memoryview)):
+            # In-memory payload: single PutObject, no BytesIO wrapper or chunked reads
+            self._client.put_object(Bucket=bucket_name, Key=object_key, Body=file_obj, **extra_args)
         else:
-            self._client.upload_fileobj(file_obj, bucket_name, object_key, ExtraArgs=extra_args)
+            self._client.upload_fileobj(
+                file_obj, bucket_name, object_key, ExtraArgs=extra_args, Config=self._transfer_config
+            )
 
     def download_object(
         self,
@@ -122,18 +303,67 @@ class AWSObjectStorage:
         object_key: str,
         file_path: Path | None = None,
     ) -> bytes | None:
-        """Download an object from the bucket."""
+        """Download an object from the bucket (prefer download_object_stream() for large objects)."""
         if file_path is not None:
-            self._client.download_file(bucket_name, object_key, str(file_path))
+            self._client.download_file(bucket_name, object_key, str(file_path), Config=self._transfer_config)
             return None
         else:
             response = self._client.get_object(Bucket=bucket_name, Key=object_key)
             return response["Body"].read()
 
+    def download_object_stream(
+        self,
+        bucket_name: str,
+        object_key: str,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream an object's content in chunks instead of buffering it whole.
+
+        Args:
+        ----
+            bucket_name: Name of the bucket
+            object_key: Key (path) of the object
+            chunk_size: Maximum bytes per yielded chunk
+
+        Yields:
+        ------
+            Successive chunks of the object's content
+
+        """
+        response = self._client.get_object(Bucket=bucket_name, Key=object_key)
+        body = response["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
     def delete_object(self, bucket_name: str, object_key: str) -> None:
         """Delete an object from the bucket."""
         self._client.delete_object(Bucket=bucket_name, Key=object_key)
 
+    def copy_object(self, src_bucket: str, src_key: str, dst_bucket: str, dst_key: str) -> None:
+        """
+        Copy an object server-side (no bytes pass through this process).
+
+        Large objects are copied as parallel UploadPartCopy ranges using the
+        adapter's transfer config.
+
+        Args:
+        ----
+            src_bucket: Source bucket name
+            src_key: Source object key
+            dst_bucket: Destination bucket name
+            dst_key: Destination object key
+
+        """
+        self._client.copy(
+            {"Bucket": src_bucket, "Key": src_key},
+            dst_bucket,
+            dst_key,
+            Config=self._transfer_config,
+        )
+
     def generate_presigned_url(
         self,
         bucket_name: str,
@@ -142,13 +372,7 @@ class AWSObjectStorage:
         http_method: str = "GET",
     ) -> str:
         """Generate a presigned URL for temporary access to an object."""
-        method_map = {
-            "GET": "get_object",
-            "PUT": "put_object",
-            "DELETE": "delete_object",
-        }
-
-        client_method = method_map.get(http_method.upper())
+        client_method = _PRESIGN_METHODS.get(http_method.upper())
         if client_method is None:
             raise ValueError(f"Unsupported HTTP method: {http_method}")
 
@@ -160,24 +384,53 @@ class AWSObjectStorage:
 
         # Replace endpoint with custom domain if specified (for LocalStack/DO Spaces)
         if self._presigned_url_domain:
-            # Extract the path and query from the URL
-            from urllib.parse import urlparse, urlunparse
-
-            parsed = urlparse(url)
-            # Rebuild URL with custom domain
-            url = urlunparse(
-                (
-                    parsed.scheme,
-                    self._presigned_url_domain,
-                    parsed.path,
-                    parsed.params,
-                    parsed.query,
-                    parsed.fragment,
+            prefix = self._presigned_prefix
+            if prefix is None or not url.startswith(prefix[0]):
+                parsed = urlsplit(url)
+                prefix = (
+                    f"{parsed.scheme}://{parsed.netloc}/",
+                    f"{parsed.scheme}://{self._presigned_url_domain}/",
                 )
-            )
+                self._presigned_prefix = prefix
+            url = prefix[1] + url[len(prefix[0]) :]
 
         return url
 
+    def generate_presigned_urls(
+        self,
+        items: Iterable[tuple[str, str, str]],
+        expiration: int = 3600,
+    ) -> list[str]:
+        """
+        Generate presigned URLs for many objects in one call.
+
+        Signing is local CPU work (no requests are sent), so this is a loop
+        over generate_presigned_url() that validates every method first.
+
+        Args:
+        ----
+            items: (bucket_name, object_key, http_method) tuples
+            expiration: URL lifetime in seconds, shared by all URLs
+
+        Returns:
+        -------
+            Presigned URLs, in input order
+
+        Raises:
+        ------
+            ValueError: If any item uses an unsupported HTTP method (nothing is signed)
+
+        """
+        items = list(items)
+        for _, _, http_method in items:
+            if http_method.upper() not in _PRESIGN_METHODS:
+                raise ValueError(f"Unsupported HTTP method: {http_method}")
+
+        return [
+            self.generate_presigned_url(bucket_name, object_key, expiration=expiration, http_method=http_method)
+            for bucket_name, object_key, http_method in items
+        ]
+
     def get_object_metadata(self, bucket_name: str, object_key: str) -> dict[str, Any]:
         """Get metadata for an object."""
         response = self._client.head_object(Bucket=bucket_name, Key=object_key)
@@ -193,6 +446,8 @@ class AWSObjectStorage:
 class AWSQueue:
     """AWS SQS-compatible message queue implementation."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: Any):
         """
         Initialize AWS queue adapter.
@@ -238,9 +493,9 @@ class AWSQueue:
         self,
         queue_url: str,
         max_messages: int = 1,
-        wait_time_seconds: int = 0,
+        wait_time_seconds: int = SQS_LONG_POLL_SECONDS,
     ) -> list[dict[str, Any]]:
-        """Receive messages from the queue."""
+        """Receive messages from the queue (long-polls by default; pass wait_time_seconds=0 to return at once)."""
         response = self._client.receive_message(
             QueueUrl=queue_url,
             MaxNumberOfMessages=max_messages,
@@ -252,10 +507,70 @@ class AWSQueue:
         """Delete a message from the queue."""
         self._client.delete_message(QueueUrl=queue_url, ReceiptHandle=receipt_handle)
 
+    def send_messages(self, queue_url: str, message_bodies: Iterable[str]) -> list[str]:
+        """
+        Send messages in batches of up to 10 (one request per batch).
+
+        Args:
+        ----
+            queue_url: URL of the queue
+            message_bodies: Message contents
+
+        Returns:
+        -------
+            Message IDs, in input order
+
+        Raises:
+        ------
+            KStackError: If SQS rejected any message of a batch
+
+        """
+        message_ids: list[str] = []
+        for batch in batched(message_bodies, SQS_MAX_BATCH_SIZE):
+            response = self._client.send_message_batch(
+                QueueUrl=queue_url,
+                Entries=[{"Id": str(i), "MessageBody": body} for i, body in enumerate(batch)],
+            )
+            _raise_for_failed_entries(response, "send")
+            sent = {entry["Id"]: entry["MessageId"] for entry in response.get("Successful", [])}
+            message_ids.extend(sent[str(i)] for i in range(len(batch)))
+        return message_ids
+
+    def delete_messages(self, queue_url: str, receipt_handles: Iterable[str]) -> None:
+        """
+        Delete messages in batches of up to 10 (one request per batch).
+
+        Args:
+        ----
+            queue_url: URL of the queue
+            receipt_handles: Receipt handles from receive_messages()
+
+        Raises:
+        ------
+            KStackError: If SQS failed to delete any message of a batch
+
+        """
+        for batch in batched(receipt_handles, SQS_MAX_BATCH_SIZE):
+            response = self._client.delete_message_batch(
+                QueueUrl=queue_url,
+                Entries=[{"Id": str(i), "ReceiptHandle": handle} for i, handle in enumerate(batch)],
+            )
+            _raise_for_failed_entries(response, "delete")
+
+
+def _raise_for_failed_entries(response: dict[str, Any], action: str) -> None:
+    """Raise if an SQS batch response reports failed entries."""
+    failed = response.get("Failed")
+    if failed:
+        details = ", ".join(f"{entry['Id']}: {entry.get('Message', entry.get('Code'))}" for entry in failed)
+        raise KStackError(f"Failed to {action} {len(failed)} SQS message(s): {details}")
+
 
 class AWSSecretManager:
     """AWS Secrets Manager implementation."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: Any):
         """
         Initialize AWS secret manager adapter.
@@ -297,6 +612,163 @@ class AWSSecretManager:
         self._client.delete_secret(**kwargs)
 
 
+class AWSObjectStorageAsync:
+    """
+    Async S3-compatible object storage backed by an aioboto3 client.
+
+    Lets fan-out workloads (many small objects) overlap their requests on
+    one event loop instead of serializing on blocking sockets.
+    """
+
+    __slots__ = ("_client",)
+
+    def __init__(self, client: Any):
+        """
+        Initialize async object storage adapter.
+
+        Args:
+        ----
+            client: Entered aioboto3 S3 client
+
+        """
+        self._client = client
+
+    async def list_buckets(self) -> list[str]:
+        """List all buckets."""
+        response = await self._client.list_buckets()
+        return [bucket["Name"] for bucket in response.get("Buckets", [])]
+
+    async def list_objects(self, bucket_name: str, prefix: str = "") -> list[dict[str, Any]]:
+        """List objects in a bucket with optional prefix filtering (all pages)."""
+        objects: list[dict[str, Any]] = []
+        kwargs: dict[str, Any] = {"Bucket": bucket_name, "Prefix": prefix}
+        try:
+            while True:
+                response = await self._client.list_objects_v2(**kwargs)
+                objects.extend(response.get("Contents", []))
+                if not response.get("IsTruncated"):
+                    return objects
+                kwargs["ContinuationToken"] = response["NextContinuationToken"]
+        except _client_error():
+            return []
+
+    async def upload_object(
+        self,
+        bucket_name: str,
+        object_key: str,
+        file_path: Path | None = None,
+        file_obj: BinaryIO | bytes | bytearray | memoryview | None = None,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        """Upload an object to the bucket (a file_path is read off the event loop)."""
+        if file_path is None and file_obj is None:
+            raise ValueError("Either file_path or file_obj must be provided")
+        if file_path is not None and file_obj is not None:
+            raise ValueError("Only one of file_path or file_obj should be provided")
+
+        if file_path is not None:
+            if content_type is None:
+                content_type = _guess_content_type(file_path)
+            file_obj = await asyncio.to_thread(Path(file_path).read_bytes)
+
+        extra_args: dict[str, Any] = {}
+        if content_type:
+            extra_args["ContentType"] = content_type
+        if metadata:
+            extra_args["Metadata"] = metadata
+
+        await self._client.put_object(Bucket=bucket_name, Key=object_key, Body=file_obj, **extra_args)
+
+    async def download_object(self, bucket_name: str, object_key: str) -> bytes:
+        """Download an object's content."""
+        response = await self._client.get_object(Bucket=bucket_name, Key=object_key)
+        async with response["Body"] as stream:
+            return await stream.read()
+
+    async def delete_object(self, bucket_name: str, object_key: str) -> None:
+        """Delete an object from the bucket."""
+        await self._client.delete_object(Bucket=bucket_name, Key=object_key)
+
+    async def copy_object(self, src_bucket: str, src_key: str, dst_bucket: str, dst_key: str) -> None:
+        """Copy an object server-side (multipart UploadPartCopy for large objects)."""
+        await self._client.copy({"Bucket": src_bucket, "Key": src_key}, dst_bucket, dst_key)
+
+    async def copy_objects(self, copies: Iterable[tuple[str, str, str, str]]) -> None:
+        """
+        Copy several objects server-side concurrently.
+
+        Args:
+        ----
+            copies: (src_bucket, src_key, dst_bucket, dst_key) tuples
+
+        """
+        await asyncio.gather(*(self.copy_object(*copy) for copy in copies))
+
+    async def get_object_metadata(self, bucket_name: str, object_key: str) -> dict[str, Any]:
+        """Get metadata for an object."""
+        response = await self._client.head_object(Bucket=bucket_name, Key=object_key)
+        return {
+            "ContentLength": response["ContentLength"],
+            "ContentType": response.get("ContentType"),
+            "LastModified": response["LastModified"],
+            "Metadata": response.get("Metadata", {}),
+            "ETag": response["ETag"],
+        }
+
+
+class AWSQueueAsync:
+    """Async SQS-compatible message queue backed by an aioboto3 client."""
+
+    __slots__ = ("_client",)
+
+    def __init__(self, client: Any):
+        """
+        Initialize async queue adapter.
+
+        Args:
+        ----
+            client: Entered aioboto3 SQS client
+
+        """
+        self._client = client
+
+    async def send_message(
+        self,
+        queue_url: str,
+        message_body: str,
+        message_attributes: dict[str, Any] | None = None,
+    ) -> str:
+        """Send a message to the queue."""
+        kwargs: dict[str, Any] = {
+            "QueueUrl": queue_url,
+            "MessageBody": message_body,
+        }
+        if message_attributes:
+            kwargs["MessageAttributes"] = message_attributes
+
+        response = await self._client.send_message(**kwargs)
+        return response["MessageId"]
+
+    async def receive_messages(
+        self,
+        queue_url: str,
+        max_messages: int = 1,
+        wait_time_seconds: int = SQS_LONG_POLL_SECONDS,
+    ) -> list[dict[str, Any]]:
+        """Receive messages from the queue (long-polls by default; pass wait_time_seconds=0 to return at once)."""
+        response = await self._client.receive_message(
+            QueueUrl=queue_url,
+            MaxNumberOfMessages=max_messages,
+            WaitTimeSeconds=wait_time_seconds,
+        )
+        return response.get("Messages", [])
+
+    async def delete_message(self, queue_url: str, receipt_handle: str) -> None:
+        """Delete a message from the queue."""
+        await self._client.delete_message(QueueUrl=queue_url, ReceiptHandle=receipt_handle)
+
+
 class AWSFamilyProvider:
     """
     Cloud provider for AWS family (AWS, LocalStack, DigitalOcean, MinIO).
@@ -305,6 +777,17 @@ class AWSFamilyProvider:
     services based on the provider configuration.
     """
 
+    __slots__ = (
+        "_config",
+        "_credentials",
+        "_session",
+        "_clients",
+        "_async_session",
+        "_async_stack",
+        "_async_clients",
+        "_async_lock",
+    )
+
     def __init__(
         self,
         config: ProviderConfig,
@@ -321,7 +804,43 @@ class AWSFamilyProvider:
         """
         self._config = config
         self._credentials = credentials
+        self._session: Any = None  # boto3 Session shared by all clients, created on first use
         self._clients: dict[str, Any] = {}
+        # aioboto3 clients stay entered until the provider's async exit
+        self._async_session: Any = None
+        self._async_stack: AsyncExitStack | None = None
+        self._async_clients: dict[str, Any] = {}
+        # Serializes async client creation so concurrent callers share one client
+        self._async_lock = asyncio.Lock()
+
+    def _client_kwargs(self, service: str) -> dict[str, Any]:
+        """
+        Build the per-provider client arguments for the specified service.
+
+        Args:
+        ----
+            service: Service name (s3, sqs, secretsmanager)
+
+        Returns:
+        -------
+            Client kwargs (endpoint_url, verify)
+
+        """
+        # Get service-specific configuration (None when the service isn't configured)
+        service_config: ServiceConfig | None = self._config.services.get(service)
+
+        kwargs: dict[str, Any] = {}
+
+        # Add endpoint URL if specified (for LocalStack, DigitalOcean, MinIO)
+        endpoint_url = getattr(service_config, "endpoint_url", None)
+        if endpoint_url:
+            kwargs["endpoint_url"] = endpoint_url
+
+        # Add SSL verification setting
+        if not self._config.verify_ssl:
+            kwargs["verify"] = False
+
+        return kwargs
 
     def _create_boto3_client(self, service: str) -> Any:
         """
@@ -336,32 +855,61 @@ class AWSFamilyProvider:
             Configured boto3 client
 
         """
-        # Get service-specific configuration
-        service_config: Any = self._config.services.get(service, {})
+        import boto3
 
-        # Build client configuration
-        client_config = Config(
-            signature_version="s3v4" if service == "s3" else None,
-            s3={"addressing_style": "path"} if service == "s3" else None,
-        )
+        kwargs = self._client_kwargs(service)
 
-        kwargs: dict[str, Any] = {
-            "service_name": service,
-            "aws_access_key_id": self._credentials["aws_access_key_id"],
-            "aws_secret_access_key": self._credentials["aws_secret_access_key"],
-            "region_name": self._config.region,
-            "config": client_config,
-        }
+        # One session shares credential resolution and loaded service models across clients
+        if self._session is None:
+            self._session = boto3.session.Session(
+                aws_access_key_id=self._credentials["aws_access_key_id"],
+                aws_secret_access_key=self._credentials["aws_secret_access_key"],
+                region_name=self._config.region,
+            )
 
-        # Add endpoint URL if specified (for LocalStack, DigitalOcean, MinIO)
-        if hasattr(service_config, "endpoint_url") and service_config.endpoint_url:
-            kwargs["endpoint_url"] = service_config.endpoint_url
+        return self._session.client(service, config=_botocore_config(service == "s3"), **kwargs)
 
-        # Add SSL verification setting
-        if not self._config.verify_ssl:
-            kwargs["verify"] = False
+    async def _get_aioboto3_client(self, service: str) -> Any:
+        """
+        Get the entered aioboto3 client for the specified service, creating it once.
+
+        Args:
+        ----
+            service: Service name (s3, sqs)
+
+        Returns:
+        -------
+            aioboto3 client, open until the provider's async exit
 
-        return boto3.client(**kwargs)
+        """
+        client = self._async_clients.get(service)
+        if client is not None:
+            return client
+
+        async with self._async_lock:
+            client = self._async_clients.get(service)
+            if client is not None:  # Created by a concurrent caller while we waited
+                return client
+
+            import aioboto3
+            from aiobotocore.config import AioConfig
+
+            if self._async_session is None:
+                self._async_session = aioboto3.Session(
+                    aws_access_key_id=self._credentials["aws_access_key_id"],
+                    aws_secret_access_key=self._credentials["aws_secret_access_key"],
+                    region_name=self._config.region,
+                )
+            if self._async_stack is None:
+                self._async_stack = AsyncExitStack()
+
+            client = await self._async_stack.enter_async_context(
+                self._async_session.client(
+                    service, config=AioConfig(**_config_kwargs(service == "s3")), **self._client_kwargs(service)
+                )
+            )
+            self._async_clients[service] = client
+        return client
 
     def create_object_storage(self) -> ObjectStorageProtocol:
         """Create an object storage client."""
@@ -370,13 +918,10 @@ class AWSFamilyProvider:
 
         # Get presigned URL domain from config
         service_config = self._config.services.get("s3")
-        presigned_url_domain = None
-        if service_config and hasattr(service_config, "presigned_url_domain"):
-            presigned_url_domain = service_config.presigned_url_domain
 
         return AWSObjectStorage(
             client=self._clients["s3"],
-            presigned_url_domain=presigned_url_domain,
+            presigned_url_domain=getattr(service_config, "presigned_url_domain", None),
         )
 
     def create_queue(self) -> QueueProtocol:
@@ -393,11 +938,26 @@ class AWSFamilyProvider:
 
         return AWSSecretManager(client=self._clients["secretsmanager"])
 
+    async def create_object_storage_async(self) -> AWSObjectStorageAsync:
+        """Create an async object storage client (use within `async with provider`)."""
+        return AWSObjectStorageAsync(client=await self._get_aioboto3_client("s3"))
+
+    async def create_queue_async(self) -> AWSQueueAsync:
+        """Create an async message queue client (use within `async with provider`)."""
+        return AWSQueueAsync(client=await self._get_aioboto3_client("sqs"))
+
+    async def aclose(self) -> None:
+        """Close async clients, then the sync ones."""
+        async with self._async_lock:
+            stack, self._async_stack = self._async_stack, None
+            self._async_clients.clear()
+        if stack is not None:
+            await stack.aclose()
+        self.close()
+
     def close(self) -> None:
-        """Close all client connections and cleanup resources."""
-        for client in self._clients.values():
-            if hasattr(client, "close"):
-                client.close()
+        """Close all client connections (in parallel) and cleanup resources."""
+        close_all(self._clients.values())
         self._clients.clear()
 
     def __enter__(self) -> "AWSFamilyProvider":
@@ -414,4 +974,4 @@ class AWSFamilyProvider:
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit with cleanup."""
-        self.close()
+        await self.aclose()
@@ -34,8 +34,12 @@ Usage:
 
 """
 
-from typing import Any
+import asyncio
+import weakref
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
+from kstack_lib.any.utils import close_all
 from kstack_lib.cal.ioc import create_cal_container
 from kstack_lib.cal.protocols import (
     CloudProviderProtocol,
@@ -43,7 +47,15 @@ from kstack_lib.cal.protocols import (
     QueueProtocol,
     SecretManagerProtocol,
 )
-from kstack_lib.config import ConfigMap
+
+if TYPE_CHECKING:
+    from kstack_lib.config import ConfigMap
+
+
+def _close_providers(providers: dict[Any, CloudProviderProtocol]) -> None:
+    """Close (in parallel) and forget providers (module-level so finalizers don't reference the container)."""
+    close_all(providers.values())
+    providers.clear()
 
 
 class CloudContainer:
@@ -80,9 +92,21 @@ class CloudContainer:
 
     """
 
+    __slots__ = (
+        "_config",
+        "_default_provider",
+        "_factory_kwargs",
+        "_ioc",
+        "_providers",
+        "_factory",
+        "_closed",
+        "_finalizer",
+        "__weakref__",
+    )
+
     def __init__(
         self,
-        config: ConfigMap,
+        config: "ConfigMap",
         default_provider: str | None = None,
         **factory_kwargs: Any,
     ):
@@ -104,10 +128,15 @@ class CloudContainer:
         # Create IoC container for dependency injection
         self._ioc = create_cal_container(config, **factory_kwargs)
 
-        # Cache for cloud providers (one per service)
-        self._providers: dict[str, CloudProviderProtocol] = {}
+        # Cache for cloud providers: (override provider, None) when a provider is named
+        # (shared across services), else (None, service) for the environment default
+        self._providers: dict[tuple[str | None, str | None], CloudProviderProtocol] = {}
+        self._factory: Any = None  # IoC provider factory, resolved on first use
         self._closed = False
 
+        # Close providers if the container is collected without close()
+        self._finalizer = weakref.finalize(self, _close_providers, self._providers)
+
     def _get_provider(self, service: str, provider: str | None = None) -> CloudProviderProtocol:
         """
         Get or create a provider for the specified service.
@@ -129,18 +158,21 @@ class CloudContainer:
             raise RuntimeError("Container has been closed")
 
         # Use provided override, or default override, or environment default
-        provider_key = provider or self._default_provider or f"{service}_default"
+        override = provider or self._default_provider
+        provider_key = (override, None) if override else (None, service)
 
         # Return cached provider if available
-        if provider_key in self._providers:
-            return self._providers[provider_key]
+        cloud_provider = self._providers.get(provider_key)
+        if cloud_provider is not None:
+            return cloud_provider
 
         # Create new provider using IoC container's factory
-        factory = self._ioc.provider_factory()
-        cloud_provider = factory(
+        if self._factory is None:
+            self._factory = self._ioc.provider_factory()
+        cloud_provider = self._factory(
             config=self._config,
             service=service,
-            override_provider=provider or self._default_provider,
+            override_provider=override,
             **self._factory_kwargs,
         )
 
@@ -227,6 +259,40 @@ class CloudContainer:
         cloud_provider = self._get_provider("secretsmanager", provider)
         return cloud_provider.create_secret_manager()
 
+    def warmup(self, services: Iterable[str], provider: str | None = None) -> None:
+        """
+        Create providers and service clients ahead of first use.
+
+        Call at process start (e.g. before reporting readiness) so config and
+        credential loading, the boto3 import and client creation don't land on
+        the first request.
+
+        Args:
+        ----
+            services: Service names to prepare (s3, sqs, secretsmanager)
+            provider: Optional provider override, as for the service accessors
+
+        Raises:
+        ------
+            ValueError: If a service name is unknown
+
+        Example:
+        -------
+            >>> container = CloudContainer(cfg)
+            >>> container.warmup(["s3", "sqs"])
+
+        """
+        accessors = {
+            "s3": self.object_storage,
+            "sqs": self.queue,
+            "secretsmanager": self.secret_manager,
+        }
+        for service in services:
+            accessor = accessors.get(service)
+            if accessor is None:
+                raise ValueError(f"Unknown service: {service}. Supported: {', '.join(accessors)}")
+            accessor(provider)
+
     def close(self) -> None:
         """
         Close all providers and cleanup resources.
@@ -237,10 +303,7 @@ class CloudContainer:
         if self._closed:
             return
 
-        for provider in self._providers.values():
-            provider.close()
-
-        self._providers.clear()
+        self._finalizer()  # Runs _close_providers once and disarms the finalizer
         self._closed = True
 
     def __enter__(self) -> "CloudContainer":
@@ -256,10 +319,8 @@ class CloudContainer:
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit with cleanup."""
-        self.close()
-
-    def __del__(self) -> None:
-        """Destructor to ensure cleanup even if close() not called."""
+        """Async context manager exit: await each provider's aclose() (async clients), then close()."""
         if not self._closed:
-            self.close()
+            acloses = [getattr(provider, "aclose", None) for provider in self._providers.values()]
+            await asyncio.gather(*(aclose() for aclose in acloses if aclose is not None))
+        self.close()
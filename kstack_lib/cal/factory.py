@@ -24,6 +24,7 @@ Usage:
 
 """
 
+from collections.abc import Callable
 from typing import Any
 
 from kstack_lib.cal.adapters.aws_family import AWSFamilyProvider
@@ -39,6 +40,39 @@ class UnsupportedProviderError(Exception):
     pass
 
 
+# Adapter per provider family (register GCP/Azure here once implemented)
+_ADAPTERS: dict[ProviderFamily, Callable[..., CloudProviderProtocol]] = {
+    # AWS family includes: LocalStack, AWS, DigitalOcean Spaces, MinIO
+    ProviderFamily.AWS: AWSFamilyProvider,
+}
+
+# Families that are known but don't have an adapter yet
+_PLANNED_FAMILIES: dict[ProviderFamily, str] = {
+    ProviderFamily.GCP: "GCP",
+    ProviderFamily.AZURE: "Azure",
+}
+
+
+def _create_adapter(provider_config: Any, credentials: dict[str, str]) -> CloudProviderProtocol:
+    """Instantiate the adapter registered for the config's provider family."""
+    family = provider_config.provider_family
+    adapter = _ADAPTERS.get(family)
+    if adapter is not None:
+        return adapter(config=provider_config, credentials=credentials)
+
+    planned = _PLANNED_FAMILIES.get(family)
+    if planned is not None:
+        raise UnsupportedProviderError(
+            f"{planned} provider family not yet implemented. "
+            "Coming in a future phase of the cloud abstraction layer."
+        )
+    raise UnsupportedProviderError(
+        f"Unknown provider family: {family}. "
+        f"Supported families: AWS (includes LocalStack, DigitalOcean, MinIO), "
+        f"GCP (coming soon), Azure (coming soon)"
+    )
+
+
 def create_cloud_provider(
     config: ConfigMap,
     service: str = "s3",
@@ -97,26 +131,7 @@ def create_cloud_provider(
     )
 
     # Select adapter based on provider family
-    if provider_config.provider_family == ProviderFamily.AWS:
-        # AWS family includes: LocalStack, AWS, DigitalOcean Spaces, MinIO
-        return AWSFamilyProvider(
-            config=provider_config,
-            credentials=credentials,
-        )
-    elif provider_config.provider_family == ProviderFamily.GCP:
-        raise UnsupportedProviderError(
-            "GCP provider family not yet implemented. " "Coming in a future phase of the cloud abstraction layer."
-        )
-    elif provider_config.provider_family == ProviderFamily.AZURE:
-        raise UnsupportedProviderError(
-            "Azure provider family not yet implemented. " "Coming in a future phase of the cloud abstraction layer."
-        )
-    else:
-        raise UnsupportedProviderError(
-            f"Unknown provider family: {provider_config.provider_family}. "
-            f"Supported families: AWS (includes LocalStack, DigitalOcean, MinIO), "
-            f"GCP (coming soon), Azure (coming soon)"
-        )
+    return _create_adapter(provider_config, credentials)
 
 
 def create_cloud_provider_from_config(
@@ -150,15 +165,4 @@ def create_cloud_provider_from_config(
         >>> provider = create_cloud_provider_from_config(provider_cfg, creds)
 
     """
-    if provider_config.provider_family == ProviderFamily.AWS:
-        # AWS family includes: LocalStack, AWS, DigitalOcean Spaces, MinIO
-        return AWSFamilyProvider(
-            config=provider_config,
-            credentials=credentials,
-        )
-    elif provider_config.provider_family == ProviderFamily.GCP:
-        raise UnsupportedProviderError("GCP provider family not yet implemented")
-    elif provider_config.provider_family == ProviderFamily.AZURE:
-        raise UnsupportedProviderError("Azure provider family not yet implemented")
-    else:
-        raise UnsupportedProviderError(f"Provider family {provider_config.provider_family} not yet supported")
+    return _create_adapter(provider_config, credentials)
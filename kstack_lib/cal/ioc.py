@@ -7,8 +7,7 @@ pattern as kstack_lib.any.container for consistency.
 The CAL IoC container manages:
 - Configuration loaders (injectable for testing)
 - Provider factories (injectable for testing)
-- Provider caching (singleton pattern)
-- Resource cleanup
+- Provider caching and cleanup, via kstack_lib.cal.container.CloudContainer
 
 Example:
 -------
@@ -27,11 +26,42 @@ Example:
 
 """
 
-from typing import Any
+import importlib
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from dependency_injector import containers, providers
 
-from kstack_lib.config import ConfigMap
+if TYPE_CHECKING:
+    # Annotation-only: importing kstack_lib.config (pydantic schemas, loaders, secrets)
+    # is deferred until a provider is actually created
+    from kstack_lib.config import ConfigMap
+
+
+@lru_cache(maxsize=8)
+def _lazy_attr(target: str) -> Any:
+    """
+    Import and return an attribute named as "package.module:attribute" (cached).
+
+    Keeps the loaders/factory modules out of import time of this module while
+    resolving each target only once.
+
+    Args:
+    ----
+        target: Dotted module path and attribute, separated by a colon
+
+    Returns:
+    -------
+        The resolved attribute
+
+    """
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
 
 
 class CALIoCContainer(containers.DeclarativeContainer):
@@ -70,40 +100,25 @@ class CALIoCContainer(containers.DeclarativeContainer):
     """
 
     # Configuration input (dependency)
-    config = providers.Dependency(instance_of=ConfigMap)
+    config = providers.Dependency()  # ConfigMap (kstack_lib.config is not imported here)
 
-    # Factory kwargs (optional overrides for config/vault paths)
-    factory_kwargs = providers.Dict()
+    # Factory kwargs (optional overrides for config/vault paths). Fixed at creation,
+    # so a read-only mapping is returned as-is instead of a Dict provider rebuilding it per call
+    factory_kwargs = providers.Object(MappingProxyType({}))
 
     # Configuration loader - loads provider config and credentials
     # Can be overridden in tests with mocks
-    config_loader = providers.Singleton(
-        providers.Callable(
-            lambda: __import__(
-                "kstack_lib.config.loaders",
-                fromlist=["get_cloud_provider"],
-            ).get_cloud_provider
-        )
-    )
+    config_loader = providers.Singleton(_lazy_attr, "kstack_lib.config.loaders:get_cloud_provider")
 
     # Provider factory - creates cloud provider instances
     # Can be overridden in tests with mocks
-    provider_factory = providers.Singleton(
-        providers.Callable(
-            lambda: __import__(
-                "kstack_lib.cal.factory",
-                fromlist=["create_cloud_provider"],
-            ).create_cloud_provider
-        )
-    )
+    provider_factory = providers.Singleton(_lazy_attr, "kstack_lib.cal.factory:create_cloud_provider")
 
-    # Provider cache - stores created providers for reuse
-    # Using Factory instead of Singleton because we need multiple instances (one per service)
-    _provider_cache = providers.Dict()
+    # Created providers are cached (and closed) by kstack_lib.cal.container.CloudContainer
 
 
 def create_cal_container(
-    config: ConfigMap,
+    config: "ConfigMap",
     **factory_kwargs: Any,
 ) -> CALIoCContainer:
     """
@@ -141,20 +156,26 @@ def create_cal_container(
     """
     container = CALIoCContainer()
     container.config.override(config)
-    container.factory_kwargs.override(factory_kwargs)
+    container.factory_kwargs.override(providers.Object(MappingProxyType(factory_kwargs)))
     return container
 
 
 # Global singleton container (can be overridden in tests)
 _global_container: CALIoCContainer | None = None
+_global_lock = threading.Lock()
 
+# Task/request-scoped container, set with cal_container_scope(); takes precedence over the global
+_container_var: ContextVar[CALIoCContainer | None] = ContextVar("_cal_container", default=None)
 
-def get_cal_container(config: ConfigMap | None = None, **kwargs: Any) -> CALIoCContainer:
+
+def get_cal_container(config: "ConfigMap | None" = None, **kwargs: Any) -> CALIoCContainer:
     """
     Get or create the global CAL IoC container.
 
     This provides a global singleton container for convenience, similar to
-    kstack_lib.any.container.container.
+    kstack_lib.any.container.container. A container set with cal_container_scope()
+    in the current context is returned instead. Creation happens under a lock, so
+    concurrent first calls from several threads share one container.
 
     Args:
     ----
@@ -163,7 +184,7 @@ def get_cal_container(config: ConfigMap | None = None, **kwargs: Any) -> CALIoCC
 
     Returns:
     -------
-        Global CAL IoC container
+        Scoped or global CAL IoC container
 
     Example:
     -------
@@ -184,20 +205,62 @@ def get_cal_container(config: ConfigMap | None = None, **kwargs: Any) -> CALIoCC
     """
     global _global_container
 
-    if _global_container is None:
-        if config is None:
-            raise ValueError(
-                "config is required on first call to get_cal_container(). "
-                "Subsequent calls can omit it to reuse the global container."
-            )
-        _global_container = create_cal_container(config, **kwargs)
+    scoped = _container_var.get()
+    if scoped is not None:
+        return scoped
+
+    container = _global_container
+    if container is not None:
+        return container
 
-    return _global_container
+    with _global_lock:
+        if _global_container is None:
+            if config is None:
+                raise ValueError(
+                    "config is required on first call to get_cal_container(). "
+                    "Subsequent calls can omit it to reuse the global container."
+                )
+            _global_container = create_cal_container(config, **kwargs)
+        return _global_container
+
+
+@contextmanager
+def cal_container_scope(container: CALIoCContainer) -> Iterator[CALIoCContainer]:
+    """
+    Make get_cal_container() return container for the current context.
+
+    The container is held in a ContextVar, so it is visible to the current thread
+    or asyncio task (and tasks it starts) only - e.g. one container per request or
+    per test without touching the global one.
+
+    Args:
+    ----
+        container: Container to use inside the block
+
+    Yields:
+    ------
+        The same container
+
+    Example:
+    -------
+        ```python
+        from kstack_lib.cal.ioc import cal_container_scope, create_cal_container, get_cal_container
+
+        with cal_container_scope(create_cal_container(cfg)) as container:
+            assert get_cal_container() is container
+        ```
+
+    """
+    token = _container_var.set(container)
+    try:
+        yield container
+    finally:
+        _container_var.reset(token)
 
 
 def reset_cal_container() -> None:
     """
-    Reset the global CAL container.
+    Reset the global CAL container and the current context's scoped container.
 
     This is primarily useful for testing to ensure a clean state
     between test cases.
@@ -213,4 +276,6 @@ def reset_cal_container() -> None:
 
     """
     global _global_container
-    _global_container = None
+    with _global_lock:
+        _global_container = None
+    _container_var.set(None)
@@ -10,6 +10,9 @@ Key protocols:
 - QueueProtocol: SQS-compatible message queues
 - SecretManagerProtocol: Secrets management (AWS Secrets Manager, etc.)
 - CloudProviderProtocol: Factory interface for creating service clients
+
+isinstance() against these protocols probes every member, so the CAL factory,
+container and adapters never call it; it is there for tests and callers.
 """
 
 from pathlib import Path
@@ -98,7 +101,7 @@ class ObjectStorageProtocol(Protocol):
         bucket_name: str,
         object_key: str,
         file_path: Path | None = None,
-        file_obj: BinaryIO | None = None,
+        file_obj: BinaryIO | bytes | bytearray | memoryview | None = None,
         content_type: str | None = None,
         metadata: dict[str, str] | None = None,
     ) -> None:
@@ -110,7 +113,7 @@ class ObjectStorageProtocol(Protocol):
             bucket_name: Name of the bucket
             object_key: Key (path) for the object
             file_path: Path to file to upload (mutually exclusive with file_obj)
-            file_obj: File-like object to upload (mutually exclusive with file_path)
+            file_obj: File-like object or in-memory bytes to upload (mutually exclusive with file_path)
             content_type: MIME type of the object (auto-detected if None)
             metadata: Custom metadata key-value pairs
 
@@ -280,16 +283,20 @@ class QueueProtocol(Protocol):
         self,
         queue_url: str,
         max_messages: int = 1,
-        wait_time_seconds: int = 0,
+        wait_time_seconds: int = 20,
     ) -> list[dict[str, Any]]:
         """
         Receive messages from the queue.
 
+        Long-polls by default: the call returns as soon as a message arrives,
+        or with an empty list after wait_time_seconds.
+
         Args:
         ----
             queue_url: URL of the queue
             max_messages: Maximum number of messages to receive (1-10)
-            wait_time_seconds: Long polling wait time
+            wait_time_seconds: Long polling wait time (default 20, the SQS maximum;
+                              0 short-polls and returns immediately)
 
         Returns:
         -------
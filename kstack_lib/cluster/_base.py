@@ -1,7 +1,5 @@
 """Base class for cluster-only components with mockable guard."""
 
-from functools import lru_cache
-
 from kstack_lib.any.context import is_in_cluster
 from kstack_lib.any.exceptions import KStackEnvironmentError
 
@@ -14,7 +12,6 @@ class ClusterBase:
     """
 
     @classmethod
-    @lru_cache(maxsize=1)
     def _check_cluster_context(cls) -> None:
         """
         Verify running in cluster context.
@@ -25,7 +22,9 @@ class ClusterBase:
 
         Note:
         ----
-            This method is cached and can be mocked in tests using:
+            is_in_cluster() is already cached for the process, so this is a
+            cheap check and follows is_in_cluster.cache_clear(). It can be
+            mocked in tests using:
             `@patch.object(ClusterBase, '_check_cluster_context')`
 
         """
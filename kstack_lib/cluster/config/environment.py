@@ -5,6 +5,8 @@ This adapter implements the EnvironmentDetector protocol for in-cluster usage.
 It will raise KStackEnvironmentError if imported outside the cluster.
 """
 
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 
 from partsnap_logger.logging import psnap_get_logger
@@ -14,6 +16,35 @@ from kstack_lib.cluster._base import ClusterBase
 
 LOGGER = psnap_get_logger("kstack_lib.cluster.config.environment")
 
+# Mounted into every pod; fixed for the pod's lifetime
+NAMESPACE_FILE = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
+
+
+@lru_cache(maxsize=1)
+def _read_current_namespace() -> str:
+    """
+    Read the pod's namespace from the service account (cached; failures are not).
+
+    Returns
+    -------
+        Current namespace
+
+    Raises
+    ------
+        KStackConfigurationError: If namespace cannot be determined
+
+    """
+    namespace_file = Path(NAMESPACE_FILE)
+    if not namespace_file.exists():
+        raise KStackConfigurationError(
+            f"Cannot read namespace from {namespace_file}\n"
+            "This should not happen in a properly configured K8s pod."
+        )
+
+    namespace = namespace_file.read_text().strip()
+    LOGGER.debug("Detected namespace from service account: %s", namespace)
+    return namespace
+
 
 class ClusterEnvironmentDetector(ClusterBase):
     """
@@ -47,11 +78,16 @@ class ClusterEnvironmentDetector(ClusterBase):
         """
         super().__init__()  # Verify cluster context
         self._namespace = namespace or self._get_current_namespace()
-        LOGGER.debug(f"Initialized cluster environment detector: {self._namespace}")
+        self._environment: str | None = None
+        # Parse up front so __repr__ can just read the result; an invalid
+        # namespace still raises from get_environment() when it's actually asked for
+        with suppress(KStackConfigurationError):
+            self.get_environment()
+        LOGGER.debug("Initialized cluster environment detector: %s", self._namespace)
 
     def _get_current_namespace(self) -> str:
         """
-        Get current namespace from service account.
+        Get current namespace from service account (read once per process).
 
         Returns
         -------
@@ -62,22 +98,14 @@ class ClusterEnvironmentDetector(ClusterBase):
             KStackConfigurationError: If namespace cannot be determined
 
         """
-        namespace_file = Path("/var/run/secrets/kubernetes.io/serviceaccount/namespace")
-        if not namespace_file.exists():
-            raise KStackConfigurationError(
-                f"Cannot read namespace from {namespace_file}\n"
-                "This should not happen in a properly configured K8s pod."
-            )
-
-        namespace = namespace_file.read_text().strip()
-        LOGGER.debug(f"Detected namespace from service account: {namespace}")
-        return namespace
+        return _read_current_namespace()
 
     def get_environment(self) -> str:
         """
         Get environment from Kubernetes namespace.
 
-        Namespace format: layer-{layer_num}-{environment}
+        Namespace format: layer-{layer_num}-{environment}. The namespace can't
+        change, so the parsed result is kept after the first successful call.
 
         Examples
         --------
@@ -94,10 +122,15 @@ class ClusterEnvironmentDetector(ClusterBase):
             KStackConfigurationError: If namespace format is invalid
 
         """
-        parts = self._namespace.split("-")
+        if self._environment is not None:
+            return self._environment
+
+        # layer-{num}-{environment}: the environment is everything after the second hyphen
+        prefix, _, rest = self._namespace.partition("-")
+        layer_num, _, environment = rest.partition("-")
 
         # Validate format: layer-{num}-{environment}
-        if len(parts) < 3:
+        if not environment:
             raise KStackConfigurationError(
                 f"Invalid namespace format: '{self._namespace}'\n"
                 "Expected format: layer-{layer_num}-{environment}\n"
@@ -106,24 +139,20 @@ class ClusterEnvironmentDetector(ClusterBase):
                 "Please check your Kubernetes namespace configuration."
             )
 
-        if parts[0] != "layer":
+        if prefix != "layer":
             raise KStackConfigurationError(
                 f"Invalid namespace format: '{self._namespace}'\n"
-                f"Namespace must start with 'layer-', got '{parts[0]}-'"
+                f"Namespace must start with 'layer-', got '{prefix}-'"
             )
 
         # Layer number should be second part
-        try:
-            int(parts[1])
-        except ValueError:
+        if not layer_num.isdigit():
             raise KStackConfigurationError(
-                f"Invalid namespace format: '{self._namespace}'\n" f"Layer number must be numeric, got '{parts[1]}'"
-            ) from None
-
-        # Environment is everything after "layer-{num}-"
-        environment = "-".join(parts[2:])
+                f"Invalid namespace format: '{self._namespace}'\n" f"Layer number must be numeric, got '{layer_num}'"
+            )
 
-        LOGGER.debug(f"Detected environment '{environment}' from namespace '{self._namespace}'")
+        LOGGER.debug("Detected environment '%s' from namespace '%s'", environment, self._namespace)
+        self._environment = environment
         return environment
 
     def get_config_root(self) -> None:
@@ -154,8 +183,6 @@ class ClusterEnvironmentDetector(ClusterBase):
 
     def __repr__(self) -> str:
         """Return string representation."""
-        try:
-            env = self.get_environment()
-            return f"ClusterEnvironmentDetector(namespace='{self._namespace}', environment='{env}')"
-        except Exception:
+        if self._environment is None:
             return f"ClusterEnvironmentDetector(namespace='{self._namespace}')"
+        return f"ClusterEnvironmentDetector(namespace='{self._namespace}', environment='{self._environment}')"
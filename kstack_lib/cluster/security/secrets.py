@@ -6,16 +6,66 @@ It will raise KStackEnvironmentError if imported outside the cluster.
 """
 
 import base64
+import json
+import logging
 import subprocess
+import threading
+import time
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
 
 from partsnap_logger.logging import psnap_get_logger
 
+from kstack_lib.any._json import loads
 from kstack_lib.any.exceptions import KStackConfigurationError, KStackServiceNotFoundError
 from kstack_lib.any.utils import run_command
 from kstack_lib.cluster._base import ClusterBase
 
 LOGGER = psnap_get_logger("kstack_lib.cluster.security.secrets")
 
+# Seconds fetched credentials are reused before the secret is read again
+CREDENTIALS_CACHE_TTL = 60.0
+
+
+@lru_cache(maxsize=1)
+def _k8s_core_api() -> Any | None:
+    """
+    Return a shared in-cluster Kubernetes CoreV1Api, or None to fall back to kubectl.
+
+    Uses the ``kubernetes`` package when installed (``kstack-lib[k8s]``): the
+    service account config is loaded once and every secret read reuses the
+    client's pooled HTTPS connection instead of starting kubectl.
+
+    Returns
+    -------
+        CoreV1Api instance, or None if the package is missing or not in a pod
+
+    """
+    try:
+        from kubernetes import client, config
+    except ImportError:  # optional dependency
+        return None
+
+    try:
+        config.load_incluster_config()
+    except config.ConfigException as e:
+        LOGGER.debug("In-cluster Kubernetes config unavailable, using kubectl: %s", e)
+        return None
+    return client.CoreV1Api()
+
+
+def _secret_name(service: str, layer: str) -> str:
+    """Return the K8s secret holding a service's credentials ({layer}-{service}-credentials)."""
+    return f"{layer}-{service}-credentials"
+
+
+def _describe_requests(requests: Iterable[tuple[str, str, str]]) -> str:
+    """Format (service, layer, environment) requests for error messages, one per line."""
+    return "\n".join(
+        f"Service: {service}, Layer: {layer}, Environment: {environment}" for service, layer, environment in requests
+    )
+
 
 class ClusterSecretsProvider(ClusterBase):
     """
@@ -34,18 +84,23 @@ class ClusterSecretsProvider(ClusterBase):
 
     """
 
-    def __init__(self, namespace: str | None = None):
+    def __init__(self, namespace: str | None = None, cache_ttl: float = CREDENTIALS_CACHE_TTL):
         """
         Initialize cluster secrets provider.
 
         Args:
         ----
             namespace: Optional namespace (defaults to current namespace from env)
+            cache_ttl: Seconds to reuse fetched credentials (0 disables caching)
 
         """
         super().__init__()  # Verify cluster context
         self._namespace = namespace or self._get_current_namespace()
-        LOGGER.debug(f"Initialized cluster secrets provider in namespace: {self._namespace}")
+        self._cache_ttl = cache_ttl
+        # (service, layer, environment) -> (expiry on the monotonic clock, decoded credentials)
+        self._cache: dict[tuple[str, str, str], tuple[float, dict]] = {}
+        self._cache_lock = threading.Lock()
+        LOGGER.debug("Initialized cluster secrets provider in namespace: %s", self._namespace)
 
     def _get_current_namespace(self) -> str:
         """
@@ -64,7 +119,7 @@ class ClusterSecretsProvider(ClusterBase):
         try:
             with open(namespace_file) as f:
                 namespace = f.read().strip()
-                LOGGER.debug(f"Detected namespace from service account: {namespace}")
+                LOGGER.debug("Detected namespace from service account: %s", namespace)
                 return namespace
         except FileNotFoundError:
             raise KStackConfigurationError(  # noqa: B904
@@ -98,64 +153,227 @@ class ClusterSecretsProvider(ClusterBase):
             >>> print(creds["aws_access_key_id"])
 
         """
-        # K8s secret naming: {layer}-{service}-credentials
-        secret_name = f"{layer}-{service}-credentials"
+        return self.get_credentials_batch([(service, layer, environment)])[0]
+
+    def get_credentials_batch(self, requests: Iterable[tuple[str, str, str]]) -> list[dict]:
+        """
+        Get credentials for several services with a single kubectl call.
+
+        Each kubectl run pays process startup, kubeconfig auth and an API server
+        round trip, so fetching all secrets needed at startup in one
+        ``kubectl get secret name1 name2 ...`` is much cheaper than one call each.
+        With the ``kubernetes`` package installed, secrets are read in-process
+        over one pooled connection instead. Fetched credentials are reused for
+        cache_ttl seconds; only secrets not already cached are fetched.
+
+        Args:
+        ----
+            requests: (service, layer, environment) tuples, as for get_credentials()
+
+        Returns:
+        -------
+            Credentials dictionaries, in the same order as requests
+
+        Raises:
+        ------
+            KStackServiceNotFoundError: If any secret is not found
+            KStackConfigurationError: If any secret is malformed
+
+        Example:
+        -------
+            >>> provider = ClusterSecretsProvider()
+            >>> s3, sqs = provider.get_credentials_batch(
+            ...     [("s3", "layer3", "production"), ("sqs", "layer3", "production")]
+            ... )
+
+        """
+        wanted = [(service, layer, environment) for service, layer, environment in requests]
+        if not wanted:
+            return []
+        unique = list(dict.fromkeys(wanted))
+
+        now = time.monotonic()
+        with self._cache_lock:
+            found = {key: entry[1] for key in unique if (entry := self._cache.get(key)) and entry[0] > now}
+
+        missing = [key for key in unique if key not in found]
+        if missing:
+            fetched = self._fetch_secrets(missing)
+            loaded = {key: fetched[_secret_name(key[0], key[1])] for key in missing}
+            found.update(loaded)
+            if self._cache_ttl > 0:
+                expiry = now + self._cache_ttl
+                with self._cache_lock:
+                    self._cache.update((key, (expiry, creds)) for key, creds in loaded.items())
+
+        return [dict(found[key]) for key in wanted]
+
+    def clear_cache(self, service: str | None = None, layer: str | None = None, environment: str | None = None) -> None:
+        """
+        Forget cached credentials so the next call reads the secrets again (e.g. after rotation).
+
+        Args:
+        ----
+            service: Only drop entries for this service (default: any)
+            layer: Only drop entries for this layer (default: any)
+            environment: Only drop entries for this environment (default: any)
+
+        """
+        with self._cache_lock:
+            for key in list(self._cache):
+                if (
+                    (service is None or key[0] == service)
+                    and (layer is None or key[1] == layer)
+                    and (environment is None or key[2] == environment)
+                ):
+                    del self._cache[key]
+
+    def _fetch_secrets(self, requests: list[tuple[str, str, str]]) -> dict[str, dict]:
+        """
+        Fetch and decode secrets from K8s (Kubernetes API client, else one kubectl call).
+
+        Args:
+        ----
+            requests: (service, layer, environment) tuples to fetch secrets for
+
+        Returns:
+        -------
+            Secret name -> decoded credentials
 
-        LOGGER.debug(
-            f"Fetching K8s secret: {secret_name} " f"(namespace: {self._namespace}, environment: {environment})"
-        )
+        Raises:
+        ------
+            KStackServiceNotFoundError: If any secret is not found
+            KStackConfigurationError: If any secret is malformed
 
-        # Get secret from K8s
+        """
+        # secret name -> the requests it serves (for error messages)
+        by_name: dict[str, list[tuple[str, str, str]]] = {}
+        for service, layer, environment in requests:
+            by_name.setdefault(_secret_name(service, layer), []).append((service, layer, environment))
+        secret_names = list(by_name)
+        LOGGER.debug("Fetching K8s secrets: %s (namespace: %s)", ", ".join(secret_names), self._namespace)
+
+        api = _k8s_core_api()
+        if api is not None:
+            return {
+                name: self._decode_secret(name, self._read_secret(api, name, by_name[name]), by_name[name])
+                for name in secret_names
+            }
+
+        # Get secrets from K8s
         try:
+            # Raw bytes: the JSON parser takes them directly, skipping a str decode
             result = run_command(
-                [
-                    "kubectl",
-                    "get",
-                    "secret",
-                    secret_name,
-                    "-n",
-                    self._namespace,
-                    "-o",
-                    "json",
-                ],
+                ["kubectl", "get", "secret", *secret_names, "-n", self._namespace, "-o", "json"],
                 check=True,
+                binary=True,
             )
         except subprocess.CalledProcessError as e:
-            if "NotFound" in str(e.stderr):
+            stderr = e.stderr.decode(errors="replace") if isinstance(e.stderr, bytes) else str(e.stderr)
+            if "NotFound" in stderr:
                 raise KStackServiceNotFoundError(  # noqa: B904
-                    f"K8s secret not found: {secret_name} in namespace {self._namespace}\n"
-                    f"Service: {service}, Layer: {layer}, Environment: {environment}"
+                    f"K8s secret not found: {', '.join(secret_names)} in namespace {self._namespace}\n"
+                    f"{_describe_requests(requests)}\n"
+                    f"Error: {stderr}"
                 )
-            raise KStackConfigurationError(f"Failed to fetch K8s secret: {secret_name}\n" f"Error: {e.stderr}") from e
-
-        # Parse secret data
-        import json
+            raise KStackConfigurationError(
+                f"Failed to fetch K8s secret: {', '.join(secret_names)}\n" f"Error: {stderr}"
+            ) from e
 
+        # Parse secret data (orjson when installed)
         try:
-            secret_data = json.loads(result.stdout)
-            data = secret_data.get("data", {})
+            payload = loads(result.stdout)
         except json.JSONDecodeError as e:
-            raise KStackConfigurationError(f"Failed to parse K8s secret JSON: {secret_name}\n" f"Error: {e}") from e
+            raise KStackConfigurationError(
+                f"Failed to parse K8s secret JSON: {', '.join(secret_names)}\n" f"Error: {e}"
+            ) from e
+
+        # kubectl returns the Secret itself for one name and a List of Secrets for several
+        if len(secret_names) == 1:
+            secrets = {secret_names[0]: payload}
+        else:
+            secrets = {item.get("metadata", {}).get("name"): item for item in payload.get("items", [])}
+
+        return {name: self._decode_secret(name, secrets.get(name), by_name[name]) for name in secret_names}
+
+    def _read_secret(self, api: Any, secret_name: str, requests: list[tuple[str, str, str]]) -> dict:
+        """
+        Read one secret through the Kubernetes API client.
+
+        Args:
+        ----
+            api: CoreV1Api from _k8s_core_api()
+            secret_name: Secret name
+            requests: (service, layer, environment) tuples served by the secret (for error messages)
+
+        Returns:
+        -------
+            Secret in kubectl JSON shape ({"data": {...}})
+
+        Raises:
+        ------
+            KStackServiceNotFoundError: If secret not found
+            KStackConfigurationError: If the API call fails
+
+        """
+        from kubernetes.client.exceptions import ApiException
+
+        try:
+            secret = api.read_namespaced_secret(secret_name, self._namespace)
+        except ApiException as e:
+            if e.status == 404:
+                raise KStackServiceNotFoundError(  # noqa: B904
+                    f"K8s secret not found: {secret_name} in namespace {self._namespace}\n"
+                    f"{_describe_requests(requests)}"
+                )
+            raise KStackConfigurationError(f"Failed to fetch K8s secret: {secret_name}\n" f"Error: {e}") from e
+        return {"data": secret.data or {}}
+
+    def _decode_secret(self, secret_name: str, secret: dict | None, requests: list[tuple[str, str, str]]) -> dict:
+        """
+        Decode the base64 values of one K8s secret.
+
+        Args:
+        ----
+            secret_name: Secret name (for error messages)
+            secret: Secret object from kubectl JSON output (None if it was not returned)
+            requests: (service, layer, environment) tuples served by the secret (for error messages)
+
+        Returns:
+        -------
+            Dictionary of decoded credential values
+
+        Raises:
+        ------
+            KStackServiceNotFoundError: If the secret was not returned
+            KStackConfigurationError: If the secret is empty or malformed
+
+        """
+        if secret is None:
+            raise KStackServiceNotFoundError(
+                f"K8s secret not found: {secret_name} in namespace {self._namespace}\n"
+                f"{_describe_requests(requests)}"
+            )
 
         # Decode base64 values and build credentials dict
-        credentials = {}
-        for key, encoded_value in data.items():
-            try:
-                decoded_value = base64.b64decode(encoded_value).decode("utf-8")
-                credentials[key] = decoded_value
-            except Exception as e:
-                LOGGER.warning(f"Failed to decode secret key '{key}': {e}")
-                continue
+        data = secret.get("data") or {}
+        try:
+            credentials = {key: base64.b64decode(value).decode("utf-8") for key, value in data.items()}
+        except (ValueError, TypeError):  # binascii.Error / UnicodeDecodeError: redo per key to skip bad ones
+            credentials = {}
+            for key, encoded_value in data.items():
+                try:
+                    credentials[key] = base64.b64decode(encoded_value).decode("utf-8")
+                except Exception as e:
+                    LOGGER.warning("Failed to decode secret key '%s': %s", key, e)
 
         if not credentials:
             raise KStackConfigurationError(
                 f"K8s secret {secret_name} is empty or malformed\n" f"Expected base64-encoded credential keys"
             )
 
-        LOGGER.debug(
-            f"Loaded credentials for {service} from K8s secret: {secret_name} "
-            f"(keys: {', '.join(credentials.keys())})"
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Loaded credentials from K8s secret: %s (keys: %s)", secret_name, ", ".join(credentials))
 
         return credentials
 
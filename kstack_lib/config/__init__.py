@@ -1,31 +1,64 @@
 """KStack configuration management."""
 
-from kstack_lib.config.cluster import KStackClusterConfig, get_active_environment
-from kstack_lib.config.configmap import ConfigMap
-from kstack_lib.config.loaders import (
-    ConfigurationError,
-    get_cloud_provider,
-    load_cloud_credentials,
-    load_environment_config,
-    load_provider_config,
-)
-from kstack_lib.config.schemas import (
-    CloudCredentials,
-    EnvironmentConfig,
-    ProviderConfig,
-    ProviderCredentials,
-    ProviderFamily,
-    ProviderImplementation,
-    ServiceConfig,
-)
-from kstack_lib.config.secrets import SecretsProvider, load_secrets_for_layer
-from kstack_lib.types import (
-    KStackEnvironment,
-    KStackLayer,
-    KStackLocalStackService,
-    KStackRedisDatabase,
-    LayerChoice,
-)
+from typing import TYPE_CHECKING
+
+from kstack_lib.any._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kstack_lib.config.cluster import KStackClusterConfig, get_active_environment
+    from kstack_lib.config.configmap import ConfigMap
+    from kstack_lib.config.loaders import (
+        ConfigurationError,
+        get_cloud_provider,
+        load_cloud_credentials,
+        load_environment_config,
+        load_provider_config,
+    )
+    from kstack_lib.config.schemas import (
+        CloudCredentials,
+        EnvironmentConfig,
+        ProviderConfig,
+        ProviderCredentials,
+        ProviderFamily,
+        ProviderImplementation,
+        ServiceConfig,
+    )
+    from kstack_lib.config.secrets import SecretsProvider, load_secrets_for_layer
+    from kstack_lib.types import (
+        KStackEnvironment,
+        KStackLayer,
+        KStackLocalStackService,
+        KStackRedisDatabase,
+        LayerChoice,
+    )
+
+# Exports resolved on first access (PEP 562): `from kstack_lib.config import KStackLayer`
+# doesn't pull in pydantic, YAML and the ConfigMap/secrets machinery.
+# name -> module that defines it
+_LAZY_EXPORTS = {
+    "ConfigMap": "kstack_lib.config.configmap",
+    "KStackLayer": "kstack_lib.types",
+    "KStackEnvironment": "kstack_lib.types",
+    "LayerChoice": "kstack_lib.types",
+    "KStackRedisDatabase": "kstack_lib.types",
+    "KStackLocalStackService": "kstack_lib.types",
+    "SecretsProvider": "kstack_lib.config.secrets",
+    "load_secrets_for_layer": "kstack_lib.config.secrets",
+    "CloudCredentials": "kstack_lib.config.schemas",
+    "EnvironmentConfig": "kstack_lib.config.schemas",
+    "ProviderConfig": "kstack_lib.config.schemas",
+    "ProviderCredentials": "kstack_lib.config.schemas",
+    "ProviderFamily": "kstack_lib.config.schemas",
+    "ProviderImplementation": "kstack_lib.config.schemas",
+    "ServiceConfig": "kstack_lib.config.schemas",
+    "ConfigurationError": "kstack_lib.config.loaders",
+    "get_cloud_provider": "kstack_lib.config.loaders",
+    "load_cloud_credentials": "kstack_lib.config.loaders",
+    "load_environment_config": "kstack_lib.config.loaders",
+    "load_provider_config": "kstack_lib.config.loaders",
+    "KStackClusterConfig": "kstack_lib.config.cluster",
+    "get_active_environment": "kstack_lib.config.cluster",
+}
 
 __all__ = [
     "ConfigMap",
@@ -53,3 +86,6 @@ __all__ = [
     "KStackClusterConfig",
     "get_active_environment",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
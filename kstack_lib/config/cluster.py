@@ -5,15 +5,107 @@ Provides KStackClusterConfig for detecting the active environment,
 whether running in-cluster (Kubernetes) or outside (dev machine).
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-import yaml
 from partsnap_logger.logging import psnap_get_logger
 
+from kstack_lib.any._yaml import safe_load
 from kstack_lib.types import KStackEnvironment
 
 LOGGER = psnap_get_logger("kstack_lib.config.cluster")
 
+# Parsed .kstack.yaml files: path -> (st_mtime_ns, contents); re-read when the file changes
+_PARSED_KSTACK_YAML: dict[Path, tuple[int, dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=8)
+def _find_kstack_yaml_from(start: str) -> Path | None:
+    """
+    Find .kstack.yaml by searching up from start (cached per start directory).
+
+    Walks plain string paths with os.path; a Path is only built for the match.
+
+    Args:
+    ----
+        start: Directory to start from (normally the current working directory)
+
+    Returns:
+    -------
+        Path to .kstack.yaml or None if not found
+
+    """
+    current = start
+
+    # Search up to 10 levels (generous limit)
+    for _ in range(10):
+        config_file = os.path.join(current, ".kstack.yaml")
+
+        if os.path.isfile(config_file):
+            LOGGER.debug("Found .kstack.yaml at: %s", config_file)
+            return Path(config_file)
+
+        # Move up one directory
+        parent = os.path.dirname(current)
+        if parent == current:
+            # Reached filesystem root
+            break
+        current = parent
+
+    LOGGER.warning("Could not find .kstack.yaml in directory tree")
+    return None
+
+
+def _load_kstack_yaml(config_file: Path) -> dict[str, Any] | None:
+    """
+    Parse a .kstack.yaml file, reusing the cached result while the file is unchanged.
+
+    Args:
+    ----
+        config_file: Path to .kstack.yaml
+
+    Returns:
+    -------
+        Parsed contents (empty dict for an empty file), or None if the file no
+        longer exists; the stale discovery and parse entries are then dropped
+        so the next search starts fresh
+
+    Raises:
+    ------
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+
+    """
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+        cached = _PARSED_KSTACK_YAML.get(config_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(config_file) as f:
+            config = safe_load(f) or {}
+    except FileNotFoundError:
+        LOGGER.debug("Cached .kstack.yaml at %s was removed, searching again", config_file)
+        _PARSED_KSTACK_YAML.pop(config_file, None)
+        _find_kstack_yaml_from.cache_clear()
+        return None
+
+    _PARSED_KSTACK_YAML[config_file] = (mtime_ns, config)
+    return config
+
+
+def clear_cluster_config_cache() -> None:
+    """
+    Forget discovered and parsed .kstack.yaml files and the get_active_environment() result.
+
+    Call after changing directory or creating/removing a .kstack.yaml (e.g. between tests).
+    """
+    _find_kstack_yaml_from.cache_clear()
+    _PARSED_KSTACK_YAML.clear()
+    get_active_environment.cache_clear()
+
 
 class KStackClusterConfig:
     """
@@ -168,15 +260,16 @@ class KStackClusterConfig:
 
         """
         config_file = self._find_kstack_yaml()
-
-        if config_file is None:
-            LOGGER.warning("Could not find .kstack.yaml, defaulting to 'dev'")
-            return "dev"
+        config = None
 
         # If we found a config file, we MUST be able to read it
         try:
-            with open(config_file) as f:
-                config = yaml.safe_load(f) or {}
+            if config_file is not None:
+                config = _load_kstack_yaml(config_file)
+                if config is None:
+                    # Removed since it was found: search again with the stale entry dropped
+                    config_file = self._find_kstack_yaml()
+                    config = _load_kstack_yaml(config_file) if config_file is not None else None
         except Exception as e:
             LOGGER.error(f"Failed to read {config_file}: {e}")
             raise RuntimeError(
@@ -186,6 +279,10 @@ class KStackClusterConfig:
                 f"This is a critical error - please check file permissions and YAML syntax."
             ) from e
 
+        if config is None:
+            LOGGER.warning("Could not find .kstack.yaml, defaulting to 'dev'")
+            return "dev"
+
         env = config.get("environment", "dev")
         LOGGER.info(f"Loaded environment from {config_file}: {env}")
         return env
@@ -194,6 +291,10 @@ class KStackClusterConfig:
         """
         Find .kstack.yaml by searching up directory tree.
 
+        A found file is remembered per working directory (see
+        clear_cluster_config_cache()); misses are not, so a .kstack.yaml
+        created later is still picked up.
+
         Returns
         -------
             Path to .kstack.yaml or None if not found
@@ -207,24 +308,10 @@ class KStackClusterConfig:
             return None
 
         # Start from current working directory
-        current = Path.cwd()
-
-        # Search up to 10 levels (generous limit)
-        for _ in range(10):
-            config_file = current / ".kstack.yaml"
-
-            if config_file.exists():
-                LOGGER.debug(f"Found .kstack.yaml at: {config_file}")
-                return config_file
-
-            # Move up one directory
-            if current.parent == current:
-                # Reached filesystem root
-                break
-            current = current.parent
-
-        LOGGER.warning("Could not find .kstack.yaml in directory tree")
-        return None
+        config_file = _find_kstack_yaml_from(os.getcwd())
+        if config_file is None:
+            _find_kstack_yaml_from.cache_clear()  # Don't remember misses
+        return config_file
 
     def get_environment_enum(self) -> KStackEnvironment:
         """
@@ -246,12 +333,14 @@ class KStackClusterConfig:
         return f"KStackClusterConfig(environment='{self.environment}', " f"in_cluster={self.is_in_cluster})"
 
 
+@lru_cache(maxsize=1)
 def get_active_environment() -> str:
     """
     Get the currently active environment.
 
     This is a convenience function that creates a KStackClusterConfig
-    and returns the detected environment.
+    and returns the detected environment. The result is cached for the
+    process; call clear_cluster_config_cache() to detect it again.
 
     Returns:
     -------
@@ -5,12 +5,204 @@ Provides a clean API for accessing layer-specific ConfigMaps with automatic
 namespace detection when running in Kubernetes.
 """
 
+import json
 import os
 import subprocess
+import threading
+import time
+import weakref
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
 
+from partsnap_logger.logging import psnap_get_logger
+
+from kstack_lib.any._json import loads
 from kstack_lib.types import KStackEnvironment, KStackLayer
 
+LOGGER = psnap_get_logger("kstack_lib.config.configmap")
+
+# Default lifetime (seconds) of cached ConfigMap reads
+DEFAULT_CACHE_TTL = 5.0
+
+# Reconnect backoff bounds (seconds) for the ConfigMap watch stream
+_WATCH_BACKOFF_INITIAL = 1.0
+_WATCH_BACKOFF_MAX = 30.0
+
+
+def _normalize(value: str | None) -> str | None:
+    """Return a ConfigMap value the way every read path reports it: stripped, '' as None."""
+    return (value.strip() or None) if value else None
+
+
+class _ConfigMapWatcher:
+    """
+    Keeps a warm in-memory copy of a namespace's ConfigMaps.
+
+    Runs ``kubectl get configmaps --watch`` in a daemon thread and applies the
+    ADDED/MODIFIED/DELETED events to ``store`` so reads never leave the process.
+    The stream is restarted with exponential backoff when kubectl exits; each
+    (re)connect starts from an empty store, since kubectl re-lists every
+    ConfigMap as ADDED and deletions missed while disconnected are not replayed.
+    """
+
+    def __init__(self, namespace: str, label_selector: str | None = None):
+        """
+        Initialize the watcher (does not start it).
+
+        Args:
+        ----
+            namespace: Namespace whose ConfigMaps are watched
+            label_selector: Optional label selector to scope the watch
+
+        """
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.store: dict[str, dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._proc: subprocess.Popen | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start the watch thread (idempotent; a stopped watcher stays stopped)."""
+        with self._lock:
+            if self._thread is not None or self._stopped.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"kstack-configmap-watch-{self.namespace}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """
+        Stop the watch thread and terminate the kubectl child process.
+
+        Args:
+        ----
+            timeout: Seconds to wait for the thread to exit (None waits forever)
+
+        """
+        self._stopped.set()
+        with self._lock:
+            proc, thread = self._proc, self._thread
+            self.store.clear()
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def get(self, configmap_name: str) -> dict[str, str] | None:
+        """Return the cached data of a ConfigMap, or None if not seen yet."""
+        with self._lock:
+            return self.store.get(configmap_name)
+
+    def apply_event(self, event: dict[str, Any]) -> None:
+        """
+        Apply a single watch event to the store.
+
+        Args:
+        ----
+            event: Watch event ({"type": ..., "object": {...}})
+
+        """
+        obj = event.get("object") or {}
+        name = obj.get("metadata", {}).get("name")
+        if not name:
+            return
+
+        with self._lock:
+            if event.get("type") == "DELETED":
+                self.store.pop(name, None)
+            else:
+                self.store[name] = dict(obj.get("data") or {})
+
+    def _command(self) -> list[str]:
+        """Build the kubectl watch command."""
+        cmd = [
+            "kubectl",
+            "get",
+            "configmaps",
+            "-n",
+            self.namespace,
+            "--watch",
+            "--output-watch-events",
+            "-o",
+            "json",
+        ]
+        if self.label_selector:
+            cmd.extend(["-l", self.label_selector])
+        return cmd
+
+    def _run(self) -> None:
+        """Consume the watch stream until stopped, reconnecting with backoff."""
+        backoff = _WATCH_BACKOFF_INITIAL
+        while not self._stopped.is_set():
+            try:
+                with subprocess.Popen(
+                    self._command(),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                ) as proc:
+                    with self._lock:
+                        self._proc = proc
+                        # Fresh list: drop ConfigMaps that may have been deleted while disconnected
+                        self.store.clear()
+                    if self._stopped.is_set():  # stop() ran before the child was recorded
+                        proc.terminate()
+                    assert proc.stdout is not None
+                    if self._consume(proc.stdout):
+                        backoff = _WATCH_BACKOFF_INITIAL
+                LOGGER.debug("ConfigMap watch for %s exited with code %s", self.namespace, proc.returncode)
+            except FileNotFoundError as e:
+                # No kubectl binary (e.g. outside a cluster): retrying can't help, reads fall back to kubectl
+                LOGGER.warning("ConfigMap watch for %s disabled, kubectl not found: %s", self.namespace, e)
+                return
+            except (OSError, subprocess.SubprocessError) as e:
+                LOGGER.warning("ConfigMap watch for %s failed: %s", self.namespace, e)
+            finally:
+                with self._lock:
+                    self._proc = None
+
+            if self._stopped.wait(backoff):
+                return
+            LOGGER.debug("Reconnecting ConfigMap watch for %s after %.0fs", self.namespace, backoff)
+            backoff = min(backoff * 2, _WATCH_BACKOFF_MAX)
+
+    def _consume(self, lines: Iterable[str]) -> bool:
+        """
+        Apply the events of a kubectl watch stream to the store.
+
+        Args:
+        ----
+            lines: Output lines of ``kubectl get --watch --output-watch-events -o json``
+
+        Returns:
+        -------
+            True if at least one event was applied
+
+        """
+        applied = False
+        buffer: list[str] = []
+        for line in lines:
+            buffer.append(line)
+            # kubectl pretty-prints each event; a top-level "}" closes it
+            if line.rstrip() != "}":
+                continue
+            document = "".join(buffer)
+            buffer.clear()
+            try:
+                event = loads(document)
+            except json.JSONDecodeError as e:
+                LOGGER.warning("Skipping unparseable ConfigMap watch event in %s: %s", self.namespace, e)
+                continue
+            self.apply_event(event)
+            applied = True
+        return applied
+
 
 class ConfigMap:
     """
@@ -36,7 +228,14 @@ class ConfigMap:
 
     """
 
-    def __init__(self, layer: KStackLayer | None = None, environment: KStackEnvironment | None = None):
+    def __init__(
+        self,
+        layer: KStackLayer | None = None,
+        environment: KStackEnvironment | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        watch: bool = False,
+        label_selector: str | None = None,
+    ):
         """
         Initialize ConfigMap accessor.
 
@@ -46,6 +245,11 @@ class ConfigMap:
                    current layer when running in Kubernetes pod.
             environment: KStack environment (dev, testing, staging, production).
                         If not provided, uses get_active_route() for compatibility.
+            cache_ttl: Seconds a value read by get_value() is reused before
+                      querying the cluster again (0 disables caching).
+            watch: If True, keep ConfigMaps warm with a background watch stream
+                  (started on first get_value()) instead of polling kubectl.
+            label_selector: Optional label selector to scope the watch.
 
         Raises:
         ------
@@ -81,6 +285,15 @@ class ConfigMap:
         self.layer = layer
         self._environment = environment
 
+        # Cache of ConfigMap reads: (configmap_name, key) -> (fetched_at, value)
+        self._ttl = cache_ttl
+        self._cache: dict[tuple[str, str], tuple[float, str | None]] = {}
+
+        # Optional watch-backed store (long-running processes)
+        self._watcher = _ConfigMapWatcher(layer.namespace, label_selector) if watch else None
+        # Terminate the kubectl child if the ConfigMap is dropped or the interpreter exits without close()
+        self._finalizer = weakref.finalize(self, self._watcher.stop) if self._watcher is not None else None
+
     @staticmethod
     def running_in_k8s() -> bool:
         """
@@ -203,30 +416,10 @@ class ConfigMap:
         if route:
             return route
 
-        # 2. Query ConfigMap in layer's namespace
-        try:
-            result = subprocess.run(
-                [
-                    "kubectl",
-                    "get",
-                    "configmap",
-                    "kstack-route",
-                    "-n",
-                    self.layer.namespace,
-                    "-o",
-                    "jsonpath={.data.active-route}",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=5,
-            )
-            route = result.stdout.strip()
-            if route:
-                return route
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            # kubectl not available or ConfigMap doesn't exist
-            pass
+        # 2. Query ConfigMap in layer's namespace (cached)
+        route = self.get_value("kstack-route", "active-route")
+        if route:
+            return route
 
         # 3. Fall back to development
         return "development"
@@ -270,11 +463,17 @@ class ConfigMap:
 
         # Also update environment variable for current process
         os.environ["KSTACK_ROUTE"] = route_name
+        self.invalidate("kstack-route", "active-route")
 
     def get_value(self, configmap_name: str, key: str) -> str | None:
         """
         Get a value from any ConfigMap in this layer's namespace.
 
+        Values are cached for ``cache_ttl`` seconds so repeated lookups of the
+        same key do not each pay a kubectl round-trip. With ``watch=True`` the
+        value is served from the watch-backed store, falling back to a direct
+        read for ConfigMaps the watch has not delivered yet.
+
         Args:
         ----
             configmap_name: Name of the ConfigMap
@@ -290,6 +489,101 @@ class ConfigMap:
             >>> instance = cfg.get_value('localstack-proxy-config', 'active-instance')
             'development'
 
+        """
+        if self._watcher is not None:
+            self._watcher.start()
+            data = self._watcher.get(configmap_name)
+            if data is not None:
+                return _normalize(data.get(key))
+
+        cache_key = (configmap_name, key)
+        cached = self._cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._ttl:
+            return cached[1]
+
+        value = self._fetch_value(configmap_name, key)
+        if self._ttl > 0:
+            self._cache[cache_key] = (time.monotonic(), value)
+        return value
+
+    def get_values(self, configmap_names: Iterable[str]) -> dict[str, dict[str, str]]:
+        """
+        Get the data of several ConfigMaps with a single kubectl call.
+
+        Every returned key also populates the get_value() cache, so reading
+        individual keys afterwards does not hit the cluster again.
+
+        Args:
+        ----
+            configmap_names: Names of the ConfigMaps to read
+
+        Returns:
+        -------
+            Mapping of ConfigMap name to its data ({} if missing or unreadable)
+
+        Example:
+        -------
+            >>> cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA)
+            >>> maps = cfg.get_values(["kstack-route", "localstack-proxy-config"])
+            >>> maps["kstack-route"].get("active-route")
+            'development'
+
+        """
+        names = list(dict.fromkeys(configmap_names))
+        values: dict[str, dict[str, str]] = {name: {} for name in names}
+        if not names:
+            return values
+
+        try:
+            result = subprocess.run(
+                [
+                    "kubectl",
+                    "get",
+                    "configmap",
+                    *names,
+                    "-n",
+                    self.layer.namespace,
+                    "--ignore-not-found",
+                    "-o",
+                    "json",
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=5,
+            )
+            payload = loads(result.stdout) if result.stdout.strip() else {}
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
+            return values
+
+        # A single name yields the object itself, several names yield a List
+        items = payload.get("items", [payload] if payload else [])
+        now = time.monotonic()
+        for item in items:
+            name = item.get("metadata", {}).get("name")
+            if name not in values:
+                continue
+            data = dict(item.get("data") or {})
+            values[name] = data
+            if self._ttl > 0:
+                for key, value in data.items():
+                    self._cache[(name, key)] = (now, _normalize(value))
+
+        return values
+
+    def _fetch_value(self, configmap_name: str, key: str) -> str | None:
+        """
+        Read a value from a ConfigMap via kubectl (uncached).
+
+        Args:
+        ----
+            configmap_name: Name of the ConfigMap
+            key: Key to retrieve from ConfigMap data
+
+        Returns:
+        -------
+            Value for the key, or None if not found
+
         """
         try:
             result = subprocess.run(
@@ -308,10 +602,48 @@ class ConfigMap:
                 check=True,
                 timeout=5,
             )
-            return result.stdout.strip() or None
+            return _normalize(result.stdout)
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
             return None
 
+    def invalidate(self, configmap_name: str | None = None, key: str | None = None) -> None:
+        """
+        Drop cached ConfigMap values.
+
+        Args:
+        ----
+            configmap_name: Only drop entries for this ConfigMap (default: all)
+            key: Only drop this key within configmap_name (default: all keys)
+
+        Example:
+        -------
+            >>> cfg.invalidate()  # Forget everything
+            >>> cfg.invalidate("kstack-route", "active-route")
+
+        """
+        if configmap_name is None:
+            self._cache.clear()
+            return
+
+        for cache_key in list(self._cache):
+            if cache_key[0] == configmap_name and (key is None or cache_key[1] == key):
+                del self._cache[cache_key]
+
+    def close(self) -> None:
+        """Stop the background watch stream, if any (reads then go to kubectl again)."""
+        if self._finalizer is not None:
+            self._finalizer()  # Runs watcher.stop() once and disarms the finalizer
+            self._finalizer = None
+        self._watcher = None
+
+    def __enter__(self) -> "ConfigMap":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit: stop the watch stream."""
+        self.close()
+
     def __repr__(self) -> str:
         """Return string representation of ConfigMap accessor."""
         return (
@@ -10,14 +10,14 @@ Features:
 - Template variable resolution (e.g., {{layer.namespace}})
 - Validation via Pydantic models
 - Integration with ConfigMap for layer/environment context
+- Parsed files cached until they change on disk (see clear_config_cache())
 """
 
 import re
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from kstack_lib.any._yaml import safe_load
 from kstack_lib.config.configmap import ConfigMap
 from kstack_lib.config.schemas import (
     CloudCredentials,
@@ -33,6 +33,48 @@ class ConfigurationError(Exception):
     pass
 
 
+# Parsed YAML per file: path -> (st_mtime_ns, data). Every provider creation reads the
+# same environment, provider and credentials files, so re-parse only when one changes.
+_PARSED_FILES: dict[Path, tuple[int, Any]] = {}
+
+
+def _read_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the cached result while the file is unchanged.
+
+    Args:
+    ----
+        path: File to read
+
+    Returns:
+    -------
+        Parsed YAML contents (shared; callers must not mutate it)
+
+    Raises:
+    ------
+        ConfigurationError: If the file cannot be read or parsed
+
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+        cached = _PARSED_FILES.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(path) as f:
+            data = safe_load(f)
+    except Exception as e:
+        raise ConfigurationError(f"Failed to parse {path}: {e}")  # noqa: B904
+
+    _PARSED_FILES[path] = (mtime_ns, data)
+    return data
+
+
+def clear_config_cache() -> None:
+    """Forget all parsed configuration and credentials files (next load re-reads them)."""
+    _PARSED_FILES.clear()
+
+
 def _resolve_template_variables(value: str, context: dict[str, Any]) -> str:
     """
     Resolve template variables in a string.
@@ -145,11 +187,7 @@ def load_environment_config(environment: KStackEnvironment, config_dir: Path | N
             f"Available files: {list(config_dir.glob('*.yaml'))}"
         )
 
-    try:
-        with open(config_file) as f:
-            data = yaml.safe_load(f)
-    except Exception as e:
-        raise ConfigurationError(f"Failed to parse {config_file}: {e}")  # noqa: B904
+    data = _read_yaml(config_file)
 
     try:
         return EnvironmentConfig(**data)
@@ -196,11 +234,7 @@ def load_provider_config(
             f"Available providers: {list(config_dir.glob('*.yaml'))}"
         )
 
-    try:
-        with open(config_file) as f:
-            raw_data = yaml.safe_load(f)
-    except Exception as e:
-        raise ConfigurationError(f"Failed to parse {config_file}: {e}")  # noqa: B904
+    raw_data = _read_yaml(config_file)
 
     # Template variable context
     context = {
@@ -284,11 +318,7 @@ def load_cloud_credentials(
                 f"Cloud credentials not found: {creds_file}\n" f"Vault directory: {vault_layer_dir}\n"
             )
 
-    try:
-        with open(creds_file) as f:
-            data = yaml.safe_load(f)
-    except Exception as e:
-        raise ConfigurationError(f"Failed to parse {creds_file}: {e}")  # noqa: B904
+    data = _read_yaml(creds_file)
 
     try:
         return CloudCredentials(**data)
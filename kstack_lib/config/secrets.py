@@ -23,11 +23,10 @@ import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
-import yaml
-
 if TYPE_CHECKING:
     from kstack_lib.config.configmap import ConfigMap
 
+from kstack_lib.any._yaml import safe_load
 from kstack_lib.types import KStackLayer
 
 LayerName = Literal["layer0", "layer1", "layer2", "layer3"]
@@ -156,7 +155,7 @@ class SecretsProvider:
             return {}
 
         with open(vault_file) as f:
-            data = yaml.safe_load(f)
+            data = safe_load(f)
             return data if data else {}
 
     def _can_access_secret(self, source_layer: str, target_layer: str, vault_data: dict[str, Any]) -> bool:
@@ -10,6 +10,7 @@ from pathlib import Path
 import yaml
 from partsnap_logger.logging import psnap_get_logger
 
+from kstack_lib.any._yaml import safe_load
 from kstack_lib.any.exceptions import KStackConfigurationError
 from kstack_lib.local._guards import _enforce_local  # noqa: F401 - Import guard
 
@@ -21,6 +22,8 @@ class LocalEnvironmentDetector:
     Detects environment from .kstack.yaml file.
 
     Implements the EnvironmentDetector protocol for local development.
+    Resolved values are cached on the instance, so the directory walk and
+    YAML parse happen at most once per detector.
 
     Example:
     -------
@@ -43,6 +46,12 @@ class LocalEnvironmentDetector:
 
         """
         self._project_root = project_root or Path.cwd()
+
+        # Resolved on first successful lookup (failures are not cached)
+        self._environment: str | None = None
+        self._config_root: Path | None = None
+        self._vault_root: Path | None = None
+
         LOGGER.debug(f"Initialized local environment detector: {self._project_root}")
 
     def get_environment(self) -> str:
@@ -58,6 +67,9 @@ class LocalEnvironmentDetector:
             KStackConfigurationError: If .kstack.yaml not found or invalid
 
         """
+        if self._environment is not None:
+            return self._environment
+
         config_file = self._find_kstack_yaml()
 
         if not config_file:
@@ -68,7 +80,7 @@ class LocalEnvironmentDetector:
 
         try:
             with open(config_file) as f:
-                config = yaml.safe_load(f)
+                config = safe_load(f)
 
             if not isinstance(config, dict):
                 raise KStackConfigurationError(f".kstack.yaml must contain a YAML dictionary: {config_file}")
@@ -80,6 +92,7 @@ class LocalEnvironmentDetector:
                 )
 
             LOGGER.debug(f"Detected environment '{environment}' from {config_file}")
+            self._environment = environment
             return environment
 
         except yaml.YAMLError as e:
@@ -100,10 +113,14 @@ class LocalEnvironmentDetector:
             KStackConfigurationError: If config root not found
 
         """
+        if self._config_root is not None:
+            return self._config_root
+
         # Look for environments/ directory (indicator of config root)
         config_root = self._project_root / "environments"
         if config_root.exists():
-            return self._project_root
+            self._config_root = self._project_root
+            return self._config_root
 
         # Try parent directories
         current = self._project_root
@@ -111,6 +128,7 @@ class LocalEnvironmentDetector:
             current = current.parent
             config_root = current / "environments"
             if config_root.exists():
+                self._config_root = current
                 return current
 
         raise KStackConfigurationError(
@@ -131,9 +149,13 @@ class LocalEnvironmentDetector:
             KStackConfigurationError: If vault root not found
 
         """
+        if self._vault_root is not None:
+            return self._vault_root
+
         # Try current directory first
         vault_root = self._project_root / "vault"
         if vault_root.exists():
+            self._vault_root = vault_root
             return vault_root
 
         # Try parent directories
@@ -142,6 +164,7 @@ class LocalEnvironmentDetector:
             current = current.parent
             vault_root = current / "vault"
             if vault_root.exists():
+                self._vault_root = vault_root
                 return vault_root
 
         raise KStackConfigurationError(
@@ -5,9 +5,12 @@ This adapter implements the SecretsProvider protocol using the local vault.
 It will raise KStackEnvironmentError if imported in-cluster.
 """
 
-import yaml
+from pathlib import Path
+from typing import Any
+
 from partsnap_logger.logging import psnap_get_logger
 
+from kstack_lib.any._yaml import safe_load
 from kstack_lib.any.exceptions import KStackConfigurationError, KStackServiceNotFoundError
 from kstack_lib.local._guards import _enforce_local  # noqa: F401 - Import guard
 from kstack_lib.local.security.vault import KStackVault
@@ -20,6 +23,8 @@ class LocalCredentialsProvider:
     Provides credentials from local partsecrets vault.
 
     Implements the SecretsProvider protocol for local development.
+    Parsed credential files are cached and re-read only when their
+    modification time changes.
 
     Example:
     -------
@@ -45,6 +50,8 @@ class LocalCredentialsProvider:
             raise ValueError("Either vault or environment must be provided")
 
         self._vault = vault or KStackVault(environment=environment)  # type: ignore
+        # credentials file -> (st_mtime_ns, parsed contents)
+        self._files: dict[Path, tuple[int, Any]] = {}
         LOGGER.debug(f"Initialized local credentials provider: {self._vault}")
 
     def get_credentials(self, service: str, layer: str, environment: str) -> dict:
@@ -97,12 +104,7 @@ class LocalCredentialsProvider:
                 f"Expected file: vault/{environment}/{layer}/cloud-credentials.yaml"
             )
 
-        # Load and parse credentials
-        try:
-            with open(creds_file) as f:
-                all_creds = yaml.safe_load(f)
-        except Exception as e:
-            raise KStackConfigurationError(f"Failed to parse credentials file: {creds_file}\n" f"Error: {e}") from e
+        all_creds = self._load_file(creds_file)
 
         # Extract service-specific credentials
         if service not in all_creds:
@@ -114,7 +116,39 @@ class LocalCredentialsProvider:
         service_creds = all_creds[service]
         LOGGER.debug(f"Loaded credentials for {service} from {creds_file}")
 
-        return service_creds
+        # Copy so callers can't mutate the cached file contents
+        return dict(service_creds) if isinstance(service_creds, dict) else service_creds
+
+    def _load_file(self, creds_file: Path) -> Any:
+        """
+        Parse a credentials file, reusing the cached result while it is unchanged.
+
+        Args:
+        ----
+            creds_file: Path to cloud-credentials.yaml
+
+        Returns:
+        -------
+            Parsed YAML contents
+
+        Raises:
+        ------
+            KStackConfigurationError: If the file cannot be read or parsed
+
+        """
+        try:
+            mtime_ns = creds_file.stat().st_mtime_ns
+            cached = self._files.get(creds_file)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+
+            with open(creds_file) as f:
+                all_creds = safe_load(f)
+        except Exception as e:
+            raise KStackConfigurationError(f"Failed to parse credentials file: {creds_file}\n" f"Error: {e}") from e
+
+        self._files[creds_file] = (mtime_ns, all_creds)
+        return all_creds
 
     def __repr__(self) -> str:
         """Return string representation."""
@@ -5,6 +5,7 @@ This module is LOCAL-ONLY and will raise KStackEnvironmentError if imported in-c
 Vaults do not exist in production - secrets come from Kubernetes Secret Manager.
 """
 
+import os
 from collections.abc import Iterator
 from pathlib import Path
 
@@ -16,6 +17,12 @@ from kstack_lib.local._guards import _enforce_local  # noqa: F401 - Import guard
 
 LOGGER = psnap_get_logger("kstack_lib.local.security.vault")
 
+# Prefix partsecrets gives encrypted files; the decrypted copy drops it
+_SECRET_PREFIX = "secret."
+
+# partsecrets metadata (e.g. secret.map.cfg lists which files to encrypt); never encrypted itself
+_METADATA_SUFFIXES = frozenset({".cfg", ".conf", ".config"})
+
 
 def get_vault_root() -> Path:
     """
@@ -112,20 +119,22 @@ class KStackVault:
         In partsecrets, all files are encrypted/decrypted together.
 
         Note: Skips metadata files like secret.map.cfg which are not encrypted.
+        Counterparts are looked up in each directory's listing, so no file is
+        opened or stat()ed individually.
         """
-        for secret_file in self.path.rglob("secret.*"):
-            # Skip metadata files (partsecrets configuration)
-            # secret.map.cfg tells partsecrets which files to encrypt, it's not encrypted itself
-            if secret_file.suffix in {".cfg", ".conf", ".config"}:
-                continue
-
-            # Get decrypted filename by removing "secret." prefix
-            decrypted_name = secret_file.name.replace("secret.", "", 1)
-            decrypted_file = secret_file.parent / decrypted_name
-
-            if not decrypted_file.exists():
-                LOGGER.debug(f"Vault is encrypted: {secret_file.name} has no decrypted counterpart")
-                return True
+        for dirpath, _dirnames, filenames in os.walk(self.path):
+            names = set(filenames)
+            for name in filenames:
+                if not name.startswith(_SECRET_PREFIX):
+                    continue
+                # Skip metadata files (partsecrets configuration)
+                if os.path.splitext(name)[1] in _METADATA_SUFFIXES:
+                    continue
+
+                # Decrypted filename is the name without the "secret." prefix
+                if name[len(_SECRET_PREFIX) :] not in names:
+                    LOGGER.debug("Vault is encrypted: %s has no decrypted counterpart (in %s)", name, dirpath)
+                    return True
 
         LOGGER.debug("Vault is decrypted: all secret.* files have decrypted counterparts")
         return False
@@ -4,9 +4,18 @@ KStack type definitions (enums and type classes).
 This module re-exports types from kstack_lib.any.types for backward compatibility.
 """
 
-from kstack_lib.any.types.environments import KStackEnvironment
-from kstack_lib.any.types.layers import KStackLayer, LayerChoice
-from kstack_lib.any.types.services import KStackLocalStackService, KStackRedisDatabase
+from typing import TYPE_CHECKING
+
+from kstack_lib.any._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kstack_lib.any.types import (
+        KStackEnvironment,
+        KStackLayer,
+        KStackLocalStackService,
+        KStackRedisDatabase,
+        LayerChoice,
+    )
 
 __all__ = [
     "KStackLayer",
@@ -15,3 +24,8 @@ __all__ = [
     "KStackRedisDatabase",
     "KStackLocalStackService",
 ]
+
+# Re-exports resolved on first access (PEP 562): name -> module that defines it
+_LAZY_EXPORTS = dict.fromkeys(__all__, "kstack_lib.any.types")
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -1,17 +1,27 @@
 """Tests for Boto3SessionFactory."""
 
+import asyncio
 import sys
-from unittest.mock import MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-from kstack_lib.any.cloud_sessions import Boto3SessionFactory
+from kstack_lib.any.cloud_sessions import AsyncClientHolder, Boto3SessionFactory, preload_boto3
 from kstack_lib.any.exceptions import KStackConfigurationError
 
 
 class TestBoto3SessionFactory:
     """Test Boto3SessionFactory class."""
 
+    @pytest.fixture(autouse=True)
+    def reset_module_cache(self):
+        """Forget the cached boto3/aioboto3 modules so each test sees its own mocks."""
+        Boto3SessionFactory._boto3 = None
+        Boto3SessionFactory._aioboto3 = None
+        yield
+        Boto3SessionFactory._boto3 = None
+        Boto3SessionFactory._aioboto3 = None
+
     @pytest.fixture
     def mock_secrets_provider(self):
         """Create a mock secrets provider."""
@@ -53,6 +63,13 @@ class TestBoto3SessionFactory:
 
         assert factory._secrets == mock_secrets_provider
 
+    def test_slots(self, factory):
+        """Test instances are slotted (no per-instance __dict__)."""
+        assert not hasattr(factory, "__dict__")
+
+        with pytest.raises(AttributeError):
+            factory.unexpected = True
+
     def test_create_session_success(self, factory, mock_secrets_provider, mock_boto3):
         """Test successful boto3 session creation."""
         mock_session = MagicMock()
@@ -91,6 +108,226 @@ class TestBoto3SessionFactory:
 
         assert result == mock_session
 
+    def test_create_session_imports_boto3_once(self, factory, mock_boto3):
+        """Test boto3 module reference is cached on the class after first use."""
+        factory.create_session("s3", "layer3", "dev")
+
+        assert Boto3SessionFactory._boto3 is mock_boto3
+
+        # Later sessions reuse the cached module even if sys.modules changes
+        del sys.modules["boto3"]
+        factory.create_session("sqs", "layer3", "dev")
+        assert mock_boto3.Session.call_count == 2
+
+    def test_create_async_session_imports_aioboto3_once(self, factory, mock_aioboto3):
+        """Test aioboto3 module reference is cached on the class after first use."""
+        factory.create_async_session("s3", "layer3", "dev")
+
+        assert Boto3SessionFactory._aioboto3 is mock_aioboto3
+
+        del sys.modules["aioboto3"]
+        factory.create_async_session("sqs", "layer3", "dev")
+        assert mock_aioboto3.Session.call_count == 2
+
+    def test_credentials_cached_per_key(self, factory, mock_secrets_provider, mock_boto3):
+        """Test credentials are fetched once per (service, layer, environment)."""
+        factory.create_session("s3", "layer3", "dev")
+        factory.create_session("s3", "layer3", "dev")
+        factory.create_session("sqs", "layer3", "dev")
+
+        assert mock_secrets_provider.get_credentials.call_count == 2
+
+    def test_sessions_cached_per_key(self, factory, mock_boto3, mock_aioboto3):
+        """Test sessions are reused per (library, service, layer, environment)."""
+        mock_boto3.Session.side_effect = lambda **kwargs: MagicMock()
+        mock_aioboto3.Session.side_effect = lambda **kwargs: MagicMock()
+
+        first = factory.create_session("s3", "layer3", "dev")
+
+        assert factory.create_session("s3", "layer3", "dev") is first
+        assert factory.create_session("s3", "layer3", "staging") is not first
+        assert factory.create_async_session("s3", "layer3", "dev") is not first
+        assert mock_boto3.Session.call_count == 2
+        assert mock_aioboto3.Session.call_count == 1
+
+    def test_invalidate_rebuilds_session(self, factory, mock_boto3):
+        """Test invalidate drops sessions built from the dropped credentials."""
+        mock_boto3.Session.side_effect = lambda **kwargs: MagicMock()
+
+        first = factory.create_session("s3", "layer3", "dev")
+        factory.invalidate(service="s3")
+
+        assert factory.create_session("s3", "layer3", "dev") is not first
+
+    def test_credentials_cache_disabled(self, mock_secrets_provider, mock_boto3):
+        """Test credentials_ttl=0 fetches credentials on every call."""
+        factory = Boto3SessionFactory(mock_secrets_provider, credentials_ttl=0)
+
+        factory.create_session("s3", "layer3", "dev")
+        factory.create_session("s3", "layer3", "dev")
+
+        assert mock_secrets_provider.get_credentials.call_count == 2
+        assert mock_boto3.Session.call_count == 2
+
+    def test_invalidate_credentials(self, factory, mock_secrets_provider, mock_boto3):
+        """Test invalidate forces credentials to be re-read."""
+        factory.create_session("s3", "layer3", "dev")
+        factory.invalidate("s3", "layer3", "dev")
+        factory.create_session("s3", "layer3", "dev")
+
+        assert mock_secrets_provider.get_credentials.call_count == 2
+
+    def test_cached_credentials_read_only(self, factory):
+        """Test cached credentials cannot be mutated by callers."""
+        creds = factory._get_credentials("s3", "layer3", "dev")
+
+        with pytest.raises(TypeError):
+            creds["aws_access_key_id"] = "tampered"
+
+    def test_session_kwargs_built_once(self, factory, mock_boto3):
+        """Test credentials are validated and unpacked only when a session is built."""
+        with patch.object(Boto3SessionFactory, "_session_kwargs", wraps=factory._session_kwargs) as mock_kwargs:
+            factory.create_session("s3", "layer3", "dev")
+            factory.create_session("s3", "layer3", "dev")
+
+        mock_kwargs.assert_called_once()
+        mock_boto3.Session.assert_called_once_with(
+            aws_access_key_id="test_access_key",
+            aws_secret_access_key="test_secret_key",
+            region_name="us-west-2",
+        )
+
+    def test_create_sessions(self, factory, mock_secrets_provider, mock_boto3):
+        """Test create_sessions fetches each service's credentials once."""
+        mock_boto3.Session.side_effect = lambda **kwargs: MagicMock()
+
+        sessions = factory.create_sessions(["s3", "sqs", "dynamodb", "s3"], "layer3", "dev")
+
+        assert list(sessions) == ["s3", "sqs", "dynamodb"]
+        assert sessions["s3"] is factory.create_session("s3", "layer3", "dev")
+        assert mock_secrets_provider.get_credentials.call_count == 3
+        mock_secrets_provider.get_credentials.assert_any_call("dynamodb", "layer3", "dev")
+
+    def test_create_sessions_propagates_errors(self, factory, mock_secrets_provider, mock_boto3):
+        """Test a failing credential fetch surfaces from create_sessions."""
+        creds = mock_secrets_provider.get_credentials.return_value
+
+        def get_credentials(service, layer, environment):
+            if service == "sqs":
+                raise KStackConfigurationError("no sqs")
+            return creds
+
+        mock_secrets_provider.get_credentials.side_effect = get_credentials
+
+        with pytest.raises(KStackConfigurationError, match="no sqs"):
+            factory.create_sessions(["s3", "sqs"], "layer3", "dev")
+
+    def test_create_client_reused(self, factory, mock_boto3):
+        """Test clients are shared per key and built once per session."""
+        session = MagicMock()
+        session.client.side_effect = lambda *args, **kwargs: MagicMock()
+        mock_boto3.Session.return_value = session
+
+        client = factory.create_client("s3", "layer3", "dev")
+
+        assert factory.create_client("s3", "layer3", "dev") is client
+        assert factory.create_client("s3", "layer3", "dev", use_ssl=False) is not client
+        assert session.client.call_count == 2
+        assert session.client.call_args_list[0].kwargs["endpoint_url"] == "http://localhost:4566"
+
+    def test_create_client_rebuilt_after_invalidate(self, factory, mock_boto3):
+        """Test invalidated credentials also drop the cached client."""
+        mock_boto3.Session.side_effect = lambda **kwargs: MagicMock()
+
+        client = factory.create_client("s3", "layer3", "dev")
+        factory.invalidate("s3", "layer3", "dev")
+
+        client.close.assert_called_once()
+        assert factory.create_client("s3", "layer3", "dev") is not client
+
+    def test_create_client_unhashable_kwargs_not_cached(self, factory, mock_boto3):
+        """Test clients built with unhashable kwargs are created fresh instead of failing."""
+        session = MagicMock()
+        session.client.side_effect = lambda *args, **kwargs: MagicMock()
+        mock_boto3.Session.return_value = session
+
+        first = factory.create_client("s3", "layer3", "dev", extra=["a"])
+        second = factory.create_client("s3", "layer3", "dev", extra=["a"])
+
+        assert first is not second
+        assert session.client.call_count == 2
+
+    def test_get_endpoint_url(self, factory, mock_secrets_provider):
+        """Test endpoint URL comes from the cached credentials."""
+        assert factory.get_endpoint_url("s3", "layer3", "dev") == "http://localhost:4566"
+        assert factory.get_endpoint_url("s3", "layer3", "dev") == "http://localhost:4566"
+        mock_secrets_provider.get_credentials.assert_called_once()
+
+    def test_create_client_endpoint_override(self, factory, mock_boto3, mock_secrets_provider):
+        """Test an explicit endpoint_url wins and no endpoint is passed when unset."""
+        session = mock_boto3.Session.return_value
+
+        factory.create_client("s3", "layer3", "dev", endpoint_url="http://other:4566")
+        assert session.client.call_args.kwargs["endpoint_url"] == "http://other:4566"
+
+        del mock_secrets_provider.get_credentials.return_value["endpoint_url"]
+        factory.invalidate()
+        factory.create_client("s3", "layer3", "dev")
+        assert "endpoint_url" not in session.client.call_args.kwargs
+
+    def test_create_client_pool_config(self, mock_secrets_provider, mock_boto3):
+        """Test clients share one botocore Config built from the factory settings."""
+        factory = Boto3SessionFactory(mock_secrets_provider, max_pool_connections=64, retries={"max_attempts": 5})
+        session = mock_boto3.Session.return_value
+
+        factory.create_client("s3", "layer3", "dev")
+        config = session.client.call_args.kwargs["config"]
+        factory.create_client("sqs", "layer3", "dev")
+
+        assert config.max_pool_connections == 64
+        assert config.retries == {"max_attempts": 5}
+        assert config.tcp_keepalive is True
+        assert session.client.call_args.kwargs["config"] is config
+
+    def test_create_client_explicit_config(self, factory, mock_boto3):
+        """Test a caller-supplied config is passed through unchanged."""
+        session = mock_boto3.Session.return_value
+        config = MagicMock()
+
+        factory.create_client("s3", "layer3", "dev", config=config)
+
+        assert session.client.call_args.kwargs["config"] is config
+
+    @pytest.mark.asyncio
+    async def test_create_async_client_shared(self, factory, mock_aioboto3):
+        """Test async client holders are cached and closed by aclose()."""
+        session = mock_aioboto3.Session.return_value
+        context = session.client.return_value
+        context.__aenter__ = AsyncMock(return_value="s3-client")
+        context.__aexit__ = AsyncMock(return_value=None)
+
+        holder = factory.create_async_client("s3", "layer3", "dev")
+
+        assert factory.create_async_client("s3", "layer3", "dev") is holder
+        assert await holder.client() == "s3-client"
+        session.client.assert_called_once_with("s3", endpoint_url="http://localhost:4566")
+
+        factory.invalidate()
+        assert factory.create_async_client("s3", "layer3", "dev") is not holder
+
+        await factory.aclose()
+        context.__aexit__.assert_awaited_once()
+
+    def test_close_closes_clients(self, factory, mock_boto3):
+        """Test close() closes cached clients and clears caches."""
+        client = factory.create_client("s3", "layer3", "dev")
+
+        factory.close()
+
+        client.close.assert_called_once()
+        assert factory.create_client("s3", "layer3", "dev") is not None
+        assert mock_boto3.Session.call_count == 2
+
     def test_create_session_boto3_not_installed(self, factory):
         """Test error when boto3 is not installed."""
         # Ensure boto3 is not in sys.modules
@@ -299,3 +536,61 @@ class TestBoto3SessionFactory:
         assert captured_kwargs["aws_secret_access_key"] == "test_secret_key"
         assert captured_kwargs["region_name"] == "us-west-2"
         assert len(captured_kwargs) == 3  # No extra parameters
+
+
+class TestAsyncClientHolder:
+    """Test AsyncClientHolder class."""
+
+    @pytest.fixture
+    def session(self):
+        """Create a mock aioboto3 session whose client context counts entries."""
+        session = MagicMock()
+        context = session.client.return_value
+        context.__aenter__ = AsyncMock(side_effect=lambda: MagicMock())
+        context.__aexit__ = AsyncMock(return_value=None)
+        return session
+
+    @pytest.mark.asyncio
+    async def test_client_entered_once(self, session):
+        """Test concurrent callers share one entered client."""
+        holder = AsyncClientHolder(session, "s3", region_name="us-east-1")
+
+        clients = await asyncio.gather(*(holder.client() for _ in range(5)))
+
+        assert all(client is clients[0] for client in clients)
+        session.client.assert_called_once_with("s3", region_name="us-east-1")
+        session.client.return_value.__aenter__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_aclose_exits_and_reopens(self, session):
+        """Test aclose() exits the context and a later call re-enters it."""
+        holder = AsyncClientHolder(session, "s3")
+        first = await holder.client()
+
+        await holder.aclose()
+        await holder.aclose()  # Closing twice is a no-op
+
+        session.client.return_value.__aexit__.assert_awaited_once()
+        assert await holder.client() is not first
+
+
+class TestPreloadBoto3:
+    """Test preload_boto3 helper."""
+
+    def test_preload_imports_in_background(self):
+        """Test boto3 is imported on a daemon thread."""
+        mock = MagicMock()
+        with patch.dict(sys.modules, {"boto3": mock, "botocore": MagicMock(), "botocore.config": MagicMock()}):
+            thread = preload_boto3()
+            thread.join(timeout=5)
+
+        assert thread.daemon
+        assert not thread.is_alive()
+
+    def test_preload_ignores_missing_boto3(self):
+        """Test a missing boto3 doesn't raise from the preload thread."""
+        with patch.dict(sys.modules, {"boto3": None}):
+            thread = preload_boto3()
+            thread.join(timeout=5)
+
+        assert not thread.is_alive()
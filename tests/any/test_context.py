@@ -0,0 +1,54 @@
+"""Tests for kstack_lib.any.context module."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from kstack_lib.any.context import IN_CLUSTER_ENV_VAR, is_in_cluster
+
+
+@pytest.fixture
+def fresh_detection(monkeypatch):
+    """Clear the cached result and any inherited env var around each test."""
+    monkeypatch.delenv(IN_CLUSTER_ENV_VAR, raising=False)
+    is_in_cluster.cache_clear()
+    yield
+    is_in_cluster.cache_clear()
+
+
+@pytest.mark.usefixtures("fresh_detection")
+class TestIsInCluster:
+    """Test is_in_cluster detection."""
+
+    def test_local_when_token_missing(self):
+        """Test missing service account token means local."""
+        with patch("kstack_lib.any.context.os.stat", side_effect=FileNotFoundError):
+            assert is_in_cluster() is False
+
+        assert IN_CLUSTER_ENV_VAR not in os.environ
+
+    def test_cluster_when_token_present(self):
+        """Test present service account token means in-cluster."""
+        with patch("kstack_lib.any.context.os.stat"):
+            assert is_in_cluster() is True
+
+        assert IN_CLUSTER_ENV_VAR not in os.environ
+
+    def test_inherited_env_var_skips_stat(self, monkeypatch):
+        """Test a value exported by a parent process is trusted."""
+        monkeypatch.setenv(IN_CLUSTER_ENV_VAR, "1")
+
+        with patch("kstack_lib.any.context.os.stat") as mock_stat:
+            assert is_in_cluster() is True
+
+        mock_stat.assert_not_called()
+
+    def test_inherited_local_value(self, monkeypatch):
+        """Test an inherited "0" means local without checking the token."""
+        monkeypatch.setenv(IN_CLUSTER_ENV_VAR, "0")
+
+        with patch("kstack_lib.any.context.os.stat") as mock_stat:
+            assert is_in_cluster() is False
+
+        mock_stat.assert_not_called()
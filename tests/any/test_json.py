@@ -0,0 +1,34 @@
+"""Tests for kstack_lib.any._json module."""
+
+import json
+
+import pytest
+
+from kstack_lib.any._json import dumps, loads
+
+
+class TestJsonHelpers:
+    """Test dumps/loads helpers."""
+
+    def test_dumps_returns_bytes(self):
+        """Test dumps produces compact UTF-8 bytes."""
+        data = dumps({"id": 123, "name": "Tëst"})
+
+        assert isinstance(data, bytes)
+        assert json.loads(data) == {"id": 123, "name": "Tëst"}
+        assert b" " not in data
+
+    def test_round_trip(self):
+        """Test loads reverses dumps."""
+        obj = {"preferences": {"theme": "dark", "notifications": True}, "tags": [1, 2]}
+
+        assert loads(dumps(obj)) == obj
+
+    def test_loads_accepts_str(self):
+        """Test loads accepts text as well as bytes."""
+        assert loads('{"kind": "List"}') == {"kind": "List"}
+
+    def test_loads_invalid(self):
+        """Test invalid JSON raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads(b"{not json")
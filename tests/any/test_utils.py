@@ -1,11 +1,11 @@
 """Tests for kstack_lib.any.utils module."""
 
 import subprocess
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from kstack_lib.any.utils import run_command
+from kstack_lib.any.utils import clear_command_cache, close_all, run_command
 
 
 class TestRunCommand:
@@ -140,20 +140,87 @@ class TestRunCommand:
         assert "no env" in result.stdout
 
     @patch("subprocess.run")
-    def test_env_none_uses_os_environ(self, mock_run):
-        """Test that env=None uses os.environ copy."""
-        import os
-
+    def test_env_none_inherits_os_environ(self, mock_run):
+        """Test that env=None lets the child inherit os.environ without a copy."""
         mock_run.return_value = subprocess.CompletedProcess(args=["test"], returncode=0, stdout="", stderr="")
 
         run_command(["test"], env=None)
 
         call_kwargs = mock_run.call_args[1]
-        passed_env = call_kwargs["env"]
+        assert call_kwargs["env"] is None
+
+    @patch("subprocess.run")
+    def test_env_merged_with_os_environ(self, mock_run):
+        """Test that a custom env is layered over os.environ."""
+        import os
+
+        mock_run.return_value = subprocess.CompletedProcess(args=["test"], returncode=0, stdout="", stderr="")
+
+        run_command(["test"], env={"CUSTOM": "added"})
+
+        passed_env = mock_run.call_args[1]["env"]
+        assert passed_env["CUSTOM"] == "added"
+        assert passed_env["PATH"] == os.environ["PATH"]
+
+    @patch("subprocess.run")
+    def test_debug_log_skipped_when_disabled(self, mock_run):
+        """Test the command line is only formatted when DEBUG logging is on."""
+        mock_run.return_value = subprocess.CompletedProcess(args=["test"], returncode=0, stdout="", stderr="")
+
+        with (
+            patch("kstack_lib.any.utils.LOGGER") as mock_logger,
+            patch("kstack_lib.any.utils.shlex.join") as mock_join,
+        ):
+            mock_logger.isEnabledFor.return_value = False
+            run_command(["echo", "hello world"])
+
+            mock_join.assert_not_called()
+            mock_logger.debug.assert_not_called()
+
+            mock_logger.isEnabledFor.return_value = True
+            mock_join.return_value = "echo 'hello world'"
+            run_command(["echo", "hello world"])
+
+            mock_logger.debug.assert_called_once_with("Running command: %s", "echo 'hello world'")
 
-        # Should be a copy of os.environ
-        assert "PATH" in passed_env
-        assert len(passed_env) >= len(os.environ)
+    @patch("subprocess.run")
+    def test_cache_reuses_successful_result(self, mock_run):
+        """Test cache=True runs an identical command only once."""
+        mock_run.return_value = subprocess.CompletedProcess(args=["kubectl"], returncode=0, stdout="ctx", stderr="")
+        clear_command_cache()
+
+        try:
+            first = run_command(["kubectl", "config", "current-context"], cache=True)
+            second = run_command(["kubectl", "config", "current-context"], cache=True)
+            run_command(["kubectl", "config", "current-context"], cache=True, env={"KUBECONFIG": "/tmp/x"})
+        finally:
+            clear_command_cache()
+
+        assert second.stdout == first.stdout == "ctx"
+        assert second is not first
+        assert mock_run.call_count == 2
+
+    @patch("subprocess.run")
+    def test_cache_skips_failures_and_uncached_calls(self, mock_run):
+        """Test failed results are not cached and cache=False always runs."""
+        mock_run.return_value = subprocess.CompletedProcess(args=["false"], returncode=1, stdout="", stderr="")
+        clear_command_cache()
+
+        try:
+            run_command(["false"], check=False, cache=True)
+            run_command(["false"], check=False, cache=True)
+            run_command(["false"], check=False)
+        finally:
+            clear_command_cache()
+
+        assert mock_run.call_count == 3
+
+    def test_binary_output(self):
+        """Test binary=True returns undecoded bytes."""
+        result = run_command(["echo", "raw"], binary=True)
+
+        assert result.stdout == b"raw\n"
+        assert result.stderr == b""
 
     def test_multiline_output(self):
         """Test handling multiline command output."""
@@ -180,3 +247,32 @@ class TestRunCommand:
 
         # subprocess.run should handle string differently (shell mode)
         # Our function expects list format
+
+
+class TestCloseAll:
+    """Test close_all function."""
+
+    def test_closes_every_resource(self):
+        """Test every resource is closed once and objects without close() are skipped."""
+        resources = [MagicMock() for _ in range(3)]
+
+        close_all([*resources, object()])
+
+        for resource in resources:
+            resource.close.assert_called_once_with()
+
+    def test_failure_does_not_stop_others(self):
+        """Test one failing close() is logged and the rest still run."""
+        failing = MagicMock()
+        failing.close.side_effect = OSError("socket already closed")
+        other = MagicMock()
+
+        with patch("kstack_lib.any.utils.LOGGER") as mock_logger:
+            close_all([failing, other])
+
+        other.close.assert_called_once_with()
+        mock_logger.warning.assert_called_once()
+
+    def test_empty(self):
+        """Test closing nothing is a no-op."""
+        close_all([])
@@ -0,0 +1,31 @@
+"""Tests for kstack_lib.any._yaml module."""
+
+import pytest
+import yaml
+
+from kstack_lib.any._yaml import safe_load
+
+
+class TestSafeLoad:
+    """Test safe_load helper."""
+
+    def test_parses_string(self):
+        """Test parsing a YAML string."""
+        assert safe_load("environment: dev\nports: [1, 2]\n") == {"environment": "dev", "ports": [1, 2]}
+
+    def test_parses_file(self, tmp_path):
+        """Test parsing an open file."""
+        config_file = tmp_path / ".kstack.yaml"
+        config_file.write_text("environment: staging\n")
+
+        with open(config_file) as f:
+            assert safe_load(f) == {"environment": "staging"}
+
+    def test_empty_document(self):
+        """Test empty document returns None like yaml.safe_load."""
+        assert safe_load("") is None
+
+    def test_rejects_python_tags(self):
+        """Test unsafe tags are rejected."""
+        with pytest.raises(yaml.YAMLError):
+            safe_load("!!python/object/apply:os.system ['true']")
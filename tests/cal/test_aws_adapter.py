@@ -1,14 +1,18 @@
 """Tests for AWS family adapter implementations."""
 
+import asyncio
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 from kstack_lib.cal.adapters.aws_family import (
     AWSFamilyProvider,
     AWSObjectStorage,
+    AWSObjectStorageAsync,
     AWSQueue,
+    AWSQueueAsync,
     AWSSecretManager,
 )
 from kstack_lib.cal.protocols import (
@@ -57,6 +61,7 @@ class TestAWSObjectStorage:
     def test_create_bucket_us_east_1(self, mock_s3_client):
         """Test creating bucket in us-east-1 (no LocationConstraint)."""
         mock_s3_client.meta.region_name = "us-east-1"
+        mock_s3_client.head_bucket.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadBucket")
 
         storage = AWSObjectStorage(mock_s3_client)
         storage.create_bucket("test-bucket")
@@ -66,6 +71,7 @@ class TestAWSObjectStorage:
     def test_create_bucket_other_region(self, mock_s3_client):
         """Test creating bucket in non-us-east-1 region."""
         mock_s3_client.meta.region_name = "us-west-2"
+        mock_s3_client.head_bucket.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadBucket")
 
         storage = AWSObjectStorage(mock_s3_client)
         storage.create_bucket("test-bucket")
@@ -75,6 +81,56 @@ class TestAWSObjectStorage:
             CreateBucketConfiguration={"LocationConstraint": "us-west-2"},
         )
 
+    def test_create_bucket_existing_skips_create(self, mock_s3_client):
+        """Test an existing bucket is detected with head_bucket and not re-created."""
+        storage = AWSObjectStorage(mock_s3_client)
+        storage.create_bucket("test-bucket")
+
+        mock_s3_client.head_bucket.assert_called_once_with(Bucket="test-bucket")
+        mock_s3_client.create_bucket.assert_not_called()
+
+    def test_create_bucket_head_error_propagates(self, mock_s3_client):
+        """Test head_bucket errors other than not-found are raised."""
+        mock_s3_client.head_bucket.side_effect = ClientError({"Error": {"Code": "403"}}, "HeadBucket")
+
+        storage = AWSObjectStorage(mock_s3_client)
+        with pytest.raises(ClientError):
+            storage.create_bucket("test-bucket")
+
+        mock_s3_client.create_bucket.assert_not_called()
+
+    def test_copy_object(self, mock_s3_client):
+        """Test copy_object uses the managed server-side copy with the transfer config."""
+        storage = AWSObjectStorage(mock_s3_client)
+        storage.copy_object("src", "a.txt", "dst", "b.txt")
+
+        mock_s3_client.copy.assert_called_once_with(
+            {"Bucket": "src", "Key": "a.txt"}, "dst", "b.txt", Config=storage._transfer_config
+        )
+
+    def test_list_objects_columnar(self, mock_s3_client):
+        """Test columnar listing transposes every page into per-field columns."""
+        mock_s3_client.list_objects_v2.side_effect = [
+            {"Contents": [{"Key": "a", "Size": 1, "ETag": "e1"}], "IsTruncated": True, "NextContinuationToken": "t"},
+            {"Contents": [{"Key": "b", "Size": 2, "ETag": "e2"}], "IsTruncated": False},
+        ]
+
+        storage = AWSObjectStorage(mock_s3_client)
+        cols = storage.list_objects_columnar("test-bucket")
+
+        assert cols["Key"] == ["a", "b"]
+        assert cols["Size"].typecode == "q"
+        assert sum(cols["Size"]) == 3
+        assert cols["ETag"] == ["e1", "e2"]
+
+    def test_list_objects_columnar_error_returns_empty(self, mock_s3_client):
+        """Test columnar listing returns empty columns on ClientError like list_objects."""
+        mock_s3_client.list_objects_v2.side_effect = ClientError({"Error": {"Code": "NoSuchBucket"}}, "ListObjectsV2")
+
+        cols = AWSObjectStorage(mock_s3_client).list_objects_columnar("missing")
+
+        assert cols["Key"] == [] and len(cols["Size"]) == 0
+
     def test_delete_bucket(self, mock_s3_client):
         """Test deleting bucket."""
         storage = AWSObjectStorage(mock_s3_client)
@@ -98,6 +154,19 @@ class TestAWSObjectStorage:
         assert objects[0]["Key"] == "file1.txt"
         mock_s3_client.list_objects_v2.assert_called_once_with(Bucket="test-bucket", Prefix="files/")
 
+    def test_list_objects_follows_continuation(self, mock_s3_client):
+        """Test listing fetches every page instead of stopping at the first 1000 keys."""
+        mock_s3_client.list_objects_v2.side_effect = [
+            {"Contents": [{"Key": "a"}], "IsTruncated": True, "NextContinuationToken": "t1"},
+            {"Contents": [{"Key": "b"}], "IsTruncated": False},
+        ]
+
+        storage = AWSObjectStorage(mock_s3_client)
+        keys = [obj["Key"] for obj in storage.iter_objects("test-bucket")]
+
+        assert keys == ["a", "b"]
+        mock_s3_client.list_objects_v2.assert_called_with(Bucket="test-bucket", Prefix="", ContinuationToken="t1")
+
     def test_upload_object_from_file(self, mock_s3_client, tmp_path):
         """Test uploading object from file path."""
         test_file = tmp_path / "test.txt"
@@ -128,6 +197,75 @@ class TestAWSObjectStorage:
         args = mock_s3_client.upload_file.call_args
         assert args[1]["ExtraArgs"]["ContentType"] == "application/json"
 
+    def test_content_type_guessed_from_extension(self, mock_s3_client, tmp_path):
+        """Test content types are guessed from the extension chain, once per chain."""
+        from kstack_lib.cal.adapters.aws_family import _guess_content_type_for_suffixes
+
+        storage = AWSObjectStorage(mock_s3_client)
+        _guess_content_type_for_suffixes.cache_clear()
+
+        for name in ("a.json", "b.json", "c.tar.gz"):
+            (tmp_path / name).write_text("x")
+            storage.upload_object("test-bucket", name, file_path=tmp_path / name)
+
+        content_types = [c[1]["ExtraArgs"]["ContentType"] for c in mock_s3_client.upload_file.call_args_list]
+        assert content_types == ["application/json", "application/json", "application/x-tar"]
+        assert _guess_content_type_for_suffixes.cache_info().hits == 1
+
+    def test_transfer_config(self, mock_s3_client, tmp_path):
+        """Test file transfers use the default or a caller-supplied TransferConfig."""
+        from kstack_lib.cal.adapters.aws_family import DEFAULT_TRANSFER_CONFIG
+
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"data")
+
+        storage = AWSObjectStorage(client=mock_s3_client)
+        storage.upload_object("test-bucket", "test.bin", file_path=test_file)
+        storage.download_object("test-bucket", "test.bin", file_path=test_file)
+
+        assert mock_s3_client.upload_file.call_args[1]["Config"] is DEFAULT_TRANSFER_CONFIG
+        assert mock_s3_client.download_file.call_args[1]["Config"] is DEFAULT_TRANSFER_CONFIG
+
+        custom = MagicMock()
+        storage = AWSObjectStorage(client=mock_s3_client, transfer_config=custom)
+        with test_file.open("rb") as file_obj:
+            storage.upload_object("test-bucket", "test.bin", file_obj=file_obj)
+
+        assert mock_s3_client.upload_fileobj.call_args[1]["Config"] is custom
+
+    def test_upload_object_from_bytes(self, mock_s3_client):
+        """Test uploading in-memory bytes uses a single put_object call."""
+        storage = AWSObjectStorage(mock_s3_client)
+        storage.upload_object(
+            "test-bucket",
+            "test.txt",
+            file_obj=b"test content",
+            content_type="text/plain",
+            metadata={"owner": "test"},
+        )
+
+        mock_s3_client.put_object.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="test.txt",
+            Body=b"test content",
+            ContentType="text/plain",
+            Metadata={"owner": "test"},
+        )
+        mock_s3_client.upload_fileobj.assert_not_called()
+
+    def test_download_object_stream(self, mock_s3_client):
+        """Test streaming yields body chunks and closes the body."""
+        body = MagicMock()
+        body.iter_chunks.return_value = iter([b"ab", b"cd"])
+        mock_s3_client.get_object.return_value = {"Body": body}
+
+        storage = AWSObjectStorage(mock_s3_client)
+        chunks = list(storage.download_object_stream("test-bucket", "big.bin", chunk_size=2))
+
+        assert chunks == [b"ab", b"cd"]
+        body.iter_chunks.assert_called_once_with(2)
+        body.close.assert_called_once()
+
     def test_download_object_to_bytes(self, mock_s3_client):
         """Test downloading object to bytes."""
         mock_response = {"Body": MagicMock()}
@@ -157,6 +295,16 @@ class TestAWSObjectStorage:
         assert "signature" in url
         mock_s3_client.generate_presigned_url.assert_called_once()
 
+    def test_generate_presigned_url_methods(self, mock_s3_client):
+        """Test HTTP methods map case-insensitively to client methods."""
+        storage = AWSObjectStorage(mock_s3_client)
+
+        storage.generate_presigned_url("test-bucket", "test.txt", http_method="put")
+
+        assert mock_s3_client.generate_presigned_url.call_args[1]["ClientMethod"] == "put_object"
+        with pytest.raises(ValueError, match="Unsupported HTTP method: PATCH"):
+            storage.generate_presigned_url("test-bucket", "test.txt", http_method="PATCH")
+
     def test_generate_presigned_url_with_custom_domain(self, mock_s3_client):
         """Test generating presigned URL with custom domain (LocalStack)."""
         mock_s3_client.generate_presigned_url.return_value = "http://localstack:4566/bucket/key?signature=abc"
@@ -164,7 +312,45 @@ class TestAWSObjectStorage:
         storage = AWSObjectStorage(mock_s3_client, presigned_url_domain="localstack.dev.partsnap.local")
         url = storage.generate_presigned_url("test-bucket", "test.txt")
 
-        assert "localstack.dev.partsnap.local" in url
+        assert url == "http://localstack.dev.partsnap.local/bucket/key?signature=abc"
+
+    def test_generate_presigned_url_custom_domain_reuses_prefix(self, mock_s3_client):
+        """Test the endpoint prefix is reused and re-learned when the endpoint changes."""
+        mock_s3_client.generate_presigned_url.side_effect = [
+            "http://localstack:4566/bucket/a?signature=1",
+            "http://localstack:4566/bucket/b?signature=2",
+            "https://other:443/bucket/c?signature=3",
+        ]
+
+        storage = AWSObjectStorage(mock_s3_client, presigned_url_domain="cdn.example.com")
+        urls = [storage.generate_presigned_url("bucket", key) for key in "abc"]
+
+        assert urls == [
+            "http://cdn.example.com/bucket/a?signature=1",
+            "http://cdn.example.com/bucket/b?signature=2",
+            "https://cdn.example.com/bucket/c?signature=3",
+        ]
+
+    def test_generate_presigned_urls(self, mock_s3_client):
+        """Test bulk presigning returns URLs in order and maps each method."""
+        mock_s3_client.generate_presigned_url.side_effect = ["url-get", "url-put"]
+
+        storage = AWSObjectStorage(mock_s3_client)
+        urls = storage.generate_presigned_urls([("bucket", "a", "GET"), ("bucket", "b", "put")], expiration=60)
+
+        assert urls == ["url-get", "url-put"]
+        mock_s3_client.generate_presigned_url.assert_called_with(
+            ClientMethod="put_object", Params={"Bucket": "bucket", "Key": "b"}, ExpiresIn=60
+        )
+
+    def test_generate_presigned_urls_rejects_before_signing(self, mock_s3_client):
+        """Test an unsupported method fails the whole batch before anything is signed."""
+        storage = AWSObjectStorage(mock_s3_client)
+
+        with pytest.raises(ValueError, match="Unsupported HTTP method: PATCH"):
+            storage.generate_presigned_urls([("bucket", "a", "GET"), ("bucket", "b", "PATCH")])
+
+        mock_s3_client.generate_presigned_url.assert_not_called()
 
     def test_get_object_metadata(self, mock_s3_client):
         """Test getting object metadata."""
@@ -237,6 +423,17 @@ class TestAWSQueue:
             QueueUrl="queue-url", MaxNumberOfMessages=10, WaitTimeSeconds=5
         )
 
+    def test_receive_messages_long_polls_by_default(self, mock_sqs_client):
+        """Test receive_messages waits the SQS maximum unless told otherwise."""
+        mock_sqs_client.receive_message.return_value = {}
+
+        queue = AWSQueue(mock_sqs_client)
+
+        assert queue.receive_messages("queue-url") == []
+        mock_sqs_client.receive_message.assert_called_once_with(
+            QueueUrl="queue-url", MaxNumberOfMessages=1, WaitTimeSeconds=20
+        )
+
     def test_delete_message(self, mock_sqs_client):
         """Test deleting message."""
         queue = AWSQueue(mock_sqs_client)
@@ -244,6 +441,35 @@ class TestAWSQueue:
 
         mock_sqs_client.delete_message.assert_called_once_with(QueueUrl="queue-url", ReceiptHandle="receipt-handle-123")
 
+    def test_send_messages_batches(self, mock_sqs_client):
+        """Test messages are sent 10 per request and IDs keep input order."""
+
+        def send_batch(**kwargs):
+            entries = reversed(kwargs["Entries"])
+            return {"Successful": [{"Id": e["Id"], "MessageId": f"id-{e['MessageBody']}"} for e in entries]}
+
+        mock_sqs_client.send_message_batch.side_effect = send_batch
+        queue = AWSQueue(mock_sqs_client)
+
+        message_ids = queue.send_messages("url", (str(n) for n in range(23)))
+
+        assert message_ids == [f"id-{n}" for n in range(23)]
+        assert mock_sqs_client.send_message_batch.call_count == 3
+        assert len(mock_sqs_client.send_message_batch.call_args_list[0][1]["Entries"]) == 10
+
+    def test_delete_messages_failure_raises(self, mock_sqs_client):
+        """Test failed batch entries raise KStackError."""
+        from kstack_lib.any.exceptions import KStackError
+
+        mock_sqs_client.delete_message_batch.return_value = {
+            "Successful": [{"Id": "0"}],
+            "Failed": [{"Id": "1", "Code": "ReceiptHandleIsInvalid", "Message": "bad handle"}],
+        }
+        queue = AWSQueue(mock_sqs_client)
+
+        with pytest.raises(KStackError, match="Failed to delete 1 SQS message"):
+            queue.delete_messages("url", ["r-0", "r-1"])
+
 
 class TestAWSSecretManager:
     """Tests for AWSSecretManager adapter."""
@@ -291,6 +517,69 @@ class TestAWSSecretManager:
         assert args[1]["ForceDeleteWithoutRecovery"] is True
 
 
+class TestAWSObjectStorageAsync:
+    """Tests for AWSObjectStorageAsync."""
+
+    @pytest.mark.asyncio
+    async def test_upload_and_download(self, tmp_path):
+        """Test uploads go through put_object and downloads read the body stream."""
+        client = AsyncMock()
+        body = MagicMock()
+        body.__aenter__ = AsyncMock(return_value=body)
+        body.__aexit__ = AsyncMock(return_value=None)
+        body.read = AsyncMock(return_value=b"content")
+        client.get_object.return_value = {"Body": body}
+
+        test_file = tmp_path / "test.json"
+        test_file.write_text("{}")
+
+        storage = AWSObjectStorageAsync(client)
+        await storage.upload_object("test-bucket", "test.json", file_path=test_file)
+
+        client.put_object.assert_awaited_once_with(
+            Bucket="test-bucket", Key="test.json", Body=b"{}", ContentType="application/json"
+        )
+        assert await storage.download_object("test-bucket", "test.json") == b"content"
+
+    @pytest.mark.asyncio
+    async def test_list_objects_error_returns_empty(self):
+        """Test list_objects returns [] on ClientError like the sync adapter."""
+        client = AsyncMock()
+        client.list_objects_v2.side_effect = ClientError({"Error": {"Code": "NoSuchBucket"}}, "ListObjectsV2")
+
+        assert await AWSObjectStorageAsync(client).list_objects("missing") == []
+
+    @pytest.mark.asyncio
+    async def test_copy_objects(self):
+        """Test copy_objects issues one server-side copy per item."""
+        client = AsyncMock()
+
+        await AWSObjectStorageAsync(client).copy_objects([("src", "a", "dst", "a"), ("src", "b", "dst", "b")])
+
+        assert client.copy.await_count == 2
+        client.copy.assert_any_await({"Bucket": "src", "Key": "b"}, "dst", "b")
+
+
+class TestAWSQueueAsync:
+    """Tests for AWSQueueAsync."""
+
+    @pytest.mark.asyncio
+    async def test_send_and_receive(self):
+        """Test send/receive/delete await the SQS client."""
+        client = AsyncMock()
+        client.send_message.return_value = {"MessageId": "msg-1"}
+        client.receive_message.return_value = {"Messages": [{"ReceiptHandle": "r-1"}]}
+
+        queue = AWSQueueAsync(client)
+
+        assert await queue.send_message("url", "hello") == "msg-1"
+        messages = await queue.receive_messages("url", max_messages=5)
+        await queue.delete_message("url", messages[0]["ReceiptHandle"])
+
+        client.receive_message.assert_awaited_once_with(QueueUrl="url", MaxNumberOfMessages=5, WaitTimeSeconds=20)
+        client.delete_message.assert_awaited_once_with(QueueUrl="url", ReceiptHandle="r-1")
+
+
 class TestAWSFamilyProvider:
     """Tests for AWSFamilyProvider."""
 
@@ -308,9 +597,10 @@ class TestAWSFamilyProvider:
         provider = AWSFamilyProvider(config, credentials)
         assert isinstance(provider, CloudProviderProtocol)
 
-    @patch("kstack_lib.cal.adapters.aws_family.boto3.client")
-    def test_create_object_storage(self, mock_boto_client):
+    @patch("boto3.session.Session")
+    def test_create_object_storage(self, mock_session_cls):
         """Test creating object storage client."""
+        mock_boto_client = mock_session_cls.return_value.client
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
@@ -329,9 +619,10 @@ class TestAWSFamilyProvider:
         assert isinstance(storage, ObjectStorageProtocol)
         mock_boto_client.assert_called_once()
 
-    @patch("kstack_lib.cal.adapters.aws_family.boto3.client")
-    def test_create_queue(self, mock_boto_client):
+    @patch("boto3.session.Session")
+    def test_create_queue(self, mock_session_cls):
         """Test creating queue client."""
+        mock_boto_client = mock_session_cls.return_value.client
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
@@ -347,9 +638,10 @@ class TestAWSFamilyProvider:
 
         assert isinstance(queue, QueueProtocol)
 
-    @patch("kstack_lib.cal.adapters.aws_family.boto3.client")
-    def test_create_secret_manager(self, mock_boto_client):
+    @patch("boto3.session.Session")
+    def test_create_secret_manager(self, mock_session_cls):
         """Test creating secret manager client."""
+        mock_boto_client = mock_session_cls.return_value.client
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
@@ -365,9 +657,10 @@ class TestAWSFamilyProvider:
 
         assert isinstance(secrets, SecretManagerProtocol)
 
-    @patch("kstack_lib.cal.adapters.aws_family.boto3.client")
-    def test_context_manager(self, mock_boto_client):
+    @patch("boto3.session.Session")
+    def test_context_manager(self, mock_session_cls):
         """Test context manager usage."""
+        mock_boto_client = mock_session_cls.return_value.client
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
@@ -387,3 +680,144 @@ class TestAWSFamilyProvider:
 
         # Client should be closed
         mock_client.close.assert_called()
+
+    @patch("boto3.session.Session")
+    def test_client_reused_with_pool_config(self, mock_session_cls):
+        """Test one pooled client is shared by every storage handle."""
+        mock_boto_client = mock_session_cls.return_value.client
+        from kstack_lib.cal.adapters.aws_family import DEFAULT_MAX_POOL_CONNECTIONS
+
+        config = MagicMock(spec=ProviderConfig)
+        config.services = {}
+        config.region = "us-west-2"
+        config.verify_ssl = True
+
+        credentials = {"aws_access_key_id": "test", "aws_secret_access_key": "test"}
+
+        provider = AWSFamilyProvider(config, credentials)
+        provider.create_object_storage()
+        provider.create_object_storage()
+
+        mock_session_cls.assert_called_once_with(
+            aws_access_key_id="test", aws_secret_access_key="test", region_name="us-west-2"
+        )
+        mock_boto_client.assert_called_once()
+        assert mock_boto_client.call_args[0] == ("s3",)
+        client_config = mock_boto_client.call_args[1]["config"]
+        assert client_config.max_pool_connections == DEFAULT_MAX_POOL_CONNECTIONS
+        assert client_config.retries["max_attempts"] == 3
+        assert client_config.tcp_keepalive is True
+
+    @patch("boto3.session.Session")
+    def test_client_config_shared_across_providers(self, mock_session_cls):
+        """Test the botocore Config is built once per shape and reused by every provider."""
+        config = MagicMock(spec=ProviderConfig)
+        config.services = {}
+        config.region = "us-west-2"
+        config.verify_ssl = True
+
+        credentials = {"aws_access_key_id": "test", "aws_secret_access_key": "test"}
+
+        for _ in range(2):
+            provider = AWSFamilyProvider(config, credentials)
+            provider.create_object_storage()
+            provider.create_queue()
+
+        s3_first, sqs_first, s3_second, sqs_second = (
+            call.kwargs["config"] for call in mock_session_cls.return_value.client.call_args_list
+        )
+        assert s3_first is s3_second
+        assert sqs_first is sqs_second
+        assert s3_first.signature_version == "s3v4"
+        assert sqs_first.signature_version is None
+
+    @patch("boto3.session.Session")
+    def test_clients_share_session(self, mock_session_cls):
+        """Test all service clients are created from one boto3 session."""
+        config = MagicMock(spec=ProviderConfig)
+        config.services = {}
+        config.region = "us-west-2"
+        config.verify_ssl = True
+
+        credentials = {"aws_access_key_id": "test", "aws_secret_access_key": "test"}
+
+        provider = AWSFamilyProvider(config, credentials)
+        provider.create_object_storage()
+        provider.create_queue()
+        provider.create_secret_manager()
+
+        mock_session_cls.assert_called_once()
+        services = [call.args[0] for call in mock_session_cls.return_value.client.call_args_list]
+        assert services == ["s3", "sqs", "secretsmanager"]
+
+    @pytest.mark.asyncio
+    async def test_async_clients_entered_once_and_closed(self):
+        """Test async clients are entered once and exited with the provider."""
+        config = MagicMock(spec=ProviderConfig)
+        config.services = {}
+        config.region = "us-west-2"
+        config.verify_ssl = True
+
+        credentials = {"aws_access_key_id": "test", "aws_secret_access_key": "test"}
+
+        client_cm = MagicMock()
+        client_cm.__aenter__ = AsyncMock(return_value=AsyncMock())
+        client_cm.__aexit__ = AsyncMock(return_value=None)
+        mock_aioboto3 = MagicMock()
+        mock_aioboto3.Session.return_value.client.return_value = client_cm
+
+        with patch.dict("sys.modules", {"aioboto3": mock_aioboto3}):
+            async with AWSFamilyProvider(config, credentials) as provider:
+                storage = await provider.create_object_storage_async()
+                await provider.create_object_storage_async()
+                queue = await provider.create_queue_async()
+
+        assert isinstance(storage, AWSObjectStorageAsync)
+        assert isinstance(queue, AWSQueueAsync)
+        assert client_cm.__aenter__.await_count == 2
+        assert client_cm.__aexit__.await_count == 2
+
+    async def test_concurrent_async_client_creation_shares_client(self):
+        """Test concurrent first calls for one service open a single aioboto3 client."""
+        config = MagicMock(spec=ProviderConfig)
+        config.services = {}
+        config.region = "us-west-2"
+        config.verify_ssl = True
+
+        credentials = {"aws_access_key_id": "test", "aws_secret_access_key": "test"}
+
+        async def slow_enter():
+            await asyncio.sleep(0)  # Let the other caller run while the client opens
+            return AsyncMock()
+
+        client_cm = MagicMock()
+        client_cm.__aenter__ = AsyncMock(side_effect=slow_enter)
+        client_cm.__aexit__ = AsyncMock(return_value=None)
+        mock_aioboto3 = MagicMock()
+        mock_aioboto3.Session.return_value.client.return_value = client_cm
+
+        with patch.dict("sys.modules", {"aioboto3": mock_aioboto3}):
+            async with AWSFamilyProvider(config, credentials) as provider:
+                first, second = await asyncio.gather(
+                    provider.create_object_storage_async(), provider.create_object_storage_async()
+                )
+
+        assert first._client is second._client
+        assert client_cm.__aenter__.await_count == 1
+        assert client_cm.__aexit__.await_count == 1
+
+    def test_import_does_not_load_boto3(self, assert_import_skips):
+        """Test importing the adapter module defers boto3/botocore until a client is created."""
+        assert_import_skips("import kstack_lib.cal.adapters.aws_family", "boto3", "botocore")
+
+    def test_adapters_have_no_instance_dict(self):
+        """Test adapters use __slots__ (no per-instance __dict__)."""
+        config = MagicMock(spec=ProviderConfig)
+
+        for instance in (
+            AWSFamilyProvider(config, {}),
+            AWSObjectStorage(MagicMock()),
+            AWSQueue(MagicMock()),
+            AWSSecretManager(MagicMock()),
+        ):
+            assert not hasattr(instance, "__dict__")
@@ -4,7 +4,8 @@ Tests the Cloud Abstraction Layer container to ensure proper IoC integration,
 following the same testing patterns as tests/test_container.py.
 """
 
-from unittest.mock import MagicMock, Mock
+import gc
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
@@ -120,6 +121,50 @@ class TestCloudContainerIoC:
 
         container.close()
 
+    def test_named_provider_shared_across_services(self):
+        """Test a named default provider is created once and shared by all services."""
+        cfg = ConfigMap(
+            layer=KStackLayer.LAYER_3_GLOBAL_INFRA,
+            environment=KStackEnvironment.DEVELOPMENT,
+        )
+        container = CloudContainer(cfg, default_provider="aws-prod")
+
+        mock_provider = MagicMock(spec=CloudProviderProtocol)
+        mock_factory = Mock(return_value=mock_provider)
+        container._ioc.provider_factory.override(mock_factory)
+
+        container.object_storage()
+        container.queue()
+
+        mock_factory.assert_called_once()
+        assert mock_factory.call_args[1]["override_provider"] == "aws-prod"
+        assert container._providers == {("aws-prod", None): mock_provider}
+
+        container.close()
+
+    def test_warmup_creates_providers_and_clients(self):
+        """Test warmup() prepares each requested service's provider and client."""
+        cfg = ConfigMap(
+            layer=KStackLayer.LAYER_3_GLOBAL_INFRA,
+            environment=KStackEnvironment.DEVELOPMENT,
+        )
+        container = CloudContainer(cfg)
+
+        mock_provider = MagicMock(spec=CloudProviderProtocol)
+        container._ioc.provider_factory.override(Mock(return_value=mock_provider))
+
+        container.warmup(["s3", "sqs"])
+
+        assert set(container._providers) == {(None, "s3"), (None, "sqs")}
+        mock_provider.create_object_storage.assert_called_once()
+        mock_provider.create_queue.assert_called_once()
+        mock_provider.create_secret_manager.assert_not_called()
+
+        with pytest.raises(ValueError, match="Unknown service: redis"):
+            container.warmup(["redis"])
+
+        container.close()
+
     def test_provider_override_per_service(self):
         """Test that provider can be overridden per service."""
         cfg = ConfigMap(
@@ -204,6 +249,38 @@ class TestCloudContainerIoC:
         # Container should be marked closed
         assert container._closed is True
 
+    def test_collected_container_closes_providers(self):
+        """Test providers are closed when an unclosed container is garbage collected."""
+        cfg = ConfigMap(
+            layer=KStackLayer.LAYER_3_GLOBAL_INFRA,
+            environment=KStackEnvironment.DEVELOPMENT,
+        )
+        container = CloudContainer(cfg)
+        mock_provider = MagicMock(spec=CloudProviderProtocol)
+        container._providers[(None, "s3")] = mock_provider
+
+        assert not hasattr(CloudContainer, "__del__")
+        del container
+        gc.collect()
+
+        mock_provider.close.assert_called_once()
+
+    def test_close_disarms_finalizer(self):
+        """Test close() runs cleanup once and leaves nothing for the finalizer."""
+        cfg = ConfigMap(
+            layer=KStackLayer.LAYER_3_GLOBAL_INFRA,
+            environment=KStackEnvironment.DEVELOPMENT,
+        )
+        container = CloudContainer(cfg)
+        mock_provider = MagicMock(spec=CloudProviderProtocol)
+        container._providers[(None, "s3")] = mock_provider
+
+        container.close()
+        container.close()
+
+        assert not container._finalizer.alive
+        mock_provider.close.assert_called_once()
+
     def test_closed_container_raises_error(self):
         """Test that using closed container raises error."""
         cfg = ConfigMap(
@@ -263,6 +340,25 @@ class TestCloudContainerIoC:
         # After exit, provider should be closed
         mock_provider.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_async_exit_awaits_provider_aclose(self):
+        """Test async exit awaits aclose() on providers that have it before closing."""
+        cfg = ConfigMap(
+            layer=KStackLayer.LAYER_3_GLOBAL_INFRA,
+            environment=KStackEnvironment.DEVELOPMENT,
+        )
+        async_provider = MagicMock(spec=CloudProviderProtocol)
+        async_provider.aclose = AsyncMock()
+        sync_provider = MagicMock(spec=CloudProviderProtocol)
+
+        async with CloudContainer(cfg) as container:
+            container._providers[(None, "s3")] = async_provider
+            container._providers[(None, "sqs")] = sync_provider
+
+        async_provider.aclose.assert_awaited_once()
+        async_provider.close.assert_called_once()
+        sync_provider.close.assert_called_once()
+
 
 class TestCloudContainerConsistency:
     """Test consistency of CloudContainer with main IoC container patterns."""
@@ -0,0 +1,41 @@
+"""Tests for CAL provider factory."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from kstack_lib.cal.adapters.aws_family import AWSFamilyProvider
+from kstack_lib.cal.factory import UnsupportedProviderError, create_cloud_provider_from_config
+from kstack_lib.config.schemas import ProviderConfig, ProviderFamily
+
+CREDENTIALS = {"aws_access_key_id": "test", "aws_secret_access_key": "test"}
+
+
+class TestCreateCloudProviderFromConfig:
+    """Test family-based adapter selection."""
+
+    def test_aws_family(self):
+        """Test the AWS family maps to AWSFamilyProvider."""
+        config = MagicMock(spec=ProviderConfig)
+        config.provider_family = ProviderFamily.AWS
+
+        provider = create_cloud_provider_from_config(config, CREDENTIALS)
+
+        assert isinstance(provider, AWSFamilyProvider)
+
+    @pytest.mark.parametrize(("family", "name"), [(ProviderFamily.GCP, "GCP"), (ProviderFamily.AZURE, "Azure")])
+    def test_planned_family_not_implemented(self, family, name):
+        """Test known families without an adapter raise UnsupportedProviderError."""
+        config = MagicMock(spec=ProviderConfig)
+        config.provider_family = family
+
+        with pytest.raises(UnsupportedProviderError, match=f"{name} provider family not yet implemented"):
+            create_cloud_provider_from_config(config, CREDENTIALS)
+
+    def test_unknown_family(self):
+        """Test an unknown family raises UnsupportedProviderError."""
+        config = MagicMock(spec=ProviderConfig)
+        config.provider_family = "mainframe"
+
+        with pytest.raises(UnsupportedProviderError, match="Unknown provider family: mainframe"):
+            create_cloud_provider_from_config(config, CREDENTIALS)
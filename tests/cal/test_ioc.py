@@ -4,11 +4,18 @@ Tests the Cloud Abstraction Layer dependency injection container,
 following the same testing patterns as tests/test_container.py.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from kstack_lib.cal.ioc import CALIoCContainer, create_cal_container, get_cal_container, reset_cal_container
+from kstack_lib.cal.ioc import (
+    CALIoCContainer,
+    cal_container_scope,
+    create_cal_container,
+    get_cal_container,
+    reset_cal_container,
+)
 from kstack_lib.config import ConfigMap
 from kstack_lib.types import KStackEnvironment, KStackLayer
 
@@ -131,6 +138,9 @@ class TestCALIoCContainer:
             "config_root": "/custom/config",
             "vault_root": "/custom/vault",
         }
+        assert container.factory_kwargs() is factory_kwargs
+        with pytest.raises(TypeError):
+            factory_kwargs["config_root"] = "/elsewhere"
 
 
 class TestGlobalCALContainer:
@@ -190,6 +200,33 @@ class TestGlobalCALContainer:
         # Should be different instance
         assert container1 is not container2
 
+    def test_concurrent_first_calls_share_container(self):
+        """Test threads racing on the first call all get one container."""
+        cfg = ConfigMap(
+            layer=KStackLayer.LAYER_3_GLOBAL_INFRA,
+            environment=KStackEnvironment.DEVELOPMENT,
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            containers = list(pool.map(lambda _: get_cal_container(cfg), range(32)))
+
+        assert all(container is containers[0] for container in containers)
+
+    def test_scoped_container_overrides_global(self):
+        """Test cal_container_scope() takes precedence over the global container inside the block."""
+        cfg = ConfigMap(
+            layer=KStackLayer.LAYER_3_GLOBAL_INFRA,
+            environment=KStackEnvironment.DEVELOPMENT,
+        )
+        global_container = get_cal_container(cfg)
+        scoped = create_cal_container(cfg)
+
+        with cal_container_scope(scoped) as container:
+            assert container is scoped
+            assert get_cal_container() is scoped
+
+        assert get_cal_container() is global_container
+
 
 class TestCALIoCIntegration:
     """Integration tests for CAL IoC with real dependencies."""
@@ -237,3 +274,7 @@ class TestCALIoCIntegration:
         # Should be the mock
         assert container is mock_container
         mock_get_container.assert_called_once()
+
+    def test_import_defers_config_package(self, assert_import_skips):
+        """Test importing the CAL container modules doesn't import kstack_lib.config."""
+        assert_import_skips("import kstack_lib.cal.ioc, kstack_lib.cal.container", "kstack_lib.config")
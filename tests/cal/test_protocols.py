@@ -90,7 +90,7 @@ class MockQueue:
         self,
         queue_url: str,
         max_messages: int = 1,
-        wait_time_seconds: int = 0,
+        wait_time_seconds: int = 20,
     ) -> list[dict[str, Any]]:
         return [{"MessageId": "msg-123", "Body": "test"}]
 
@@ -255,3 +255,33 @@ class TestProtocolMethods:
             assert isinstance(provider, CloudProviderProtocol)
             storage = provider.create_object_storage()
             assert isinstance(storage, ObjectStorageProtocol)
+
+
+class TestCALExports:
+    """Test the lazily resolved kstack_lib.cal exports."""
+
+    def test_exports_resolve_to_defining_modules(self):
+        """Test every exported name resolves to the object in its defining module."""
+        import importlib
+
+        import kstack_lib.cal as cal
+
+        for name in cal.__all__:
+            module = importlib.import_module(cal._LAZY_EXPORTS[name])
+            assert getattr(cal, name) is getattr(module, name)
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        import kstack_lib.cal as cal
+
+        with pytest.raises(AttributeError):
+            cal.DoesNotExist  # noqa: B018
+
+    def test_protocols_import_stays_light(self, assert_import_skips):
+        """Test importing the protocols doesn't load the CAL container, factory or adapters."""
+        assert_import_skips(
+            "import kstack_lib.cal.protocols",
+            "kstack_lib.cal.container",
+            "kstack_lib.cal.factory",
+            "kstack_lib.cal.adapters",
+        )
@@ -14,6 +14,18 @@ from kstack_lib.cluster._base import ClusterBase
 class TestClusterEnvironmentDetector:
     """Test ClusterEnvironmentDetector with mocked dependencies."""
 
+    def setup_method(self):
+        """Forget any namespace read by a previous test."""
+        from kstack_lib.cluster.config.environment import _read_current_namespace
+
+        _read_current_namespace.cache_clear()
+
+    def teardown_method(self):
+        """Don't leak a mocked namespace into other tests."""
+        from kstack_lib.cluster.config.environment import _read_current_namespace
+
+        _read_current_namespace.cache_clear()
+
     @patch.object(ClusterBase, "_check_cluster_context")
     @patch("pathlib.Path.exists", return_value=True)
     @patch("pathlib.Path.read_text", return_value="layer-3-production")
@@ -105,6 +117,16 @@ class TestClusterEnvironmentDetector:
         assert "layer-{layer_num}-{environment}" in str(exc_info.value)
         assert "DANGEROUS" in str(exc_info.value)
 
+    @patch.object(ClusterBase, "_check_cluster_context")
+    def test_get_environment_invalid_empty_environment(self, mock_guard):
+        """Test error when nothing follows the layer number."""
+        from kstack_lib.cluster.config.environment import ClusterEnvironmentDetector
+
+        detector = ClusterEnvironmentDetector(namespace="layer-3-")
+
+        with pytest.raises(KStackConfigurationError, match="Invalid namespace format"):
+            detector.get_environment()
+
     @patch.object(ClusterBase, "_check_cluster_context")
     def test_get_environment_invalid_wrong_prefix(self, mock_guard):
         """Test error when namespace doesn't start with 'layer-'."""
@@ -141,6 +163,30 @@ class TestClusterEnvironmentDetector:
             env = detector.get_environment()
             assert env == "production"
 
+    @patch.object(ClusterBase, "_check_cluster_context")
+    @patch("pathlib.Path.exists", return_value=True)
+    @patch("pathlib.Path.read_text", return_value="layer-3-production")
+    def test_namespace_file_read_once(self, mock_read_text, mock_exists, mock_guard):
+        """Test the service account namespace is read once for all detectors."""
+        from kstack_lib.cluster.config.environment import ClusterEnvironmentDetector
+
+        first = ClusterEnvironmentDetector()
+        second = ClusterEnvironmentDetector()
+
+        mock_read_text.assert_called_once()
+        assert first._namespace == second._namespace == "layer-3-production"
+
+    @patch.object(ClusterBase, "_check_cluster_context")
+    def test_get_environment_parsed_once(self, mock_guard):
+        """Test the environment is parsed on the first call only."""
+        from kstack_lib.cluster.config.environment import ClusterEnvironmentDetector
+
+        detector = ClusterEnvironmentDetector(namespace="layer-3-production")
+        env = detector.get_environment()
+        detector._namespace = "layer-3-staging"  # Would parse differently if re-read
+
+        assert detector.get_environment() is env
+
     @patch.object(ClusterBase, "_check_cluster_context")
     def test_get_config_root_returns_none(self, mock_guard):
         """Test that config root is None in cluster."""
@@ -186,6 +232,18 @@ class TestClusterEnvironmentDetector:
         assert "invalid" in repr_str
         assert "environment=" not in repr_str  # Can't parse environment
 
+    @patch.object(ClusterBase, "_check_cluster_context")
+    def test_repr_does_not_reparse(self, mock_guard):
+        """Test repr() uses the environment parsed at construction."""
+        from kstack_lib.cluster.config.environment import ClusterEnvironmentDetector
+
+        detector = ClusterEnvironmentDetector(namespace="layer-3-production")
+
+        with patch.object(ClusterEnvironmentDetector, "get_environment") as mock_get:
+            assert "environment='production'" in repr(detector)
+
+        mock_get.assert_not_called()
+
     @patch.object(ClusterBase, "_check_cluster_context")
     def test_whitespace_handling(self, mock_guard):
         """Test that whitespace in namespace is handled."""
@@ -70,8 +70,9 @@ class TestClusterSecretsProvider:
         provider = ClusterSecretsProvider(namespace="layer-3-production")
         creds = provider.get_credentials("s3", "layer3", "production")
 
-        # Verify kubectl command
+        # Verify kubectl command (raw bytes output for the JSON parser)
         mock_run.assert_called_once()
+        assert mock_run.call_args[1]["binary"] is True
         call_args = mock_run.call_args[0][0]
         assert call_args == [
             "kubectl",
@@ -110,6 +111,22 @@ class TestClusterSecretsProvider:
 
         assert "K8s secret not found" in str(exc_info.value)
         assert "layer3-s3-credentials" in str(exc_info.value)
+        assert "Service: s3, Layer: layer3, Environment: production" in str(exc_info.value)
+
+    @patch.object(ClusterBase, "_check_cluster_context")
+    @patch("kstack_lib.cluster.security.secrets.run_command")
+    def test_get_credentials_secret_not_found_bytes_stderr(self, mock_run, mock_guard):
+        """Test NotFound is detected in (decoded) bytes stderr from binary output."""
+        from kstack_lib.cluster.security.secrets import ClusterSecretsProvider
+
+        mock_run.side_effect = subprocess.CalledProcessError(
+            1, "kubectl", stderr=b'Error from server (NotFound): secrets "layer3-s3-credentials" not found'
+        )
+
+        provider = ClusterSecretsProvider(namespace="layer-3-production")
+
+        with pytest.raises(KStackServiceNotFoundError, match=r"Error: Error from server \(NotFound\)"):
+            provider.get_credentials("s3", "layer3", "production")
 
     @patch.object(ClusterBase, "_check_cluster_context")
     @patch("kstack_lib.cluster.security.secrets.run_command")
@@ -181,6 +198,192 @@ class TestClusterSecretsProvider:
         assert creds["valid_key"] == "valid_value"
         assert "invalid_key" not in creds
 
+    @patch.object(ClusterBase, "_check_cluster_context")
+    @patch("kstack_lib.cluster.security.secrets.run_command")
+    def test_get_credentials_batch_single_kubectl_call(self, mock_run, mock_guard):
+        """Test a batch fetches every secret with one kubectl call, in request order."""
+        from kstack_lib.cluster.security.secrets import ClusterSecretsProvider
+
+        def secret(name, value):
+            return {"metadata": {"name": name}, "data": {"key": base64.b64encode(value).decode()}}
+
+        secret_list = {
+            "kind": "List",
+            "items": [secret("layer3-sqs-credentials", b"sqs"), secret("layer3-s3-credentials", b"s3")],
+        }
+        mock_run.return_value = MagicMock(stdout=json.dumps(secret_list))
+
+        provider = ClusterSecretsProvider(namespace="layer-3-production")
+        creds = provider.get_credentials_batch(
+            [("s3", "layer3", "production"), ("sqs", "layer3", "production"), ("s3", "layer3", "production")]
+        )
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            "kubectl",
+            "get",
+            "secret",
+            "layer3-s3-credentials",
+            "layer3-sqs-credentials",
+            "-n",
+            "layer-3-production",
+            "-o",
+            "json",
+        ]
+        assert [c["key"] for c in creds] == ["s3", "sqs", "s3"]
+        assert creds[0] is not creds[2]
+
+    @patch.object(ClusterBase, "_check_cluster_context")
+    @patch("kstack_lib.cluster.security.secrets.run_command")
+    def test_get_credentials_batch_missing_item(self, mock_run, mock_guard):
+        """Test a secret absent from the kubectl list raises KStackServiceNotFoundError."""
+        from kstack_lib.cluster.security.secrets import ClusterSecretsProvider
+
+        secret_list = {
+            "kind": "List",
+            "items": [{"metadata": {"name": "layer3-s3-credentials"}, "data": {"k": base64.b64encode(b"v").decode()}}],
+        }
+        mock_run.return_value = MagicMock(stdout=json.dumps(secret_list))
+
+        provider = ClusterSecretsProvider(namespace="layer-3-production")
+
+        with pytest.raises(KStackServiceNotFoundError, match="layer3-sqs-credentials") as exc_info:
+            provider.get_credentials_batch([("s3", "layer3", "production"), ("sqs", "layer3", "production")])
+
+        assert "Service: sqs, Layer: layer3, Environment: production" in str(exc_info.value)
+        assert "Service: s3," not in str(exc_info.value)
+
+    @patch.object(ClusterBase, "_check_cluster_context")
+    def test_get_credentials_batch_empty(self, mock_guard):
+        """Test an empty batch doesn't run kubectl."""
+        from kstack_lib.cluster.security.secrets import ClusterSecretsProvider
+
+        provider = ClusterSecretsProvider(namespace="layer-3-production")
+
+        with patch("kstack_lib.cluster.security.secrets.run_command") as mock_run:
+            assert provider.get_credentials_batch([]) == []
+
+        mock_run.assert_not_called()
+
+    @patch.object(ClusterBase, "_check_cluster_context")
+    @patch("kstack_lib.cluster.security.secrets.run_command")
+    def test_get_credentials_uses_k8s_api_when_available(self, mock_run, mock_guard):
+        """Test secrets are read through the Kubernetes client instead of kubectl when it's usable."""
+        pytest.importorskip("kubernetes")
+        from kstack_lib.cluster.security.secrets import ClusterSecretsProvider
+
+        api = MagicMock()
+        api.read_namespaced_secret.return_value = MagicMock(data={"token": base64.b64encode(b"abc").decode()})
+
+        provider = ClusterSecretsProvider(namespace="layer-3-production")
+        with patch("kstack_lib.cluster.security.secrets._k8s_core_api", return_value=api):
+            creds = provider.get_credentials("redis", "layer3", "production")
+
+        api.read_namespaced_secret.assert_called_once_with("layer3-redis-credentials", "layer-3-production")
+        mock_run.assert_not_called()
+        assert creds == {"token": "abc"}
+
+    def test_k8s_core_api_without_package(self):
+        """Test the kubectl fallback is chosen when the kubernetes package is missing."""
+        import sys
+
+        from kstack_lib.cluster.security.secrets import _k8s_core_api
+
+        _k8s_core_api.cache_clear()
+        try:
+            with patch.dict(sys.modules, {"kubernetes": None}):
+                assert _k8s_core_api() is None
+        finally:
+            _k8s_core_api.cache_clear()
+
+    @patch.object(ClusterBase, "_check_cluster_context")
+    @patch("kstack_lib.cluster.security.secrets.run_command")
+    def test_get_credentials_cached_until_ttl(self, mock_run, mock_guard):
+        """Test repeat lookups reuse fetched credentials until the TTL passes or the cache is cleared."""
+        from kstack_lib.cluster.security.secrets import ClusterSecretsProvider
+
+        secret_data = {"data": {"password": base64.b64encode(b"pw").decode()}}
+        mock_run.return_value = MagicMock(stdout=json.dumps(secret_data))
+
+        provider = ClusterSecretsProvider(namespace="layer-3-production", cache_ttl=60)
+        with patch("kstack_lib.cluster.security.secrets.time.monotonic", return_value=1000.0) as mock_clock:
+            first = provider.get_credentials("redis", "layer3", "production")
+            first["password"] = "tampered"
+            assert provider.get_credentials("redis", "layer3", "production") == {"password": "pw"}
+            assert mock_run.call_count == 1
+
+            mock_clock.return_value = 1061.0
+            provider.get_credentials("redis", "layer3", "production")
+            assert mock_run.call_count == 2
+
+            provider.clear_cache()
+            provider.get_credentials("redis", "layer3", "production")
+            assert mock_run.call_count == 3
+
+    @patch.object(ClusterBase, "_check_cluster_context")
+    @patch("kstack_lib.cluster.security.secrets.run_command")
+    def test_clear_cache_filters(self, mock_run, mock_guard):
+        """Test clear_cache() only drops entries matching the given service/layer/environment."""
+        from kstack_lib.cluster.security.secrets import ClusterSecretsProvider
+
+        secret_data = {"data": {"password": base64.b64encode(b"pw").decode()}}
+        mock_run.return_value = MagicMock(stdout=json.dumps(secret_data))
+
+        provider = ClusterSecretsProvider(namespace="layer-3-production", cache_ttl=60)
+        provider.get_credentials("redis", "layer3", "production")
+        provider.get_credentials("redis", "layer3", "staging")
+        assert mock_run.call_count == 2
+
+        provider.clear_cache(environment="staging")
+        provider.get_credentials("redis", "layer3", "production")
+        assert mock_run.call_count == 2
+        provider.get_credentials("redis", "layer3", "staging")
+        assert mock_run.call_count == 3
+
+        provider.clear_cache(service="s3")
+        provider.get_credentials("redis", "layer3", "staging")
+        assert mock_run.call_count == 3
+
+        provider.clear_cache(service="redis", layer="layer3")
+        provider.get_credentials("redis", "layer3", "production")
+        assert mock_run.call_count == 4
+
+    @patch.object(ClusterBase, "_check_cluster_context")
+    @patch("kstack_lib.cluster.security.secrets.run_command")
+    def test_get_credentials_cache_disabled(self, mock_run, mock_guard):
+        """Test cache_ttl=0 reads the secret on every call."""
+        from kstack_lib.cluster.security.secrets import ClusterSecretsProvider
+
+        secret_data = {"data": {"password": base64.b64encode(b"pw").decode()}}
+        mock_run.return_value = MagicMock(stdout=json.dumps(secret_data))
+
+        provider = ClusterSecretsProvider(namespace="layer-3-production", cache_ttl=0)
+        provider.get_credentials("redis", "layer3", "production")
+        provider.get_credentials("redis", "layer3", "production")
+
+        assert mock_run.call_count == 2
+
+    @patch.object(ClusterBase, "_check_cluster_context")
+    @patch("kstack_lib.cluster.security.secrets.run_command")
+    def test_loaded_keys_logged_only_when_debug_enabled(self, mock_run, mock_guard):
+        """Test the key list is only joined and logged when DEBUG logging is on."""
+        from kstack_lib.cluster.security.secrets import ClusterSecretsProvider
+
+        secret_data = {"data": {"user": base64.b64encode(b"u").decode(), "password": base64.b64encode(b"p").decode()}}
+        mock_run.return_value = MagicMock(stdout=json.dumps(secret_data))
+
+        provider = ClusterSecretsProvider(namespace="layer-3-production", cache_ttl=0)
+        with patch("kstack_lib.cluster.security.secrets.LOGGER") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            assert provider.get_credentials("redis", "layer3", "production") == {"user": "u", "password": "p"}
+            assert not any("user, password" in call.args for call in mock_logger.debug.call_args_list)
+
+            mock_logger.isEnabledFor.return_value = True
+            provider.get_credentials("redis", "layer3", "production")
+            mock_logger.debug.assert_called_with(
+                "Loaded credentials from K8s secret: %s (keys: %s)", "layer3-redis-credentials", "user, password"
+            )
+
     @patch.object(ClusterBase, "_check_cluster_context")
     def test_repr(self, mock_guard):
         """Test string representation."""
@@ -0,0 +1,79 @@
+"""Tests for kstack_lib.config.cluster .kstack.yaml discovery and caching."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from kstack_lib.config.cluster import (
+    KStackClusterConfig,
+    _find_kstack_yaml_from,
+    clear_cluster_config_cache,
+    get_active_environment,
+)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Run from a subdirectory of a project with a .kstack.yaml, outside the cluster."""
+    (tmp_path / ".kstack.yaml").write_text("environment: staging\n")
+    workdir = tmp_path / "src" / "pkg"
+    workdir.mkdir(parents=True)
+    monkeypatch.chdir(workdir)
+
+    clear_cluster_config_cache()
+    with patch.object(KStackClusterConfig, "_detect_in_cluster", return_value=False):
+        yield tmp_path
+    clear_cluster_config_cache()
+
+
+class TestKStackYamlCaching:
+    """Test .kstack.yaml lookups are cached."""
+
+    def test_directory_walk_done_once(self, project):
+        """Test the parent-directory search runs once per working directory."""
+        first = KStackClusterConfig()
+        second = KStackClusterConfig()
+
+        assert first.environment == second.environment == "staging"
+        assert _find_kstack_yaml_from.cache_info().misses == 1
+
+    def test_modified_file_reloaded(self, project):
+        """Test an edited .kstack.yaml is parsed again."""
+        assert KStackClusterConfig().environment == "staging"
+
+        config_file = project / ".kstack.yaml"
+        config_file.write_text("environment: production\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert KStackClusterConfig().environment == "production"
+
+    def test_get_active_environment_cached(self, project):
+        """Test get_active_environment() detects once until the cache is cleared."""
+        assert get_active_environment() == "staging"
+
+        (project / ".kstack.yaml").write_text("environment: production\n")
+        assert get_active_environment() == "staging"
+
+        clear_cluster_config_cache()
+        assert get_active_environment() == "production"
+
+    def test_deleted_file_falls_back_to_search(self, project):
+        """Test a cached .kstack.yaml that was removed is searched for again instead of erroring."""
+        assert KStackClusterConfig().environment == "staging"
+
+        (project / ".kstack.yaml").unlink()
+        (project / "src" / ".kstack.yaml").write_text("environment: production\n")
+        assert KStackClusterConfig().environment == "production"
+
+        (project / "src" / ".kstack.yaml").unlink()
+        assert KStackClusterConfig().environment == "dev"
+
+    def test_file_created_after_miss_found(self, project):
+        """Test a .kstack.yaml created after a failed search is found by the next one."""
+        (project / ".kstack.yaml").unlink()
+        assert KStackClusterConfig().environment == "dev"
+
+        (project / ".kstack.yaml").write_text("environment: production\n")
+        assert KStackClusterConfig().environment == "production"
@@ -1,5 +1,8 @@
 """Tests for configuration loading functions."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 import yaml
 
@@ -8,6 +11,7 @@ from kstack_lib.config.loaders import (
     ConfigurationError,
     _resolve_dict_templates,
     _resolve_template_variables,
+    clear_config_cache,
     get_cloud_provider,
     load_cloud_credentials,
     load_environment_config,
@@ -255,6 +259,38 @@ class TestLoadCloudCredentials:
         assert loaded.providers["localstack"].aws_access_key_id == "test"
         assert loaded.providers["aws-dev"].aws_access_key_id == "AKIA_DEV"
 
+    def test_credentials_parsed_once_until_changed(self, tmp_path):
+        """Test the credentials file is re-parsed only after it changes."""
+        creds_dir = tmp_path / "vault" / "dev" / "layer3"
+        creds_dir.mkdir(parents=True)
+        creds_file = creds_dir / "cloud-credentials.yaml"
+        creds_file.write_text("providers:\n  localstack:\n    aws_access_key_id: a\n    aws_secret_access_key: s\n")
+
+        def load():
+            return load_cloud_credentials(
+                environment=KStackEnvironment.DEVELOPMENT,
+                layer=KStackLayer.LAYER_3_GLOBAL_INFRA,
+                vault_dir=tmp_path / "vault",
+            )
+
+        clear_config_cache()
+        try:
+            with patch("kstack_lib.config.loaders.safe_load", wraps=yaml.safe_load) as mock_load:
+                load()
+                load()
+                assert mock_load.call_count == 1
+
+                creds_file.write_text(
+                    "providers:\n  localstack:\n    aws_access_key_id: b\n    aws_secret_access_key: s\n"
+                )
+                stat = creds_file.stat()
+                os.utime(creds_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+                assert load().providers["localstack"].aws_access_key_id == "b"
+                assert mock_load.call_count == 2
+        finally:
+            clear_config_cache()
+
     def test_load_missing_credentials_fails(self, tmp_path):
         """Test that missing credentials file fails."""
         vault_dir = tmp_path / "vault"
@@ -2,8 +2,9 @@
 
 import shutil
 import subprocess
+import sys
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 
 import pytest
 
@@ -97,3 +98,22 @@ def localstack() -> Generator[None, None, None]:
             except subprocess.TimeoutExpired:
                 # Force kill if stop times out
                 subprocess.run(["docker", "kill", container_name], capture_output=True)
+
+
+@pytest.fixture
+def assert_import_skips() -> Callable[..., None]:
+    """Return a checker that runs imports in a fresh interpreter and asserts modules stayed unloaded.
+
+    Usage: ``assert_import_skips("import kstack_lib.cal.protocols", "kstack_lib.cal.container")``
+    """
+
+    def check(statement: str, *modules: str) -> None:
+        code = (
+            "import sys\n"
+            f"{statement}\n"
+            f"loaded = {set(modules)!r} & set(sys.modules)\n"
+            "assert not loaded, sorted(loaded)\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    return check
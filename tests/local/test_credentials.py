@@ -1,10 +1,12 @@
 """Tests for LocalCredentialsProvider."""
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from kstack_lib.any._yaml import safe_load
 from kstack_lib.any.exceptions import KStackConfigurationError, KStackServiceNotFoundError
 from kstack_lib.local.security.credentials import LocalCredentialsProvider
 from kstack_lib.local.security.vault import KStackVault
@@ -227,6 +229,40 @@ redis:
             ):
                 provider.get_credentials("s3", "layer3", "dev")
 
+    def test_get_credentials_file_parsed_once(self, credentials_file):
+        """Test the credentials file is parsed once while unchanged."""
+        vault = KStackVault(environment="dev", vault_root=credentials_file)
+        provider = LocalCredentialsProvider(vault=vault)
+
+        with patch("kstack_lib.local.security.credentials.safe_load", wraps=safe_load) as mock_load:
+            provider.get_credentials("s3", "layer3", "dev")
+            provider.get_credentials("redis", "layer3", "dev")
+
+        mock_load.assert_called_once()
+
+    def test_get_credentials_reloads_changed_file(self, credentials_file):
+        """Test a modified credentials file is re-read."""
+        vault = KStackVault(environment="dev", vault_root=credentials_file)
+        provider = LocalCredentialsProvider(vault=vault)
+
+        provider.get_credentials("s3", "layer3", "dev")
+
+        creds_file = credentials_file / "dev" / "layer3" / "cloud-credentials.yaml"
+        creds_file.write_text("s3:\n  aws_access_key_id: rotated\n")
+        stat = creds_file.stat()
+        os.utime(creds_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert provider.get_credentials("s3", "layer3", "dev")["aws_access_key_id"] == "rotated"
+
+    def test_get_credentials_returns_copy(self, credentials_file):
+        """Test callers can't mutate the cached credentials."""
+        vault = KStackVault(environment="dev", vault_root=credentials_file)
+        provider = LocalCredentialsProvider(vault=vault)
+
+        provider.get_credentials("s3", "layer3", "dev")["aws_access_key_id"] = "tampered"
+
+        assert provider.get_credentials("s3", "layer3", "dev")["aws_access_key_id"] == "test-access-key"
+
     def test_repr(self, mock_vault):
         """Test __repr__ method."""
         provider = LocalCredentialsProvider(vault=mock_vault)
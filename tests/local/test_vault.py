@@ -112,6 +112,22 @@ class TestKStackVault:
 
         assert vault.is_encrypted() is True
 
+    def test_is_encrypted_ignores_metadata_files(self, vault_structure):
+        """Test partsecrets metadata like secret.map.cfg doesn't count as an encrypted file."""
+        vault = KStackVault(environment="dev", vault_root=vault_structure)
+        (vault.path / "layer3" / "secret.map.cfg").write_text("cloud-credentials.yaml\n")
+
+        assert vault.is_encrypted() is False
+
+    def test_is_encrypted_checks_nested_directories(self, vault_structure):
+        """Test a counterpart must be in the same (nested) directory as its secret file."""
+        vault = KStackVault(environment="dev", vault_root=vault_structure)
+        nested = vault.path / "layer3" / "extra"
+        nested.mkdir()
+        (nested / "secret.cloud-credentials.yaml").write_text("encrypted")
+
+        assert vault.is_encrypted() is True
+
     def test_decrypt_when_already_decrypted(self, vault_structure):
         """Test decrypt when vault is already decrypted."""
         vault = KStackVault(environment="dev", vault_root=vault_structure)
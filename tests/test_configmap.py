@@ -1,5 +1,7 @@
 """Tests for ConfigMap and KStackLayer."""
 
+import gc
+import json
 import os
 import subprocess
 from unittest.mock import MagicMock, patch
@@ -7,6 +9,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from kstack_lib.config import ConfigMap, KStackLayer
+from kstack_lib.config.configmap import _ConfigMapWatcher
+
+
+def _event_lines(event_type: str, name: str, data: dict | None = None) -> list[str]:
+    """Render a watch event the way kubectl pretty-prints it."""
+    event = {"type": event_type, "object": {"metadata": {"name": name}, "data": data or {}}}
+    return json.dumps(event, indent=2).splitlines(keepends=True)
 
 
 class TestKStackLayer:
@@ -195,3 +204,230 @@ class TestConfigMap:
 
         assert cfg_layer3.layer.namespace == "layer-3-global-infra"
         assert cfg_layer2.layer.namespace == "layer-2-global-services"
+
+    @patch("subprocess.run")
+    def test_get_value_cached(self, mock_run):
+        """Test repeated get_value calls within the TTL hit kubectl once."""
+        cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA)
+
+        mock_run.return_value = MagicMock(stdout="development", returncode=0)
+
+        assert cfg.get_value("kstack-route", "active-route") == "development"
+        assert cfg.get_value("kstack-route", "active-route") == "development"
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_get_value_cache_expires(self, mock_run):
+        """Test get_value refetches once the TTL has elapsed."""
+        cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA, cache_ttl=0)
+
+        mock_run.return_value = MagicMock(stdout="development", returncode=0)
+
+        cfg.get_value("kstack-route", "active-route")
+        cfg.get_value("kstack-route", "active-route")
+        assert mock_run.call_count == 2
+
+    @patch("subprocess.run")
+    def test_invalidate(self, mock_run):
+        """Test invalidate forces the next get_value to refetch."""
+        cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA)
+
+        mock_run.return_value = MagicMock(stdout="development", returncode=0)
+        cfg.get_value("kstack-route", "active-route")
+
+        mock_run.return_value = MagicMock(stdout="testing", returncode=0)
+        cfg.invalidate("kstack-route")
+
+        assert cfg.get_value("kstack-route", "active-route") == "testing"
+        assert mock_run.call_count == 2
+
+    @patch("kstack_lib.config.configmap._ConfigMapWatcher.start")
+    @patch("subprocess.run")
+    def test_get_value_from_watch_store(self, mock_run, mock_start):
+        """Test watch-backed ConfigMap serves values without calling kubectl."""
+        cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA, watch=True)
+        cfg._watcher.apply_event(
+            {
+                "type": "ADDED",
+                "object": {"metadata": {"name": "kstack-route"}, "data": {"active-route": "testing"}},
+            }
+        )
+
+        assert cfg.get_value("kstack-route", "active-route") == "testing"
+        mock_start.assert_called_once()
+        mock_run.assert_not_called()
+
+    @patch("kstack_lib.config.configmap._ConfigMapWatcher.start")
+    @patch("subprocess.run")
+    def test_get_value_watch_cold_miss(self, mock_run, mock_start):
+        """Test watch-backed ConfigMap falls back to kubectl on a cold miss."""
+        cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA, watch=True)
+        cfg._watcher.apply_event({"type": "ADDED", "object": {"metadata": {"name": "kstack-route"}, "data": {}}})
+        cfg._watcher.apply_event({"type": "DELETED", "object": {"metadata": {"name": "kstack-route"}}})
+
+        mock_run.return_value = MagicMock(stdout="development", returncode=0)
+
+        assert cfg.get_value("kstack-route", "active-route") == "development"
+        mock_run.assert_called_once()
+
+    @patch("kstack_lib.config.configmap._ConfigMapWatcher.start")
+    @patch("subprocess.run")
+    def test_get_value_watch_and_kubectl_agree(self, mock_run, mock_start):
+        """Test the watch store and kubectl paths both return stripped values."""
+        cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA, watch=True)
+        cfg._watcher.apply_event(
+            {"type": "ADDED", "object": {"metadata": {"name": "kstack-route"}, "data": {"active-route": "testing\n"}}}
+        )
+        mock_run.return_value = MagicMock(stdout="testing\n", returncode=0)
+
+        assert cfg.get_value("kstack-route", "active-route") == "testing"
+        cfg.close()
+        assert cfg.get_value("kstack-route", "active-route") == "testing"
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_get_values_single_call(self, mock_run):
+        """Test get_values reads several ConfigMaps with one kubectl call."""
+        cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA)
+
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps(
+                {
+                    "kind": "List",
+                    "items": [
+                        {"metadata": {"name": "kstack-route"}, "data": {"active-route": "testing"}},
+                        {"metadata": {"name": "localstack-proxy-config"}, "data": {"active-instance": "dev"}},
+                    ],
+                }
+            ),
+            returncode=0,
+        )
+
+        values = cfg.get_values(["kstack-route", "localstack-proxy-config", "missing"])
+
+        assert values == {
+            "kstack-route": {"active-route": "testing"},
+            "localstack-proxy-config": {"active-instance": "dev"},
+            "missing": {},
+        }
+        call_args = mock_run.call_args[0][0]
+        assert "kstack-route" in call_args
+        assert "localstack-proxy-config" in call_args
+
+        # Individual reads are served from the cache populated above
+        assert cfg.get_value("localstack-proxy-config", "active-instance") == "dev"
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_get_values_caches_stripped_values(self, mock_run):
+        """Test values cached by get_values match what a single kubectl read returns."""
+        cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA)
+
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps(
+                {"metadata": {"name": "kstack-route"}, "data": {"active-route": "testing\n", "blank": " "}}
+            ),
+            returncode=0,
+        )
+        cfg.get_values(["kstack-route"])
+
+        assert cfg.get_value("kstack-route", "active-route") == "testing"
+        assert cfg.get_value("kstack-route", "blank") is None
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_get_values_single_object(self, mock_run):
+        """Test get_values handles kubectl returning a single object."""
+        cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA)
+
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps({"metadata": {"name": "kstack-route"}, "data": {"active-route": "staging"}}),
+            returncode=0,
+        )
+
+        assert cfg.get_values(["kstack-route"]) == {"kstack-route": {"active-route": "staging"}}
+
+    @patch("subprocess.run")
+    def test_get_values_kubectl_failure(self, mock_run):
+        """Test get_values returns empty data when kubectl fails."""
+        cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA)
+
+        mock_run.side_effect = subprocess.CalledProcessError(1, "kubectl")
+
+        assert cfg.get_values(["kstack-route"]) == {"kstack-route": {}}
+
+
+class TestConfigMapWatcher:
+    """Tests for the kubectl watch stream behind ConfigMap(watch=True)."""
+
+    def test_unparseable_event_skipped(self):
+        """Test a bad event is dropped and the following events still apply."""
+        watcher = _ConfigMapWatcher("layer-3-global-infra")
+        lines = ["{\n", '  "type": \n', "}\n", *_event_lines("ADDED", "kstack-route", {"active-route": "testing"})]
+
+        with patch("kstack_lib.config.configmap.LOGGER") as mock_logger:
+            assert watcher._consume(lines) is True
+
+        mock_logger.warning.assert_called_once()
+        assert watcher.get("kstack-route") == {"active-route": "testing"}
+
+    def test_reconnect_rebuilds_store(self):
+        """Test each (re)connect starts from the fresh list, dropping ConfigMaps deleted meanwhile."""
+        watcher = _ConfigMapWatcher("layer-3-global-infra")
+        watcher.store["deleted-while-disconnected"] = {"key": "value"}
+
+        proc = MagicMock()
+        proc.__enter__.return_value = proc
+        proc.stdout = iter(_event_lines("ADDED", "kstack-route", {"active-route": "testing"}))
+        proc.returncode = 0
+
+        with (
+            patch("kstack_lib.config.configmap.subprocess.Popen", return_value=proc),
+            patch.object(watcher._stopped, "wait", return_value=True),
+        ):
+            watcher._run()
+
+        assert watcher.store == {"kstack-route": {"active-route": "testing"}}
+
+    def test_stop_terminates_kubectl(self):
+        """Test stop() terminates the running kubectl child and prevents restarts."""
+        watcher = _ConfigMapWatcher("layer-3-global-infra")
+        proc = MagicMock()
+        proc.poll.return_value = None
+        watcher._proc = proc
+
+        watcher.stop()
+        watcher.start()
+
+        proc.terminate.assert_called_once()
+        assert watcher._thread is None
+
+    def test_missing_kubectl_stops_retrying(self):
+        """Test the watch gives up (without backoff retries) when kubectl isn't installed."""
+        watcher = _ConfigMapWatcher("layer-3-global-infra")
+
+        with (
+            patch("kstack_lib.config.configmap.subprocess.Popen", side_effect=FileNotFoundError("kubectl")) as popen,
+            patch.object(watcher._stopped, "wait") as mock_wait,
+        ):
+            watcher._run()
+
+        popen.assert_called_once()
+        mock_wait.assert_not_called()
+
+    def test_dropped_configmap_stops_watcher(self):
+        """Test garbage-collecting a watch-backed ConfigMap stops its watcher."""
+        with patch.object(_ConfigMapWatcher, "stop") as mock_stop:
+            cfg = ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA, watch=True)
+            del cfg
+            gc.collect()
+
+        mock_stop.assert_called_once()
+
+    def test_context_manager_closes_watcher(self):
+        """Test leaving the with block stops the watcher."""
+        with ConfigMap(layer=KStackLayer.LAYER_3_GLOBAL_INFRA, watch=True) as cfg:
+            watcher = cfg._watcher
+
+        assert watcher._stopped.is_set()
+        assert cfg._watcher is None
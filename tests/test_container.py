@@ -187,3 +187,21 @@ class TestSingletonBehavior:
 
             # Should be the same instance
             assert provider1 is provider2
+
+
+class TestContextSelector:
+    """Test the cached context selector."""
+
+    def test_context_selector_cached(self):
+        """Test is_in_cluster() is consulted once and the result reused."""
+        from kstack_lib.any.container import _context_selector
+
+        _context_selector.cache_clear()
+        try:
+            with patch("kstack_lib.any.container.is_in_cluster", return_value=False) as mock_in_cluster:
+                assert _context_selector() == "local"
+                assert _context_selector() == "local"
+
+            mock_in_cluster.assert_called_once()
+        finally:
+            _context_selector.cache_clear()
@@ -152,3 +152,40 @@ class TestLocalEnvironmentDetector:
 
         with pytest.raises(KStackConfigurationError, match="Vault root not found"):
             detector.get_vault_root()
+
+    @patch("kstack_lib.local.config.environment.Path")
+    def test_get_environment_cached(self, mock_path_cls):
+        """Test .kstack.yaml is located and parsed only once per detector."""
+        mock_yaml_file = MagicMock()
+        mock_yaml_file.exists.return_value = True
+
+        mock_cwd = MagicMock()
+        mock_cwd.__truediv__ = lambda self, other: mock_yaml_file if other == ".kstack.yaml" else MagicMock()
+
+        mock_path_cls.cwd.return_value = mock_cwd
+
+        detector = LocalEnvironmentDetector()
+
+        with patch("builtins.open", mock_open(read_data="environment: dev\n")) as mocked_open:
+            assert detector.get_environment() == "dev"
+            assert detector.get_environment() == "dev"
+            mocked_open.assert_called_once()
+
+        mock_yaml_file.exists.assert_called_once()
+
+    @patch("kstack_lib.local.config.environment.Path")
+    def test_get_roots_cached(self, mock_path_cls):
+        """Test config and vault roots are resolved only once per detector."""
+        mock_dir = MagicMock()
+        mock_dir.exists.return_value = True
+
+        mock_cwd = MagicMock()
+        mock_cwd.__truediv__ = lambda self, other: mock_dir
+
+        mock_path_cls.cwd.return_value = mock_cwd
+
+        detector = LocalEnvironmentDetector()
+
+        assert detector.get_config_root() is detector.get_config_root()
+        assert detector.get_vault_root() is detector.get_vault_root()
+        assert mock_dir.exists.call_count == 2
@@ -0,0 +1,56 @@
+"""Tests for the top-level kstack_lib package exports."""
+
+import pytest
+
+import kstack_lib
+
+
+class TestPackageExports:
+    """Test kstack_lib.__all__ and lazy exports."""
+
+    def test_all_names_resolve(self):
+        """Test every name in __all__ can be accessed."""
+        for name in kstack_lib.__all__:
+            assert getattr(kstack_lib, name) is not None
+
+    def test_lazy_export_resolves_to_source(self):
+        """Test lazily exported run_command is the utils implementation."""
+        from kstack_lib.any.utils import run_command
+
+        assert kstack_lib.run_command is run_command
+
+    def test_dir_lists_lazy_exports(self):
+        """Test dir() includes names that are not imported yet."""
+        assert "run_command" in dir(kstack_lib)
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            kstack_lib.does_not_exist  # noqa: B018
+
+
+class TestConfigExports:
+    """Test kstack_lib.config lazy exports."""
+
+    def test_all_names_resolve(self):
+        """Test every name in kstack_lib.config.__all__ can be accessed."""
+        import kstack_lib.config
+
+        for name in kstack_lib.config.__all__:
+            assert getattr(kstack_lib.config, name) is not None
+
+    def test_types_import_skips_config_modules(self, assert_import_skips):
+        """Test importing a layer type doesn't load the ConfigMap, schemas or loaders."""
+        assert_import_skips(
+            "from kstack_lib.config import KStackLayer",
+            "kstack_lib.config.configmap",
+            "kstack_lib.config.schemas",
+            "kstack_lib.config.loaders",
+        )
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        import kstack_lib.config
+
+        with pytest.raises(AttributeError):
+            kstack_lib.config.does_not_exist  # noqa: B018
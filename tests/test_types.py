@@ -100,6 +100,14 @@ class TestKStackLayerFromString:
         assert KStackLayer.from_namespace("layer-2-global-services") == KStackLayer.LAYER_2_GLOBAL_SERVICES
         assert KStackLayer.from_namespace("layer-3-global-infra") == KStackLayer.LAYER_3_GLOBAL_INFRA
 
+    def test_namespaces_interned(self):
+        """Test namespace strings are interned (identity-comparable)."""
+        import sys
+
+        for layer in KStackLayer:
+            assert layer.namespace is sys.intern(layer.namespace)
+            assert layer.display_name is sys.intern(layer.display_name)
+
     def test_from_string_uppercase(self):
         """Test from_string is case-insensitive."""
         assert KStackLayer.from_string("LAYER0") == KStackLayer.LAYER_0_APPLICATIONS
@@ -138,3 +146,22 @@ class TestLayerChoice:
         choices = list(LayerChoice)
         assert len(choices) == 5
         assert LayerChoice.ALL in choices
+
+
+class TestTypesExports:
+    """Tests for the lazily resolved type re-exports."""
+
+    def test_compat_module_matches_any_types(self):
+        """Test kstack_lib.types re-exports the kstack_lib.any.types classes."""
+        import kstack_lib.any.types as any_types
+        import kstack_lib.types as types
+
+        for name in types.__all__:
+            assert getattr(types, name) is getattr(any_types, name)
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        import kstack_lib.any.types as any_types
+
+        with pytest.raises(AttributeError):
+            any_types.DoesNotExist  # noqa: B018